@@ -0,0 +1,5 @@
+"""
+Addons for AudioControl3
+
+Plugin modules are imported by the plugin system when they are needed.
+"""
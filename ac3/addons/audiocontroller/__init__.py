@@ -0,0 +1,3 @@
+"""
+Plugins extending the AudioController
+"""
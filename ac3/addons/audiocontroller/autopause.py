@@ -6,35 +6,37 @@ It's useful to avoid having multiple audio sources playing simultaneously.
 """
 
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Set
 from ac3.addons.plugin import Plugin
 from ac3.player.player_controller import PlayerState
 
 logger = logging.getLogger("ac3.plugins.autopause")
 
+_PLAYING = PlayerState.PLAYING.value
+
 class AutoPausePlugin(Plugin):
     """
     Plugin that automatically pauses other players when a player starts playing
     """
     
+    __slots__ = ('_playing', '_playing_lock', '_exec')
+    
+    name = "AutoPause"
+    description = "Automatically pauses other players when a player starts playing"
+    version = "1.0.0"
+    
     def __init__(self):
         """Initialize the AutoPause plugin"""
         super().__init__()
         self._enabled = False
-    
-    @property
-    def name(self) -> str:
-        """Get the name of the plugin"""
-        return "AutoPause"
-    
-    @property
-    def description(self) -> str:
-        """Get a description of the plugin"""
-        return "Automatically pauses other players when a player starts playing"
-    
-    @property
-    def version(self) -> str:
-        """Get the version of the plugin"""
-        return "1.0.0"
+        # IDs of players last reported as playing, kept up to date from
+        # state change events so pausing doesn't need to query every player
+        self._playing: Set[str] = set()
+        self._playing_lock = threading.Lock()
+        # Pauses are dispatched here so slow backends don't delay each other
+        self._exec: Optional[ThreadPoolExecutor] = None
     
     def _enable_plugin(self) -> bool:
         """Enable the plugin"""
@@ -42,6 +44,9 @@ class AutoPausePlugin(Plugin):
             logger.warning("Cannot enable AutoPause plugin: no audio controller")
             return False
             
+        if self._exec is None:
+            self._exec = ThreadPoolExecutor(max_workers=4, thread_name_prefix="autopause")
+            
         # Register to receive player state change events
         self._audio_controller.add_listener('player_state_change', self._on_player_state_change)
         logger.info("AutoPause plugin enabled")
@@ -54,6 +59,11 @@ class AutoPausePlugin(Plugin):
             
         # Unregister from player state change events
         self._audio_controller.remove_listener('player_state_change', self._on_player_state_change)
+        
+        if self._exec is not None:
+            self._exec.shutdown(wait=False)
+            self._exec = None
+            
         logger.info("AutoPause plugin disabled")
         return True
     
@@ -61,41 +71,110 @@ class AutoPausePlugin(Plugin):
         """
         Handle player state changes
         
+        The work is done on the plugin's worker thread.
+        
+        Args:
+            player: The player that changed state
+        """
+        self._defer(self._handle_player_state_change, player)
+    
+    def _handle_player_state_change(self, player) -> None:
+        """
+        Process a player state change
+        
         When a player starts playing, pause all other players.
         
         Args:
             player: The player that changed state
         """
+        player_id = player.player_id
+        is_playing = player.state == _PLAYING
+        
+        # Track which players are currently playing
+        with self._playing_lock:
+            if is_playing:
+                self._playing.add(player_id)
+            else:
+                self._playing.discard(player_id)
+                
         # Only handle PLAYING state changes
-        if player.state != PlayerState.PLAYING:
+        if not is_playing:
             return
             
         # Don't do anything if this is the active player
-        if self._audio_controller.active_controller_id == player.player_id:
+        if self._audio_controller.active_controller_id == player_id:
             return
             
-        logger.info(f"Player {player.player_id} started playing, pausing other players")
+        logger.info("Player %s started playing, pausing other players", player_id)
         
         # Set this player as active
-        self._audio_controller.set_active_controller(player.player_id)
+        self._audio_controller.set_active_controller(player_id)
         
         # Pause all other players
-        self._pause_other_players(player.player_id)
+        self._pause_other_players(player_id)
     
     def _pause_other_players(self, active_player_id: str) -> None:
         """
         Pause all players except the specified one
         
+        Only players known to be playing from previous state change events
+        are paused, so idle players are never queried. The pause calls are
+        submitted to a thread pool and not waited for, so the total latency
+        is that of the slowest backend rather than the sum of all of them.
+        
         Args:
             active_player_id: ID of the player to keep playing
         """
-        for player_id, controller in self._audio_controller._controllers.items():
-            if player_id != active_player_id:
+        with self._playing_lock:
+            others = [pid for pid in self._playing if pid != active_player_id]
+            
+        executor = self._exec
+        for player_id in others:
+            controller = self._audio_controller.get_controller(player_id)
+            if controller is None:
+                # Player has been unregistered in the meantime
+                with self._playing_lock:
+                    self._playing.discard(player_id)
+                continue
+                
+            logger.info("Pausing player %s", player_id)
+            if executor is None:
+                # Plugin is being disabled, pause inline
                 try:
-                    # Check if the player is currently playing
-                    player_info = controller.get_player_info()
-                    if player_info and player_info.state == PlayerState.PLAYING:
-                        logger.info(f"Pausing player {player_id}")
-                        controller.pause()
+                    self._pause_player(player_id, controller)
                 except Exception as e:
-                    logger.error(f"Error pausing player {player_id}: {e}")
\ No newline at end of file
+                    logger.error(f"Error pausing player {player_id}: {e}")
+                continue
+                
+            try:
+                future = executor.submit(self._pause_player, player_id, controller)
+            except RuntimeError:
+                # Executor was shut down concurrently
+                continue
+            future.add_done_callback(
+                lambda f, player_id=player_id: self._log_pause_error(player_id, f))
+    
+    def _pause_player(self, player_id: str, controller) -> None:
+        """
+        Pause a single player and stop tracking it as playing on success
+        
+        Args:
+            player_id: ID of the player
+            controller: The player's controller
+        """
+        if controller.pause():
+            with self._playing_lock:
+                self._playing.discard(player_id)
+    
+    @staticmethod
+    def _log_pause_error(player_id: str, future: Future) -> None:
+        """
+        Log the exception of a failed pause call, if any
+        
+        Args:
+            player_id: ID of the player that was paused
+            future: The completed pause call
+        """
+        e = future.exception()
+        if e is not None:
+            logger.error(f"Error pausing player {player_id}: {e}")
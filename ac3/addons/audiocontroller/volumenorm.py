@@ -6,17 +6,37 @@ volume levels across different tracks.
 """
 
 import logging
-from typing import Dict, Any, Optional
+import math
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 from ac3.addons.plugin import Plugin
 from ac3.metadata import Song
 
 logger = logging.getLogger("ac3.plugins.volumenorm")
 
+# Number with an optional "dB"/"LUFS" unit suffix, e.g. "-6.5 dB" or "-14 LUFS"
+_LEVEL_RE = re.compile(r'\s*([-+]?(?:\d+(?:\.\d*)?|\.\d+))\s*(?:dB|LUFS)?\s*', re.IGNORECASE)
+
+# Approximate mapping of a level difference in dB to volume percentage points
+_PCT_PER_DB = 2.5
+
+# Genre keywords of music that is usually mastered quieter/louder
+_BOOST_GENRES = ("classical",)
+_CUT_GENRES = ("metal", "rock")
+
 class VolumeNormalizationPlugin(Plugin):
     """
     Plugin that adjusts volume based on track metadata for consistent listening experience
     """
     
+    __slots__ = ('_config', '_config_view', '_cfg_tuple', '_last_applied')
+    
+    name = "VolumeNormalization"
+    description = "Automatically adjusts volume based on track metadata for consistent volume levels"
+    version = "1.0.0"
+    
     def __init__(self):
         """Initialize the VolumeNormalization plugin"""
         super().__init__()
@@ -26,21 +46,27 @@ class VolumeNormalizationPlugin(Plugin):
             "max_adjustment": 10,    # Maximum volume adjustment in either direction
             "default_level": -18.0   # Default level for tracks without metadata
         }
+        self._config_view = MappingProxyType(self._config)
+        # Song and adjustment of the last volume change, to ignore repeated
+        # song_change events for the same song
+        self._last_applied: Optional[Tuple] = None
+        self._update_cfg_tuple()
     
-    @property
-    def name(self) -> str:
-        """Get the name of the plugin"""
-        return "VolumeNormalization"
-    
-    @property
-    def description(self) -> str:
-        """Get a description of the plugin"""
-        return "Automatically adjusts volume based on track metadata for consistent volume levels"
-    
-    @property
-    def version(self) -> str:
-        """Get the version of the plugin"""
-        return "1.0.0"
+    def _update_cfg_tuple(self) -> None:
+        """
+        Snapshot the configuration values used on every song change
+        
+        The tuple holds (target_level, max_adjustment, default_level, enabled)
+        so the event handlers need a single attribute read instead of several
+        dict lookups.
+        """
+        config = self._config
+        self._cfg_tuple = (
+            config["target_level"],
+            config["max_adjustment"],
+            config["default_level"],
+            config["enabled"]
+        )
     
     def _enable_plugin(self) -> bool:
         """Enable the plugin"""
@@ -63,14 +89,15 @@ class VolumeNormalizationPlugin(Plugin):
         logger.info("VolumeNormalization plugin disabled")
         return True
     
-    def get_config(self) -> Dict[str, Any]:
+    def get_config(self) -> Mapping[str, Any]:
         """
         Get the plugin's configuration
         
         Returns:
-            Dictionary of configuration options
+            Read-only live view of the configuration options; copy it to get
+            a modifiable dictionary
         """
-        return self._config.copy()
+        return self._config_view
     
     def set_config(self, config: Dict[str, Any]) -> bool:
         """
@@ -96,28 +123,57 @@ class VolumeNormalizationPlugin(Plugin):
             if "enabled" in config:
                 self._config["enabled"] = bool(config["enabled"])
                 
-            logger.info(f"VolumeNormalization configuration updated: {self._config}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("VolumeNormalization configuration updated: %s", self._config)
             return True
         
         except (ValueError, TypeError) as e:
             logger.error(f"Invalid configuration value: {e}")
             return False
+        
+        finally:
+            # Values may have been (partially) updated, refresh derived state;
+            # cached adjustments were computed with the old levels
+            self._update_cfg_tuple()
+            _compute_adjustment.cache_clear()
+            self._last_applied = None
     
     def _on_song_change(self, song: Optional[Song]) -> None:
         """
         Handle song changes
         
-        Adjusts the volume based on the song's ReplayGain or LUFS metadata.
+        The volume is adjusted on the plugin's worker thread.
+        
+        Args:
+            song: The new song, or None if playback stopped
+        """
+        if self._cfg_tuple[3]:
+            self._defer(self._handle_song_change, song)
+    
+    def _handle_song_change(self, song: Optional[Song]) -> None:
+        """
+        Adjust the volume based on the song's ReplayGain or LUFS metadata
         
         Args:
             song: The new song, or None if playback stopped
         """
-        if not song or not self._config["enabled"]:
+        if song is None:
+            # Playing the previous song again is a new song change
+            self._last_applied = None
             return
             
         # Calculate adjustment based on metadata
         adjustment = self._calculate_volume_adjustment(song)
+            
+        # Backends often report the same song several times (e.g. batched
+        # property change signals), and each of them creates a new Song
+        # object, so compare the identifying fields
+        key = (song.stream_url, song.title, song.artist, song.album, adjustment)
+        if key == self._last_applied:
+            return  # Already adjusted for this song
+            
         if adjustment == 0:
+            self._last_applied = key
             return  # No adjustment needed
             
         # Get current volume
@@ -131,8 +187,11 @@ class VolumeNormalizationPlugin(Plugin):
         
         # Apply new volume if it's different from current
         if new_volume != current_volume:
-            logger.info(f"Adjusting volume from {current_volume} to {new_volume} for song: {song.title}")
-            self._audio_controller.set_volume(new_volume)
+            logger.info("Adjusting volume from %s to %s for song: %s", current_volume, new_volume, song.title)
+            if not self._audio_controller.set_volume(new_volume):
+                return
+                
+        self._last_applied = key
     
     def _calculate_volume_adjustment(self, song: Song) -> int:
         """
@@ -144,93 +203,132 @@ class VolumeNormalizationPlugin(Plugin):
         Returns:
             Volume adjustment in percentage points (-100 to 100)
         """
-        # Get target level from config
-        target_level = self._config["target_level"]
-        max_adjustment = self._config["max_adjustment"]
-        default_level = self._config["default_level"]
+        target_level, max_adjustment, _, _ = self._cfg_tuple
         
         # Try to get volume normalization info from metadata
         metadata = song.metadata if song.metadata else {}
         
-        # Check for ReplayGain
-        track_gain = metadata.get("replaygain_track_gain")
-        if track_gain is not None:
-            try:
-                # ReplayGain is in dB, parse it
-                if isinstance(track_gain, str):
-                    # Strip "dB" suffix if present
-                    track_gain = track_gain.replace("dB", "").strip()
-                    gain_db = float(track_gain)
-                else:
-                    gain_db = float(track_gain)
-                    
-                # Calculate adjustment (-6dB ~= half volume, +6dB ~= double volume)
-                # Adjust to target level
-                level_diff = target_level - (-18.0 + gain_db)  # ReplayGain reference is -18 LUFS
-                # Convert to percentage points (approximate mapping)
-                adjustment = int(level_diff * 2.5)  # ~2.5% per dB
-                
-                logger.debug(f"ReplayGain: {gain_db}dB, adjustment: {adjustment}%")
-                return max(-max_adjustment, min(max_adjustment, adjustment))
-            except (ValueError, TypeError):
-                logger.warning(f"Invalid ReplayGain value: {track_gain}")
-        
-        # Check for LUFS/integrated loudness
-        loudness = metadata.get("LUFS") or metadata.get("integrated_loudness")
-        if loudness is not None:
-            try:
-                if isinstance(loudness, str):
-                    # Strip "LUFS" suffix if present
-                    loudness = loudness.replace("LUFS", "").strip()
-                    lufs = float(loudness)
-                else:
-                    lufs = float(loudness)
-                    
-                # Calculate adjustment
-                level_diff = target_level - lufs
-                # Convert to percentage points (approximate mapping)
-                adjustment = int(level_diff * 2.5)  # ~2.5% per dB
-                
-                logger.debug(f"LUFS: {lufs}, adjustment: {adjustment}%")
-                return max(-max_adjustment, min(max_adjustment, adjustment))
-            except (ValueError, TypeError):
-                logger.warning(f"Invalid loudness value: {loudness}")
-        
-        # Check for album peak
-        peak = metadata.get("replaygain_track_peak") or metadata.get("replaygain_album_peak")
-        if peak is not None:
-            try:
-                if isinstance(peak, str):
-                    peak_value = float(peak)
-                else:
-                    peak_value = float(peak)
-                    
-                # If peak is very high, reduce volume to avoid clipping
-                if peak_value > 1.0:
-                    # Calculate dB over 0
-                    db_over = 20 * (peak_value / 1.0)
-                    # Convert to percentage points
-                    adjustment = -int(db_over * 2.5)
-                    
-                    logger.debug(f"Peak adjustment: {adjustment}%")
-                    return max(-max_adjustment, min(max_adjustment, adjustment))
-            except (ValueError, TypeError):
-                logger.warning(f"Invalid peak value: {peak}")
-        
-        # If song has specific artists/genres that typically need adjustments
-        # This is just an example of using other metadata
-        artist = song.artist.lower() if song.artist else ""
-        genre = song.genre.lower() if song.genre else ""
-        
-        # Example: Classical music is often quieter than other genres
-        if "classical" in genre:
-            logger.debug("Classical genre detected, increasing volume")
-            return 5  # +5% volume for classical
+        args = (
+            metadata.get("replaygain_track_gain"),
+            metadata.get("LUFS") or metadata.get("integrated_loudness"),
+            metadata.get("replaygain_track_peak") or metadata.get("replaygain_album_peak"),
+            song.genre or "",
+            target_level,
+            max_adjustment
+        )
+        
+        try:
+            return _compute_adjustment(*args)
+        except TypeError:
+            # Unhashable metadata values (e.g. multi-valued tags) can't be cached
+            return _compute_adjustment.__wrapped__(*args)
+
+
+def _db_to_pct(db: float) -> int:
+    """Convert a level difference in dB to volume percentage points"""
+    return int(db * _PCT_PER_DB)
+
+
+def _clamp(value: int, low: int, high: int) -> int:
+    """Limit value to the range [low, high]"""
+    return low if value < low else (high if value > high else value)
+
+
+def _parse_level(value: Any) -> Optional[float]:
+    """
+    Parse a loudness/gain metadata value
+    
+    Args:
+        value: Numeric value or string with an optional "dB"/"LUFS" suffix
+        
+    Returns:
+        The value as float, or None if it is missing or can't be parsed
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        match = _LEVEL_RE.fullmatch(value)
+        if match:
+            return float(match.group(1))
+    return None
+
+
+@lru_cache(maxsize=512)
+def _compute_adjustment(track_gain, loudness, peak, genre: str,
+                        target_level: float, max_adjustment: int) -> int:
+    """
+    Calculate volume adjustment from the relevant song metadata values
+    
+    This is a pure function of its arguments, so results are cached; songs
+    that fire repeated song_change events only pay for the parsing once.
+    
+    Args:
+        track_gain: ReplayGain track gain (number or string like "-6.5 dB")
+        loudness: Integrated loudness (number or string like "-14 LUFS")
+        peak: ReplayGain track or album peak
+        genre: Genre, empty if unknown
+        target_level: Target LUFS level
+        max_adjustment: Maximum volume adjustment in either direction
+        
+    Returns:
+        Volume adjustment in percentage points (-100 to 100)
+    """
+    # Check for ReplayGain
+    gain_db = _parse_level(track_gain)
+    if gain_db is not None:
+        # Calculate adjustment (-6dB ~= half volume, +6dB ~= double volume)
+        # Adjust to target level
+        level_diff = target_level - (-18.0 + gain_db)  # ReplayGain reference is -18 LUFS
+        # Convert to percentage points (approximate mapping)
+        adjustment = _db_to_pct(level_diff)
+        
+        logger.debug("ReplayGain: %sdB, adjustment: %s%%", gain_db, adjustment)
+        return _clamp(adjustment, -max_adjustment, max_adjustment)
+    elif track_gain is not None:
+        logger.warning("Invalid ReplayGain value: %s", track_gain)
+    
+    # Check for LUFS/integrated loudness
+    lufs = _parse_level(loudness)
+    if lufs is not None:
+        # Calculate adjustment
+        level_diff = target_level - lufs
+        # Convert to percentage points (approximate mapping)
+        adjustment = _db_to_pct(level_diff)
+        
+        logger.debug("LUFS: %s, adjustment: %s%%", lufs, adjustment)
+        return _clamp(adjustment, -max_adjustment, max_adjustment)
+    elif loudness is not None:
+        logger.warning("Invalid loudness value: %s", loudness)
+    
+    # Check for album peak
+    peak_value = _parse_level(peak)
+    if peak_value is not None:
+        # If peak is very high, reduce volume to avoid clipping
+        if peak_value > 1.0:
+            # Calculate dB over full scale (peak is a linear amplitude ratio)
+            db_over = 20.0 * math.log10(peak_value)
+            # Convert to percentage points
+            adjustment = -_db_to_pct(db_over)
             
-        # Example: Some genres may be mastered louder
-        if "metal" in genre or "rock" in genre:
-            logger.debug("Rock/metal genre detected, decreasing volume")
-            return -3  # -3% volume for rock/metal
+            logger.debug("Peak adjustment: %s%%", adjustment)
+            return _clamp(adjustment, -max_adjustment, max_adjustment)
+    elif peak is not None:
+        logger.warning("Invalid peak value: %s", peak)
+    
+    # If song has specific artists/genres that typically need adjustments
+    # This is just an example of using other metadata
+    # Example: Classical music is often quieter than other genres
+    genre = genre.lower()
+    if any(keyword in genre for keyword in _BOOST_GENRES):
+        logger.debug("Classical genre detected, increasing volume")
+        return 5  # +5% volume for classical
         
-        # No adjustment needed
-        return 0
\ No newline at end of file
+    # Example: Some genres may be mastered louder
+    if any(keyword in genre for keyword in _CUT_GENRES):
+        logger.debug("Rock/metal genre detected, decreasing volume")
+        return -3  # -3% volume for rock/metal
+    
+    # No adjustment needed
+    return 0
\ No newline at end of file
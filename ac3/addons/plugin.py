@@ -5,13 +5,18 @@ This module provides base classes and utilities for creating plugins that can ex
 the functionality of the AudioController.
 """
 
+import hashlib
 import importlib
+import importlib.util
 import inspect
+import json
 import logging
 import os
 import pkgutil
+import queue
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Set, Type
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set, Type
 
 logger = logging.getLogger("ac3.plugins")
 
@@ -21,12 +26,33 @@ class Plugin(ABC):
     
     Plugins can subscribe to events from the AudioController and provide additional 
     functionality without modifying the core code.
+    
+    Constant metadata such as name, description and version can be declared
+    as plain class attributes in subclasses.
+    
+    Event handlers should hand their work to _defer() so it runs on the
+    plugin's own worker thread instead of the thread dispatching the event.
     """
     
+    __slots__ = ('_audio_controller', '_enabled', '_event_queue')
+    
+    # Version of the plugin
+    version: str = "1.0.0"
+    
+    # All concrete plugin classes, registered when they are defined
+    _registry: Dict[str, Type["Plugin"]] = {}
+    
+    def __init_subclass__(cls, **kwargs):
+        """Register concrete plugin classes by their plugin ID"""
+        super().__init_subclass__(**kwargs)
+        if not inspect.isabstract(cls):
+            Plugin._registry[_plugin_id(cls)] = cls
+    
     def __init__(self):
         """Initialize the plugin"""
         self._audio_controller = None
         self._enabled = False
+        self._event_queue: Optional[queue.SimpleQueue] = None
         
     @property
     def name(self) -> str:
@@ -50,16 +76,6 @@ class Plugin(ABC):
         # Default to the docstring, but subclasses can override
         return self.__doc__ or "No description available"
     
-    @property
-    def version(self) -> str:
-        """
-        Get the version of the plugin
-        
-        Returns:
-            The version of the plugin
-        """
-        return "1.0.0"  # Default version
-    
     @property
     def enabled(self) -> bool:
         """
@@ -80,15 +96,18 @@ class Plugin(ABC):
         if self._enabled:
             return True  # Already enabled
             
+        self._start_event_worker()
         try:
             self._enabled = self._enable_plugin()
             if self._enabled:
                 logger.info(f"Plugin {self.name} enabled")
             else:
                 logger.warning(f"Failed to enable plugin {self.name}")
+                self._stop_event_worker()
             return self._enabled
         except Exception as e:
             logger.error(f"Error enabling plugin {self.name}: {e}")
+            self._stop_event_worker()
             return False
     
     def disable(self) -> bool:
@@ -104,6 +123,7 @@ class Plugin(ABC):
         try:
             self._enabled = not self._disable_plugin()
             if not self._enabled:
+                self._stop_event_worker()
                 logger.info(f"Plugin {self.name} disabled")
             else:
                 logger.warning(f"Failed to disable plugin {self.name}")
@@ -112,6 +132,52 @@ class Plugin(ABC):
             logger.error(f"Error disabling plugin {self.name}: {e}")
             return False
     
+    def _defer(self, handler: Callable[..., None], *args: Any) -> None:
+        """
+        Run an event handler on the plugin's worker thread
+        
+        Args:
+            handler: The function to call
+            *args: Arguments for the handler
+        """
+        event_queue = self._event_queue
+        if event_queue is None:
+            return  # Plugin is not enabled
+        event_queue.put_nowait((handler, args))
+    
+    def _start_event_worker(self) -> None:
+        """Start the worker thread processing deferred event handlers"""
+        if self._event_queue is not None:
+            return
+        self._event_queue = queue.SimpleQueue()
+        thread = threading.Thread(target=self._event_worker, args=(self._event_queue,),
+                                  name=f"plugin-{self.name}", daemon=True)
+        thread.start()
+    
+    def _stop_event_worker(self) -> None:
+        """Let the worker thread finish the queued handlers and exit"""
+        event_queue = self._event_queue
+        if event_queue is not None:
+            self._event_queue = None
+            event_queue.put_nowait(None)
+    
+    def _event_worker(self, event_queue: queue.SimpleQueue) -> None:
+        """
+        Process deferred event handlers until the stop marker is received
+        
+        Args:
+            event_queue: The queue to read handlers from
+        """
+        while True:
+            item = event_queue.get()
+            if item is None:
+                break
+            handler, args = item
+            try:
+                handler(*args)
+            except Exception as e:
+                logger.error(f"Error in event handler of plugin {self.name}: {e}")
+    
     def set_audio_controller(self, audio_controller: Any) -> None:
         """
         Set the audio controller for this plugin
@@ -178,11 +244,274 @@ class Plugin(ABC):
         pass
 
 
+def _plugin_id(plugin_class: Type[Plugin]) -> str:
+    """
+    Get the ID a plugin class is registered under
+    
+    Args:
+        plugin_class: The plugin class
+        
+    Returns:
+        The class-level name attribute if the plugin declares one,
+        otherwise the class name
+    """
+    plugin_id = getattr(plugin_class, 'name', plugin_class.__name__)
+    # Plugins without a class attribute only have the base class property
+    return plugin_id if isinstance(plugin_id, str) else plugin_class.__name__
+
+
+def _registered_plugins(package: str) -> List[Type[Plugin]]:
+    """
+    Get the registered plugin classes defined in a package or its subpackages
+    
+    Args:
+        package: The package path
+        
+    Returns:
+        List of plugin classes
+    """
+    prefix = package + '.'
+    return [cls for cls in Plugin._registry.values()
+            if cls.__module__ == package or cls.__module__.startswith(prefix)]
+
+
+def _import_submodules(pkg: Any) -> None:
+    """
+    Import all modules of a package and its subpackages
+    
+    Args:
+        pkg: The imported package
+    """
+    for _, name, _ in pkgutil.walk_packages(pkg.__path__, pkg.__name__ + '.',
+                                            onerror=lambda name: logger.error(f"Error loading package {name}")):
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            logger.error(f"Error loading module {name}: {e}")
+
+
+def _manifest_file() -> str:
+    """
+    Get the path of the file that caches discovered plugins between runs
+    
+    Returns:
+        Path below $XDG_CACHE_HOME (default ~/.cache)
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "ac3", "plugins.json")
+
+
+def _package_fingerprint(package: str) -> Optional[str]:
+    """
+    Compute a fingerprint of the source files of a package
+    
+    The package itself is not imported. Any added, removed or modified
+    module changes the fingerprint.
+    
+    Args:
+        package: The package path
+        
+    Returns:
+        Hex digest over file names, sizes and modification times, or None
+        if the package can't be located
+    """
+    try:
+        spec = importlib.util.find_spec(package)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.submodule_search_locations:
+        return None
+        
+    digest = hashlib.blake2b(digest_size=16)
+    directories = sorted(spec.submodule_search_locations, reverse=True)
+    while directories:
+        directory = directories.pop()
+        try:
+            entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+            for entry in entries:
+                if entry.is_dir():
+                    if entry.name != "__pycache__":
+                        directories.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    stat = entry.stat()
+                    digest.update(f"{entry.path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+        except OSError:
+            return None
+    return digest.hexdigest()
+
+
+def _load_manifest() -> Dict[str, Any]:
+    """
+    Read the plugin manifest
+    
+    Returns:
+        Dictionary mapping package paths to their fingerprint and plugins,
+        empty if there is no usable manifest
+    """
+    try:
+        with open(_manifest_file(), encoding="utf-8") as f:
+            manifest = json.load(f)
+        return manifest if isinstance(manifest, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _manifest_entry(plugin_class: Type[Plugin]) -> Dict[str, Any]:
+    """
+    Describe where a plugin class can be imported from
+    
+    Args:
+        plugin_class: The plugin class
+        
+    Returns:
+        Dictionary with the plugin ID, module, class name and metadata
+    """
+    return {
+        "plugin_id": _plugin_id(plugin_class),
+        "module": plugin_class.__module__,
+        "class": plugin_class.__qualname__,
+        "metadata": {key: value for key, value in ((key, getattr(plugin_class, key, None))
+                                                   for key in ("description", "version"))
+                     if isinstance(value, str)}
+    }
+
+
+def _import_plugin_class(entry: Mapping[str, Any]) -> Type[Plugin]:
+    """
+    Import the plugin class described by a manifest entry
+    
+    Args:
+        entry: Dictionary as returned by _manifest_entry()
+        
+    Returns:
+        The plugin class
+        
+    Raises:
+        ImportError: If the module can't be imported
+        AttributeError: If the module doesn't define the class
+        TypeError: If the class is not a plugin
+    """
+    plugin_class = getattr(importlib.import_module(entry["module"]), entry["class"])
+    if not (inspect.isclass(plugin_class) and issubclass(plugin_class, Plugin)):
+        raise TypeError(f"{entry['module']}.{entry['class']} is not a plugin class")
+    return plugin_class
+
+
+def _save_manifest(package: str, fingerprint: str, plugin_classes: List[Type[Plugin]]) -> None:
+    """
+    Store the plugins discovered in a package in the plugin manifest
+    
+    Args:
+        package: The package path
+        fingerprint: Fingerprint of the package's source files
+        plugin_classes: The discovered plugin classes
+    """
+    manifest = _load_manifest()
+    manifest[package] = {
+        "fingerprint": fingerprint,
+        "plugins": [_manifest_entry(plugin_class) for plugin_class in plugin_classes]
+    }
+    
+    path = _manifest_file()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Replace the file at once so concurrent readers never see a partial manifest
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug(f"Could not write plugin manifest {path}: {e}")
+
+
+def _manifest_entries(package: str, fingerprint: Optional[str]) -> Optional[List[Dict[str, Any]]]:
+    """
+    Get the plugins of a package recorded in the plugin manifest
+    
+    Nothing is imported.
+    
+    Args:
+        package: The package path
+        fingerprint: Current fingerprint of the package's source files
+        
+    Returns:
+        List of entries as returned by _manifest_entry(), or None if the
+        manifest is missing or out of date
+    """
+    if fingerprint is None:
+        return None
+    entry = _load_manifest().get(package)
+    if not isinstance(entry, dict) or entry.get("fingerprint") != fingerprint:
+        return None
+    plugins = entry.get("plugins")
+    if not isinstance(plugins, list) or not all(
+            isinstance(plugin, dict) and {"plugin_id", "module", "class"} <= plugin.keys()
+            for plugin in plugins):
+        return None
+    return plugins
+
+
+def _plugins_from_manifest(package: str, fingerprint: Optional[str]) -> Optional[List[Type[Plugin]]]:
+    """
+    Get the plugin classes of a package from the plugin manifest
+    
+    Only the modules that define plugins are imported, the package is not
+    scanned.
+    
+    Args:
+        package: The package path
+        fingerprint: Current fingerprint of the package's source files
+        
+    Returns:
+        List of plugin classes, or None if the manifest is missing, out of
+        date or can't be used
+    """
+    entries = _manifest_entries(package, fingerprint)
+    if entries is None:
+        return None
+    try:
+        return [_import_plugin_class(entry) for entry in entries]
+    except Exception as e:
+        logger.debug(f"Ignoring plugin manifest for {package}: {e}")
+        return None
+
+
+class _LazyPlugins(Mapping):
+    """
+    Read-only mapping of all known plugins of a PluginManager
+    
+    Plugins that have not been loaded yet are loaded when they are accessed.
+    """
+    
+    __slots__ = ('_manager',)
+    
+    def __init__(self, manager: "PluginManager"):
+        self._manager = manager
+        
+    def __getitem__(self, plugin_id: str) -> Plugin:
+        plugin = self._manager.get_plugin(plugin_id)
+        if plugin is None:
+            raise KeyError(plugin_id)
+        return plugin
+    
+    def __contains__(self, plugin_id: object) -> bool:
+        return plugin_id in self._manager._plugins or plugin_id in self._manager._plugin_specs
+    
+    def __iter__(self):
+        return iter(self._manager._plugin_ids())
+    
+    def __len__(self) -> int:
+        return len(self._manager._plugin_ids())
+
+
 class PluginManager:
     """
     Manages the discovery, loading, and lifecycle of plugins for the AudioController
     """
     
+    # Plugin classes discovered per package, shared by all manager instances
+    _discovery_cache: Dict[str, List[Type[Plugin]]] = {}
+    
     def __init__(self, audio_controller: Any):
         """
         Initialize the plugin manager
@@ -192,51 +521,159 @@ class PluginManager:
         """
         self._audio_controller = audio_controller
         self._plugins: Dict[str, Plugin] = {}
+        self._plugins_view = _LazyPlugins(self)
+        self._enabled_plugins: Dict[str, Plugin] = {}
         self._plugin_classes: Dict[str, Type[Plugin]] = {}
+        # Plugins that are known but not necessarily imported yet, as
+        # returned by _manifest_entry()
+        self._plugin_specs: Dict[str, Dict[str, Any]] = {}
+        # Serialize loading of each plugin
+        self._load_locks: Dict[str, threading.Lock] = {}
+        self._load_locks_lock = threading.Lock()
+        # Serializes enabling and disabling plugins
+        self._enable_lock = threading.Lock()
         
     def discover_plugins(self, package: str = "ac3.addons") -> List[Type[Plugin]]:
         """
         Discover available plugins from the specified package
         
+        Plugin classes register themselves when their module is imported,
+        so discovery only needs to import the package. Packages that don't
+        import their plugin modules in __init__.py are walked once instead.
+        The result is stored in a manifest file and reused on later runs
+        until a source file of the package changes.
+        
         Args:
             package: The package path to search for plugins
             
         Returns:
             List of discovered plugin classes
         """
-        logger.info(f"Discovering plugins in package: {package}")
-        discovered = []
-        
-        # Import the package
-        try:
-            pkg = importlib.import_module(package)
-        except ImportError as e:
-            logger.error(f"Error importing package {package}: {e}")
-            return discovered
-            
-        # Walk through the package and subpackages
-        for _, name, is_pkg in pkgutil.iter_modules(pkg.__path__, pkg.__name__ + '.'):
-            if is_pkg:
-                # Recursively search subpackages
-                discovered.extend(self.discover_plugins(name))
-                continue
+        cached = self._discovery_cache.get(package)
+        if cached is None:
+            fingerprint = _package_fingerprint(package)
+            cached = _plugins_from_manifest(package, fingerprint)
+            if cached is not None:
+                logger.info(f"Using cached plugin list for package: {package}")
+                self._discovery_cache[package] = cached
                 
-            # Import the module
+        if cached is None:
+            logger.info(f"Discovering plugins in package: {package}")
+            
+            # Import the package
             try:
-                module = importlib.import_module(name)
+                pkg = importlib.import_module(package)
+            except ImportError as e:
+                logger.error(f"Error importing package {package}: {e}")
+                return []
                 
-                # Find Plugin subclasses in the module
-                for _, obj in inspect.getmembers(module, inspect.isclass):
-                    if (issubclass(obj, Plugin) and 
-                            obj != Plugin and 
-                            obj.__module__ == name):
-                        logger.debug(f"Discovered plugin: {obj.__name__} in {name}")
-                        discovered.append(obj)
-                        self._plugin_classes[obj.__name__] = obj
-            except Exception as e:
-                logger.error(f"Error loading module {name}: {e}")
+            cached = _registered_plugins(package)
+            if not cached and hasattr(pkg, '__path__'):
+                # Fall back to importing every module of the package
+                _import_submodules(pkg)
+                cached = _registered_plugins(package)
                 
-        return discovered
+            for plugin_class in cached:
+                logger.debug(f"Discovered plugin: {plugin_class.__name__} in {plugin_class.__module__}")
+            self._discovery_cache[package] = cached
+            if fingerprint is not None:
+                _save_manifest(package, fingerprint, cached)
+            
+        for plugin_class in cached:
+            plugin_id = _plugin_id(plugin_class)
+            self._plugin_classes[plugin_id] = plugin_class
+            self._plugin_specs[plugin_id] = _manifest_entry(plugin_class)
+        return list(cached)
+    
+    def index_plugins(self, package: str = "ac3.addons") -> List[str]:
+        """
+        Find the plugins available in a package without loading them
+        
+        If the plugin manifest is up to date no plugin module is imported;
+        plugins are imported and instantiated when they are first requested
+        with get_plugin() or enable_plugin().
+        
+        Args:
+            package: The package path to search for plugins
+            
+        Returns:
+            List of plugin IDs
+        """
+        entries = None
+        if package not in self._discovery_cache:
+            entries = _manifest_entries(package, _package_fingerprint(package))
+            
+        if entries is None:
+            plugin_ids = [_plugin_id(plugin_class) for plugin_class in self.discover_plugins(package)]
+        else:
+            logger.info(f"Using cached plugin list for package: {package}")
+            plugin_ids = []
+            for entry in entries:
+                self._plugin_specs.setdefault(entry["plugin_id"], entry)
+                plugin_ids.append(entry["plugin_id"])
+        return plugin_ids
+    
+    def materialize(self, plugin_id: str) -> Optional[Plugin]:
+        """
+        Import and instantiate a known plugin unless it is loaded already
+        
+        Args:
+            plugin_id: The ID of the plugin
+            
+        Returns:
+            The plugin instance, or None if the plugin is unknown or loading
+            failed
+        """
+        plugin = self._plugins.get(plugin_id)
+        if plugin is not None:
+            return plugin
+            
+        with self._load_locks_lock:
+            lock = self._load_locks.setdefault(plugin_id, threading.Lock())
+            
+        with lock:
+            plugin = self._plugins.get(plugin_id)
+            if plugin is not None:
+                return plugin  # Loaded by another thread
+                
+            plugin_class = self._plugin_classes.get(plugin_id)
+            if plugin_class is None:
+                entry = self._plugin_specs.get(plugin_id)
+                if entry is None:
+                    logger.warning(f"Plugin {plugin_id} not found")
+                    return None
+                try:
+                    plugin_class = _import_plugin_class(entry)
+                except Exception as e:
+                    logger.error(f"Error importing plugin {plugin_id}: {e}")
+                    self._plugin_specs.pop(plugin_id, None)
+                    return None
+                self._plugin_classes[plugin_id] = plugin_class
+                
+            plugin = self.load_plugin(plugin_class)
+            if plugin is None:
+                # Don't offer a plugin that can't be loaded
+                self._plugin_specs.pop(plugin_id, None)
+            return plugin
+    
+    def _plugin_ids(self) -> List[str]:
+        """
+        Get the IDs of all loaded and known plugins
+        
+        Returns:
+            List of plugin IDs
+        """
+        return list(dict.fromkeys([*self._plugins, *self._plugin_specs]))
+    
+    @classmethod
+    def invalidate_discovery_cache(cls) -> None:
+        """
+        Forget previously discovered plugin classes
+        
+        The next call to discover_plugins() will scan the packages again,
+        e.g. after plugin modules have been added during development.
+        """
+        cls._discovery_cache.clear()
         
     def load_plugin(self, plugin_class: Type[Plugin]) -> Optional[Plugin]:
         """
@@ -248,15 +685,15 @@ class PluginManager:
         Returns:
             The plugin instance, or None if loading failed
         """
+        plugin_id = _plugin_id(plugin_class)
+        if plugin_id in self._plugins:
+            logger.warning(f"Plugin {plugin_id} is already loaded")
+            return self._plugins[plugin_id]
+            
         try:
             plugin = plugin_class()
             plugin.set_audio_controller(self._audio_controller)
             
-            plugin_id = plugin.name
-            if plugin_id in self._plugins:
-                logger.warning(f"Plugin {plugin_id} is already loaded")
-                return self._plugins[plugin_id]
-                
             self._plugins[plugin_id] = plugin
             logger.info(f"Loaded plugin: {plugin_id}")
             return plugin
@@ -274,14 +711,7 @@ class PluginManager:
         Returns:
             The plugin instance, or None if loading failed
         """
-        if plugin_name in self._plugins:
-            return self._plugins[plugin_name]  # Already loaded
-            
-        if plugin_name in self._plugin_classes:
-            return self.load_plugin(self._plugin_classes[plugin_name])
-            
-        logger.warning(f"Plugin {plugin_name} not found")
-        return None
+        return self.materialize(plugin_name)
     
     def load_all_plugins(self) -> List[Plugin]:
         """
@@ -291,8 +721,8 @@ class PluginManager:
             List of loaded plugin instances
         """
         loaded = []
-        for plugin_class in self._plugin_classes.values():
-            plugin = self.load_plugin(plugin_class)
+        for plugin_id in self._plugin_ids():
+            plugin = self.materialize(plugin_id)
             if plugin:
                 loaded.append(plugin)
         return loaded
@@ -307,17 +737,45 @@ class PluginManager:
         Returns:
             True if the plugin was enabled, False otherwise
         """
-        if plugin_id not in self._plugins:
-            plugin = self.load_plugin_by_name(plugin_id)
-            if not plugin:
-                return False
+        with self._enable_lock:
+            return self._enable_unlocked(plugin_id)
+    
+    def _enable_unlocked(self, plugin_id: str) -> bool:
+        """
+        Enable a plugin, the enable lock must be held
+        
+        Args:
+            plugin_id: The ID of the plugin to enable
+            
+        Returns:
+            True if the plugin was enabled, False otherwise
+        """
+        plugin = self.materialize(plugin_id)
+        if not plugin:
+            return False
         
-        return self._plugins[plugin_id].enable()
+        if not plugin.enable():
+            return False
+        self._enabled_plugins[plugin_id] = plugin
+        return True
     
     def disable_plugin(self, plugin_id: str) -> bool:
         """
         Disable a plugin by its ID
         
+        Args:
+            plugin_id: The ID of the plugin to disable
+            
+        Returns:
+            True if the plugin was disabled, False otherwise
+        """
+        with self._enable_lock:
+            return self._disable_unlocked(plugin_id)
+    
+    def _disable_unlocked(self, plugin_id: str) -> bool:
+        """
+        Disable a plugin, the enable lock must be held
+        
         Args:
             plugin_id: The ID of the plugin to disable
             
@@ -326,7 +784,34 @@ class PluginManager:
         """
         if plugin_id not in self._plugins:
             return False
-        return self._plugins[plugin_id].disable()
+        if not self._plugins[plugin_id].disable():
+            return False
+        self._enabled_plugins.pop(plugin_id, None)
+        return True
+    
+    def set_enabled_plugins(self, plugin_ids: Iterable[str]) -> Set[str]:
+        """
+        Enable exactly the given plugins
+        
+        Enabled plugins that are not listed are disabled first, then the
+        listed plugins that are not enabled yet are enabled. Plugins that
+        are already in the requested state are not touched.
+        
+        Args:
+            plugin_ids: IDs of the plugins that should be enabled
+            
+        Returns:
+            IDs of the plugins that are enabled afterwards
+        """
+        wanted = dict.fromkeys(plugin_ids)
+        with self._enable_lock:
+            for plugin_id in [plugin_id for plugin_id in self._enabled_plugins if plugin_id not in wanted]:
+                if not self._disable_unlocked(plugin_id):
+                    logger.warning(f"Failed to disable plugin {plugin_id}")
+            for plugin_id in wanted:
+                if plugin_id not in self._enabled_plugins and not self._enable_unlocked(plugin_id):
+                    logger.warning(f"Failed to enable plugin {plugin_id}")
+            return set(self._enabled_plugins)
     
     def get_plugin(self, plugin_id: str) -> Optional[Plugin]:
         """
@@ -336,18 +821,23 @@ class PluginManager:
             plugin_id: The ID of the plugin to get
             
         Returns:
-            The plugin instance, or None if not loaded
+            The plugin instance, or None if the plugin is unknown or can't
+            be loaded
         """
-        return self._plugins.get(plugin_id)
+        plugin = self._plugins.get(plugin_id)
+        if plugin is None and plugin_id in self._plugin_specs:
+            plugin = self.materialize(plugin_id)
+        return plugin
     
-    def get_plugins(self) -> Dict[str, Plugin]:
+    def get_plugins(self) -> Mapping[str, Plugin]:
         """
-        Get all loaded plugins
+        Get all known plugins
         
         Returns:
-            Dictionary mapping plugin IDs to plugin instances
+            Read-only live view mapping plugin IDs to plugin instances;
+            plugins are loaded when their value is accessed
         """
-        return self._plugins.copy()
+        return self._plugins_view
     
     def get_enabled_plugins(self) -> Dict[str, Plugin]:
         """
@@ -356,8 +846,4 @@ class PluginManager:
         Returns:
             Dictionary mapping plugin IDs to plugin instances
         """
-        return {
-            plugin_id: plugin 
-            for plugin_id, plugin in self._plugins.items() 
-            if plugin.enabled
-        }
\ No newline at end of file
+        return self._enabled_plugins.copy()
\ No newline at end of file
@@ -6,30 +6,102 @@ player controllers (e.g., MPD, Spotify, Bluetooth) and provides a unified
 interface for controlling them.
 """
 
+import dataclasses
 import enum
+import functools
 import logging
 import threading
 import time
-from typing import Dict, List, Optional, Any, Set, Callable, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Any, Sequence, Set, Callable, Tuple, Union
 
 from ac3.player.player_controller import (
-    PlayerController, PlayerStateListener, LoopMode, PlayerState
+    PlayerController, PlayerStateListener, PlayerState
 )
 from ac3.metadata import Player, Song
 from ac3.addons.plugin import PluginManager, Plugin
 
 logger = logging.getLogger("ac3.controller")
 
+_PLAYING = PlayerState.PLAYING.value
+_UNKNOWN = PlayerState.UNKNOWN.value
 
-class EventType(enum.Enum):
+# Fallback controller class, imported when it is first needed
+_NullPlayerController: Optional[type] = None
+
+
+def _get_null_player_controller() -> type:
+    """
+    Get the NullPlayerController class, importing it on first use
+    
+    Returns:
+        The NullPlayerController class
+    """
+    global _NullPlayerController
+    if _NullPlayerController is None:
+        from ac3.player.null import NullPlayerController
+        _NullPlayerController = NullPlayerController
+    return _NullPlayerController
+
+
+def _forward(name: str, default: Any, action: Optional[str] = None, doc: Optional[str] = None) -> Callable:
+    """
+    Create an AudioController method that calls the same method of the active controller
+    
+    Args:
+        name: Name of the PlayerController method
+        default: Value returned if there is no active controller
+        action: Description of the action for the warning logged if there
+            is no active controller; no warning is logged if None
+        doc: Docstring of the method
+        
+    Returns:
+        The method
+    """
+    def method(self, *args, **kwargs):
+        controller = self._active_controller
+        if controller is not None:
+            return getattr(controller, name)(*args, **kwargs)
+        if action is not None:
+            logger.warning("Cannot %s: no active controller", action)
+        return default
+        
+    method.__name__ = name
+    method.__qualname__ = f"AudioController.{name}"
+    method.__doc__ = doc
+    return method
+
+
+class EventType(enum.IntEnum):
     """
     Event types for AudioController listeners
+    
+    Integer values keep hashing and comparing the members cheap. Members can
+    also be looked up by their lowercase name, e.g. EventType("song_change").
+    """
+    PLAYER_STATE_CHANGE = 1
+    SONG_CHANGE = 2
+    VOLUME_CHANGE = 3
+    POSITION_CHANGE = 4
+    CAPABILITY_CHANGE = 5
+    
+    @classmethod
+    def _missing_(cls, value):
+        """Look up members by name for the former string values"""
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper())
+        return None
+
+
+class AudioSnapshot(NamedTuple):
+    """
+    State of the active player, see AudioController.snapshot
     """
-    PLAYER_STATE_CHANGE = "player_state_change"
-    SONG_CHANGE = "song_change"
-    VOLUME_CHANGE = "volume_change"
-    POSITION_CHANGE = "position_change"
-    CAPABILITY_CHANGE = "capability_change"
+    player: Optional[Player]  # Player information
+    song: Optional[Song]  # Current song
+    volume: Optional[int]  # Volume level (0-100)
+    position: Optional[float]  # Playback position in seconds
+    capabilities: Optional[Sequence[str]]  # Capabilities of the player
 
 
 class AudioController(PlayerStateListener):
@@ -44,126 +116,214 @@ class AudioController(PlayerStateListener):
     def __init__(self):
         """Initialize the audio controller"""
         self._controllers: Dict[str, PlayerController] = {}
+        # Immutable copies of the registered controllers and their IDs for
+        # lock-free reads, rebuilt when controllers are (un)registered
+        self._controllers_snapshot: Tuple[PlayerController, ...] = ()
+        self._controller_ids_snapshot: Tuple[str, ...] = ()
+        self._controller_items_snapshot: Tuple[Tuple[str, PlayerController], ...] = ()
         self._active_controller_id: Optional[str] = None
-        self._lock = threading.RLock()
-        self._listeners: Set[Tuple[EventType, Callable]] = set()
+        self._active_controller: Optional[PlayerController] = None
+        # Controllers that are only created when first requested, keyed by
+        # controller type, with their load state ('unloaded', 'loading',
+        # 'loaded' or 'failed')
+        self._controller_factories: Dict[str, Callable[[], Optional[PlayerController]]] = {}
+        self._controller_load_state: Dict[str, str] = {}
+        # IDs of the players that last reported playing or being connected,
+        # maintained from their notifications
+        self._playing_ids: Set[str] = set()
+        self._connected_ids: Set[str] = set()
+        # Callbacks registered with each player by event type. Unlike the
+        # listener methods they know which player sent an event, so events
+        # that update the caches are handled here
+        self._player_callbacks: Dict[str, Tuple[Tuple[str, Callable[[Any], None]], ...]] = {}
+        # Not reentrant: never call a method that takes the lock, a
+        # controller or a listener while holding it
+        self._lock = threading.Lock()
+        # Callback tuples are replaced, never modified, so they can be
+        # iterated without holding the lock
+        self._listeners: Dict[EventType, Tuple[Callable, ...]] = {event_type: () for event_type in EventType}
         self._auto_pause: bool = True  # Enable auto-pause by default
+        # Runs blocking calls to several players in parallel (threads are
+        # only created when work is submitted)
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ac3-io")
         
-        # Plugin system
-        self._plugin_manager = PluginManager(self)
+        # Player information pushed by the controllers, so it doesn't have
+        # to be requested again
+        self._player_cache: Dict[str, Player] = {}
+        self._song_cache: Dict[str, Optional[Song]] = {}
+        
+        # Plugin system, the manager is created on first use
+        self._plugin_manager: Optional[PluginManager] = None
         self._plugins_loaded = False
         
         # Auto progress feature
         self._auto_progress: float = 0.0  # Default: disabled (0)
+        # Worker sleep between updates, derived from the interval
+        self._auto_progress_sleep: float = 0.5
         self._auto_progress_thread: Optional[threading.Thread] = None
-        self._auto_progress_running: bool = False
-        self._last_known_position: Optional[float] = None
-        self._last_position_update_time: Optional[float] = None
-        self._current_song_duration: Optional[float] = None
+        # Set to stop the current worker thread, each worker gets its own
+        self._auto_progress_stop: Optional[threading.Event] = None
+        # Serializes starting and stopping the worker thread
+        self._auto_progress_lock = threading.Lock()
+        # (last known position, monotonic time of that position, song
+        # duration); always replaced as a whole so it can be read without
+        # the lock, writers hold the lock
+        self._progress_state: Tuple[Optional[float], Optional[float], Optional[float]] = (None, None, None)
+        # Set while the active player is playing
+        self._playing_event = threading.Event()
         
-        # Start auto progress thread if needed
-        self._start_auto_progress_thread()
+        # Position change notifications are sent at most once per interval
+        self._position_notify_interval: float = 0.25
+        self._pending_position: Optional[float] = None
+        self._position_timer: Optional[threading.Timer] = None
+        self._last_position_notify: float = 0.0
+        # Position updates closer than this to the last one are dropped
+        self._position_emit_granularity: float = 0.25
+        self._last_emitted_position: Optional[float] = None
         
-    def _start_auto_progress_thread(self) -> None:
-        """Start the auto progress thread if not already running"""
-        if self._auto_progress_thread is None:
-            self._auto_progress_running = True
-            self._auto_progress_thread = threading.Thread(
-                target=self._auto_progress_worker,
-                daemon=True
-            )
-            self._auto_progress_thread.start()
-            logger.debug("Auto progress thread started")
-    
-    def _stop_auto_progress_thread(self) -> None:
-        """Stop the auto progress thread if running"""
-        self._auto_progress_running = False
-        if self._auto_progress_thread is not None:
-            self._auto_progress_thread.join(timeout=1.0)
-            self._auto_progress_thread = None
+    def _update_auto_progress_thread(self) -> None:
+        """
+        Start or stop the auto progress thread to match the interval
+        
+        The interval is checked with the thread lock held, so concurrent
+        calls of set_auto_progress() leave the thread running exactly when
+        the last interval set enables auto progress.
+        """
+        thread = None
+        with self._auto_progress_lock:
+            if self._auto_progress > 0:
+                if self._auto_progress_stop is None:
+                    self._start_auto_progress_thread()
+            elif self._auto_progress_stop is not None:
+                thread = self._stop_auto_progress_thread()
+                
+        # Wait for the worker without holding the lock
+        if thread is not None:
+            thread.join(timeout=1.0)
             logger.debug("Auto progress thread stopped")
     
-    def _auto_progress_worker(self) -> None:
+    def _start_auto_progress_thread(self) -> None:
+        """
+        Start the auto progress thread
+        
+        Must be called with the auto progress lock held.
+        """
+        stop = threading.Event()
+        self._auto_progress_stop = stop
+        self._auto_progress_thread = threading.Thread(
+            target=self._auto_progress_worker,
+            args=(stop,),
+            daemon=True
+        )
+        self._auto_progress_thread.start()
+        logger.debug("Auto progress thread started")
+    
+    def _stop_auto_progress_thread(self) -> Optional[threading.Thread]:
+        """
+        Tell the auto progress thread to stop
+        
+        Must be called with the auto progress lock held.
+        
+        Returns:
+            The thread to wait for, or None if it wasn't running
+        """
+        self._auto_progress_stop.set()
+        self._auto_progress_stop = None
+        thread = self._auto_progress_thread
+        self._auto_progress_thread = None
+        return thread
+    
+    def _auto_progress_worker(self, stop: threading.Event) -> None:
         """
         Worker thread for auto progress updates
         
         This thread will automatically update the position at regular intervals
-        when auto_progress is enabled and the player is playing.
-        """
-        # Track player state between updates
-        is_playing = False
+        when auto_progress is enabled and the player is playing. Whether the
+        active player is playing is tracked from state change events, so the
+        thread just blocks while nothing is playing.
         
-        while self._auto_progress_running:
+        Args:
+            stop: Event that is set when the thread should exit
+        """
+        while not stop.is_set():
             try:
-                # Sleep for a short interval (1/2 of the update interval or 0.1s minimum)
-                sleep_time = max(0.1, min(0.5, self._auto_progress / 2.0)) if self._auto_progress > 0 else 0.5
-                time.sleep(sleep_time)
+                # Block until the active player is playing; the timeout only
+                # makes sure the thread notices when it should stop
+                if not self._playing_event.wait(timeout=0.5):
+                    continue
                 
-                # Skip if auto_progress is disabled
-                if self._auto_progress <= 0:
-                    is_playing = False
+                # Auto progress is being disabled, the thread is stopped next
+                interval = self._auto_progress
+                if interval <= 0:
+                    stop.wait(0.5)
                     continue
                 
                 # Check if we have an active controller
                 active_controller = self.active_controller
                 if active_controller is None:
-                    is_playing = False
+                    time.sleep(self._auto_progress_sleep)
                     continue
                 
-                # Only check player state if we're not already known to be playing
-                # This reduces overhead of constantly checking player state
-                if not is_playing:
-                    # Get player info to check if it's playing
-                    player_info = active_controller.get_player_info()
-                    if player_info is None or player_info.state != PlayerState.PLAYING:
-                        continue
-                    
-                    # We've confirmed we're playing now
-                    is_playing = True
-                    
-                    # Initialize position tracking if needed
+                # Initialize position tracking if needed
+                if self._progress_state[0] is None:
+                    position = active_controller.get_position() or 0.0
                     with self._lock:
-                        if self._last_known_position is None:
-                            self._last_known_position = active_controller.get_position() or 0.0
-                            self._last_position_update_time = time.time()
+                        last_position, _, duration = self._progress_state
+                        if last_position is None:
+                            self._progress_state = (position, time.monotonic(), duration)
                 
-                # If we have a last known position and update time, calculate new position
-                with self._lock:
-                    current_time = time.time()
+                # Update the position every interval while playing. Updates are
+                # scheduled on absolute deadlines so they don't drift.
+                next_deadline = time.monotonic() + interval
+                while (not stop.is_set() and self._playing_event.is_set() and
+                        self._auto_progress == interval):
+                    now = time.monotonic()
+                    if now < next_deadline:
+                        # Sleep in short steps to notice pauses and stops
+                        time.sleep(min(next_deadline - now, self._auto_progress_sleep))
+                        continue
                     
-                    if (self._last_known_position is not None and 
-                            self._last_position_update_time is not None):
-                        
-                        # Calculate elapsed time since last update
-                        elapsed = current_time - self._last_position_update_time
-                        
-                        # Only update if it's time to do so (based on auto_progress interval)
-                        if elapsed >= self._auto_progress:
-                            # Calculate new position
-                            new_position = self._last_known_position + elapsed
+                    new_position = None
+                    with self._lock:
+                        last_position, last_update, duration = self._progress_state
+                        if last_position is not None and last_update is not None:
+                            # Position at the deadline; this is exactly one
+                            # interval unless a player reported a position
+                            new_position = last_position + max(0.0, next_deadline - last_update)
                             
-                            # Check if we've reached the end of the song
-                            if (self._current_song_duration is not None and 
-                                    new_position >= self._current_song_duration):
-                                # We've reached the end of the song
-                                new_position = self._current_song_duration
-                                
-                                # Reset playing state so we check again next time
-                                # (song might have changed or playback might have stopped)
-                                is_playing = False
+                            # Don't run past the end of the song, the player
+                            # will report the next song or a state change
+                            if duration is not None and new_position >= duration:
+                                new_position = duration
                             
                             # Update the last known position and time
-                            self._last_known_position = new_position
-                            self._last_position_update_time = current_time
-                            
-                            # Notify listeners of the position change
-                            self._notify_listeners(EventType.POSITION_CHANGE, new_position)
-                            logger.debug(f"Auto progress update: position = {new_position:.2f}s")
+                            self._progress_state = (new_position, next_deadline, duration)
+                    
+                    next_deadline += interval
+                    if next_deadline <= now:
+                        # Skip missed updates if the thread was delayed
+                        next_deadline = now + interval
+                    
+                    # Notify listeners of the position change
+                    if new_position is not None:
+                        self._schedule_position_notify(new_position)
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Auto progress update: position = %.2fs", new_position)
                             
             except Exception as e:
                 logger.error(f"Error in auto progress worker: {e}")
-                # Reset playing state so we recheck on next iteration
-                is_playing = False
+    
+    def _set_playing(self, playing: bool) -> None:
+        """
+        Record whether the active player is playing
+        
+        Args:
+            playing: True if the active player is playing
+        """
+        if playing:
+            self._playing_event.set()
+        else:
+            self._playing_event.clear()
     
     def set_auto_progress(self, interval: float) -> None:
         """
@@ -175,13 +335,108 @@ class AudioController(PlayerStateListener):
         with self._lock:
             old_value = self._auto_progress
             self._auto_progress = max(0.0, float(interval))
+            new_value = self._auto_progress
+            # Sleep for a short interval (1/2 of the update interval or 0.1s minimum)
+            self._auto_progress_sleep = max(0.1, min(0.5, new_value / 2.0)) if new_value > 0 else 0.5
+            
+        if old_value == 0 and new_value > 0:
+            logger.info(f"Auto progress enabled with interval {new_value}s")
+        elif old_value > 0 and new_value == 0:
+            logger.info("Auto progress disabled")
             
-            if old_value == 0 and self._auto_progress > 0:
-                logger.info(f"Auto progress enabled with interval {self._auto_progress}s")
-                # Make sure the thread is running
-                self._start_auto_progress_thread()
-            elif old_value > 0 and self._auto_progress == 0:
-                logger.info("Auto progress disabled")
+        # The worker thread only runs while auto progress is enabled. It's
+        # started and stopped without holding the lock, as it uses the lock.
+        self._update_auto_progress_thread()
+    
+    def set_position_notify_interval(self, interval: float) -> None:
+        """
+        Set the minimum time between two position change notifications
+        
+        Position updates arriving faster are coalesced, listeners only
+        receive the most recent position.
+        
+        Args:
+            interval: Minimum interval in seconds (0 to notify every update)
+        """
+        with self._lock:
+            self._position_notify_interval = max(0.0, float(interval))
+    
+    def get_position_notify_interval(self) -> float:
+        """
+        Get the minimum time between two position change notifications
+        
+        Returns:
+            Minimum interval in seconds
+        """
+        return self._position_notify_interval
+    
+    def set_position_granularity(self, granularity: float) -> None:
+        """
+        Set the smallest position change listeners are notified about
+        
+        Args:
+            granularity: Minimum position difference in seconds (0 to
+                notify every change)
+        """
+        with self._lock:
+            self._position_emit_granularity = max(0.0, float(granularity))
+    
+    def get_position_granularity(self) -> float:
+        """
+        Get the smallest position change listeners are notified about
+        
+        Returns:
+            Minimum position difference in seconds
+        """
+        return self._position_emit_granularity
+    
+    def _schedule_position_notify(self, position: Optional[float]) -> None:
+        """
+        Notify listeners of a position change, coalescing frequent updates
+        
+        The first update after a quiet period is sent right away. Updates
+        arriving within the notify interval after that are collected and
+        only the last one is sent when the interval has passed.
+        
+        Updates that differ from the previous one by less than the position
+        granularity are dropped, e.g. when a player repeats the same value or
+        a player update and an auto-progress update arrive together.
+        
+        Args:
+            position: New position in seconds, or None if not available
+        """
+        now = time.monotonic()
+        with self._lock:
+            last = self._last_emitted_position
+            if (position is not None and last is not None and
+                    abs(position - last) < self._position_emit_granularity):
+                return
+            self._last_emitted_position = position
+            self._pending_position = position
+            if self._position_timer is not None:
+                return  # A pending flush will send the latest position
+                
+            delay = self._last_position_notify + self._position_notify_interval - now
+            if delay > 0:
+                timer = threading.Timer(delay, self._flush_position)
+                timer.daemon = True
+                self._position_timer = timer
+            else:
+                timer = None
+                self._last_position_notify = now
+                
+        if timer is not None:
+            timer.start()
+        else:
+            self._notify_listeners(EventType.POSITION_CHANGE, position)
+    
+    def _flush_position(self) -> None:
+        """Send the latest coalesced position to listeners"""
+        with self._lock:
+            position = self._pending_position
+            self._position_timer = None
+            self._last_position_notify = time.monotonic()
+        self._notify_listeners(EventType.POSITION_CHANGE, position)
     
     def get_auto_progress(self) -> float:
         """
@@ -212,19 +467,46 @@ class AudioController(PlayerStateListener):
                 
             # Register the controller
             self._controllers[player_id] = controller
+            self._update_controller_snapshots()
             
             # Register self as a listener to receive state updates
             controller.add_state_listener(self)
+            callbacks = (
+                (PlayerController.EVENT_CONNECTION_CHANGE, functools.partial(self._on_connection_change, player_id)),
+                (PlayerController.EVENT_SONG_CHANGE, functools.partial(self._on_player_song_change, player_id)),
+                (PlayerController.EVENT_VOLUME_CHANGE, functools.partial(self._on_player_volume_change, player_id)),
+                (PlayerController.EVENT_CAPABILITY_CHANGE, functools.partial(self._on_player_capability_change, player_id)),
+            )
+            self._player_callbacks[player_id] = callbacks
+            for event_type, callback in callbacks:
+                controller.register_callback(event_type, callback)
+            if controller.cached_state == _PLAYING:
+                self._playing_ids.add(player_id)
             
             logger.info(f"Registered controller {player_id} ({controller.name})")
             
             # If this is the first controller, make it active
             if self._active_controller_id is None:
-                self._active_controller_id = player_id
+                self._set_active(player_id)
                 logger.info(f"Set {player_id} as active controller")
+            elif self._active_controller_id == player_id:
+                # The player was marked active before it was registered
+                self._set_active(player_id)
                 
             return True
     
+    def _update_controller_snapshots(self) -> None:
+        """
+        Rebuild the snapshots of registered controllers
+        
+        Must be called with the lock held.
+        """
+        self._controllers_snapshot = tuple(self._controllers.values())
+        self._controller_items_snapshot = tuple(self._controllers.items())
+        self._controller_ids_snapshot = tuple(self._controllers) + tuple(
+            controller_type for controller_type, state in self._controller_load_state.items()
+            if state in ("unloaded", "loading") and controller_type not in self._controllers)
+    
     def unregister_controller(self, player_id: str) -> bool:
         """
         Unregister a player controller
@@ -242,21 +524,29 @@ class AudioController(PlayerStateListener):
                 
             # Remove the controller
             controller = self._controllers.pop(player_id)
+            self._update_controller_snapshots()
+            self._player_cache.pop(player_id, None)
+            self._song_cache.pop(player_id, None)
             
             # Unregister self as a listener
             controller.remove_state_listener(self)
+            for event_type, callback in self._player_callbacks.pop(player_id, ()):
+                controller.unregister_callback(event_type, callback)
+            self._playing_ids.discard(player_id)
+            self._connected_ids.discard(player_id)
             
             logger.info(f"Unregistered controller {player_id} ({controller.name})")
             
             # If this was the active controller, select a new one
             if self._active_controller_id == player_id:
+                self._set_playing(False)
                 if self._controllers:
                     # Pick the first available controller
-                    self._active_controller_id = next(iter(self._controllers))
+                    self._set_active(next(iter(self._controllers)))
                     logger.info(f"Set {self._active_controller_id} as active controller")
                 else:
                     # No controllers left
-                    self._active_controller_id = None
+                    self._set_active(None)
                     logger.info("No controllers registered")
                     
             return True
@@ -269,80 +559,133 @@ class AudioController(PlayerStateListener):
         Args:
             player: Updated player information
         """
-        logger.debug(f"Player state changed: {player.player_id} - {player.state}")
+        logger.debug("Player state changed: %s - %s", player.player_id, player.state)
+        
+        is_playing = player.state == _PLAYING
+        
+        player_id = player.player_id
+        if player_id is not None:
+            self._player_cache[player_id] = player
+            if is_playing != (player_id in self._playing_ids):
+                with self._lock:
+                    if is_playing:
+                        if player_id in self._controllers:
+                            self._playing_ids.add(player_id)
+                    else:
+                        self._playing_ids.discard(player_id)
         
         # If this player is now playing but isn't the active player, we may need to make it active
         # and pause other players
-        if player.state == PlayerState.PLAYING and player.player_id != self._active_controller_id:
+        if is_playing and player.player_id != self._active_controller_id:
             with self._lock:
                 # Make this player active
-                old_active_id = self._active_controller_id
-                self._active_controller_id = player.player_id
-                logger.info(f"Player {player.player_id} started playing, setting as active controller")
-                
-                # If auto_pause is enabled, pause other players
-                if self._auto_pause:
-                    self.pause_other_controllers()
+                self._set_active(player.player_id)
+                auto_pause = self._auto_pause
+            logger.info(f"Player {player.player_id} started playing, setting as active controller")
+            
+            # If auto_pause is enabled, pause other players
+            if auto_pause:
+                self.pause_other_controllers()
                     
         # If this is the currently active player, or if it's now playing and no player is active,
         # notify listeners
         if (player.player_id == self._active_controller_id or
-                (player.state == PlayerState.PLAYING and self._active_controller_id is None)):
+                (is_playing and self._active_controller_id is None)):
             # If a player starts playing and no player is active, make it active
-            if player.state == PlayerState.PLAYING and self._active_controller_id is None:
+            if is_playing and self._active_controller_id is None:
                 self.set_active_controller(player.player_id)
             
+            self._set_playing(is_playing)
+            
             # For auto progress, handle state changes
-            if player.state == PlayerState.PLAYING:
+            if is_playing:
                 # If starting to play, get current position to start auto progress from
-                with self._lock:
-                    current_pos = self.get_position()
-                    if current_pos is not None:
-                        self._last_known_position = current_pos
-                        self._last_position_update_time = time.time()
+                current_pos = self.get_position()
+                if current_pos is not None:
+                    with self._lock:
+                        self._progress_state = (current_pos, time.monotonic(), self._progress_state[2])
             else:
                 # If stopped or paused, reset auto progress state
                 with self._lock:
-                    self._last_position_update_time = None
+                    last_position, _, duration = self._progress_state
+                    self._progress_state = (last_position, None, duration)
                 
             # Notify any listeners of the AudioController
             self._notify_listeners(EventType.PLAYER_STATE_CHANGE, player)
     
-    def on_song_change(self, song: Optional[Song]) -> None:
+    def _on_connection_change(self, player_id: str, connected: bool) -> None:
         """
-        Called when a player's current song changes
+        Called when a player connects or disconnects
         
         Args:
+            player_id: ID of the player
+            connected: Whether the player is connected now
+        """
+        with self._lock:
+            if connected:
+                if player_id in self._controllers:
+                    self._connected_ids.add(player_id)
+            else:
+                self._connected_ids.discard(player_id)
+    
+    def _on_player_song_change(self, player_id: str, song: Optional[Song]) -> None:
+        """
+        Called when the current song of a player changes
+        
+        Args:
+            player_id: ID of the player
             song: New song information, or None if no song is playing
         """
+        if player_id in self._controllers:
+            self._song_cache[player_id] = song
+            
         # We'll only care about song changes for the active player
         if self._active_controller_id is not None:
-            logger.debug(f"Song changed on active player: {self._active_controller_id}")
+            logger.debug("Song changed on active player: %s", self._active_controller_id)
             
-            # Update song duration for auto progress
+            # Reset position info since we have a new song
             with self._lock:
-                self._current_song_duration = song.duration if song else None
-                
-                # Reset position info since we have a new song
-                self._last_known_position = 0.0
-                self._last_position_update_time = time.time()
+                self._progress_state = (0.0, time.monotonic(), song.duration if song else None)
             
             # Notify any listeners of the AudioController
             self._notify_listeners(EventType.SONG_CHANGE, song)
     
-    def on_volume_change(self, volume: int) -> None:
+    def _on_player_volume_change(self, player_id: str, volume: int) -> None:
         """
-        Called when a player's volume changes
+        Called when the volume of a player changes
         
         Args:
+            player_id: ID of the player
             volume: New volume level (0-100)
         """
+        # Keep the cached player information up to date
+        player = self._player_cache.get(player_id)
+        if player is not None:
+            self._player_cache[player_id] = dataclasses.replace(player, volume=volume)
+            
         # We'll only care about volume changes for the active player
         if self._active_controller_id is not None:
-            logger.debug(f"Volume changed on active player: {self._active_controller_id} - {volume}%")
+            logger.debug("Volume changed on active player: %s - %s%%", self._active_controller_id, volume)
+            
             # Notify any listeners of the AudioController
             self._notify_listeners(EventType.VOLUME_CHANGE, volume)
     
+    def _on_player_capability_change(self, player_id: str, capabilities: List[str]) -> None:
+        """
+        Called when the capabilities of a player change
+        
+        Args:
+            player_id: ID of the player
+            capabilities: List of updated capabilities
+        """
+        logger.debug("Capabilities changed: %s", capabilities)
+        
+        # Cached player information contains the old capabilities
+        self._player_cache.pop(player_id, None)
+        
+        # Notify listeners of the capability change
+        self._notify_listeners(EventType.CAPABILITY_CHANGE, capabilities)
+    
     def on_position_change(self, position: Optional[float]) -> None:
         """
         Called when a player's playback position changes
@@ -352,27 +695,14 @@ class AudioController(PlayerStateListener):
         """
         # We'll only care about position changes for the active player
         if self._active_controller_id is not None:
-            logger.debug(f"Position changed on active player: {self._active_controller_id} - {position}s")
+            logger.debug("Position changed on active player: %s - %ss", self._active_controller_id, position)
             
             # Update last known position for auto progress
             with self._lock:
-                self._last_known_position = position
-                self._last_position_update_time = time.time()
+                self._progress_state = (position, time.monotonic(), self._progress_state[2])
             
             # Notify any listeners of the AudioController
-            self._notify_listeners(EventType.POSITION_CHANGE, position)
-    
-    def on_capability_change(self, capabilities: List[str]) -> None:
-        """
-        Called when a player's capabilities change.
-
-        Args:
-            capabilities: List of updated capabilities.
-        """
-        logger.debug(f"Capabilities changed: {capabilities}")
-
-        # Notify listeners of the capability change
-        self._notify_listeners(EventType.CAPABILITY_CHANGE, capabilities)
+            self._schedule_position_notify(position)
     
     # Methods for AudioController listeners
     def add_listener(self, event_type: EventType, callback: Callable[[Any], None]) -> None:
@@ -380,10 +710,14 @@ class AudioController(PlayerStateListener):
         Add a listener for AudioController events
         
         Args:
-            event_type: Type of event to listen for (from EventType enum)
+            event_type: Type of event to listen for (from EventType enum, or its name)
             callback: Function to call when the event occurs
         """
-        self._listeners.add((event_type, callback))
+        event_type = EventType(event_type)
+        with self._lock:
+            callbacks = self._listeners[event_type]
+            if callback not in callbacks:
+                self._listeners[event_type] = callbacks + (callback,)
         
     def remove_listener(self, event_type: EventType, callback: Callable[[Any], None]) -> None:
         """
@@ -393,7 +727,40 @@ class AudioController(PlayerStateListener):
             event_type: Type of event the listener was registered for
             callback: The callback function that was registered
         """
-        self._listeners.discard((event_type, callback))
+        event_type = EventType(event_type)
+        with self._lock:
+            self._listeners[event_type] = tuple(
+                cb for cb in self._listeners[event_type] if cb != callback)
+        
+    def add_listeners(self, callbacks: Mapping[EventType, Callable[[Any], None]]) -> Tuple[Tuple[EventType, Callable[[Any], None]], ...]:
+        """
+        Add listeners for several events at once
+        
+        Args:
+            callbacks: Function to call by type of event (from EventType enum, or its name)
+            
+        Returns:
+            Token to pass to remove_listeners() to remove all of them again
+        """
+        token = tuple((EventType(event_type), callback) for event_type, callback in callbacks.items())
+        with self._lock:
+            for event_type, callback in token:
+                listeners = self._listeners[event_type]
+                if callback not in listeners:
+                    self._listeners[event_type] = listeners + (callback,)
+        return token
+        
+    def remove_listeners(self, token: Tuple[Tuple[EventType, Callable[[Any], None]], ...]) -> None:
+        """
+        Remove listeners that were added with add_listeners()
+        
+        Args:
+            token: The token returned by add_listeners()
+        """
+        with self._lock:
+            for event_type, callback in token:
+                self._listeners[event_type] = tuple(
+                    cb for cb in self._listeners[event_type] if cb != callback)
         
     def _notify_listeners(self, event_type: EventType, data: Any) -> None:
         """
@@ -403,12 +770,11 @@ class AudioController(PlayerStateListener):
             event_type: Type of event that occurred
             data: Data associated with the event
         """
-        for listener_type, callback in self._listeners:
-            if listener_type == event_type:
-                try:
-                    callback(data)
-                except Exception as e:
-                    logger.error(f"Error notifying listener {callback}: {e}")
+        for callback in self._listeners[event_type]:
+            try:
+                callback(data)
+            except Exception as e:
+                logger.error(f"Error notifying listener {callback}: {e}")
     
     def get_controller(self, player_id: str) -> Optional[PlayerController]:
         """
@@ -420,25 +786,68 @@ class AudioController(PlayerStateListener):
         Returns:
             The PlayerController instance, or None if not found
         """
-        return self._controllers.get(player_id)
+        controller = self._controllers.get(player_id)
+        if controller is None and player_id in self._controller_factories:
+            controller = self._resolve(player_id)
+        return controller
+    
+    def _resolve(self, controller_type: str) -> Optional[PlayerController]:
+        """
+        Create and register a lazily loaded controller
+        
+        Args:
+            controller_type: Controller type the factory was added for
+            
+        Returns:
+            The PlayerController instance, or None if it could not be created
+        """
+        with self._lock:
+            if self._controller_load_state.get(controller_type) != "unloaded":
+                # Already loaded, failed or being loaded by another thread
+                return self._controllers.get(controller_type)
+            self._controller_load_state[controller_type] = "loading"
+            factory = self._controller_factories[controller_type]
+            
+        # Creating a controller may connect to the player, don't hold the lock
+        controller = None
+        try:
+            logger.info(f"Creating controller for {controller_type}")
+            controller = factory()
+        except Exception as e:
+            logger.error(f"Error creating controller for {controller_type}: {e}")
+            
+        if controller is None or not self.register_controller(controller):
+            logger.warning(f"Failed to create controller for {controller_type}")
+            with self._lock:
+                self._controller_load_state[controller_type] = "failed"
+            return None
+            
+        with self._lock:
+            self._controller_load_state[controller_type] = "loaded"
+            del self._controller_factories[controller_type]
+            self._update_controller_snapshots()
+        return controller
     
-    def get_controllers(self) -> List[PlayerController]:
+    def get_controllers(self) -> Tuple[PlayerController, ...]:
         """
         Get all registered controllers
         
         Returns:
-            List of all registered PlayerController instances
+            Immutable snapshot of all registered PlayerController instances
         """
-        return list(self._controllers.values())
+        return self._controllers_snapshot
     
-    def get_controller_ids(self) -> List[str]:
+    def get_controller_ids(self) -> Tuple[str, ...]:
         """
         Get IDs of all registered controllers
         
+        Controllers added lazily that have not been created yet are listed
+        by their controller type.
+        
         Returns:
-            List of controller IDs
+            Immutable snapshot of the controller IDs
         """
-        return list(self._controllers.keys())
+        return self._controller_ids_snapshot
     
     @property
     def active_controller(self) -> Optional[PlayerController]:
@@ -448,9 +857,19 @@ class AudioController(PlayerStateListener):
         Returns:
             The active PlayerController instance, or None if none is active
         """
-        if self._active_controller_id is None:
-            return None
-        return self._controllers.get(self._active_controller_id)
+        return self._active_controller
+    
+    def _set_active(self, player_id: Optional[str]) -> None:
+        """
+        Set the active controller ID together with the cached controller
+        
+        Must be called with the lock held.
+        
+        Args:
+            player_id: ID of the controller to make active, or None
+        """
+        self._active_controller_id = player_id
+        self._active_controller = self._controllers.get(player_id) if player_id is not None else None
     
     @property
     def active_controller_id(self) -> Optional[str]:
@@ -472,6 +891,9 @@ class AudioController(PlayerStateListener):
         Returns:
             True if successful, False otherwise
         """
+        if player_id not in self._controllers and player_id in self._controller_factories:
+            self._resolve(player_id)
+            
         with self._lock:
             if player_id not in self._controllers:
                 logger.warning(f"Cannot set active controller: {player_id} not registered")
@@ -482,20 +904,33 @@ class AudioController(PlayerStateListener):
                 return True
                 
             # Set new active controller
-            self._active_controller_id = player_id
-            logger.info(f"Set {player_id} as active controller")
-            
-            # Update auto progress with current position of new controller
+            self._set_active(player_id)
             controller = self._controllers[player_id]
-            position = controller.get_position()
-            song = controller.get_current_song()
             
-            with self._lock:
-                self._last_known_position = position
-                self._last_position_update_time = time.time() if position is not None else None
-                self._current_song_duration = song.duration if song else None
+        logger.info(f"Set {player_id} as active controller")
+        
+        # Update auto progress with current position of new controller,
+        # querying the player without holding the lock
+        position = controller.get_position()
+        song = controller.get_current_song()
+        player_info = controller.get_player_info()
+        
+        self._song_cache[player_id] = song
+        if player_info is not None:
+            self._player_cache[player_id] = player_info
             
-            return True
+        with self._lock:
+            if self._active_controller_id != player_id:
+                return True  # Another controller was activated in the meantime
+                
+            self._set_playing(player_info is not None and player_info.state == _PLAYING)
+            self._progress_state = (
+                position,
+                time.monotonic() if position is not None else None,
+                song.duration if song else None
+            )
+            
+        return True
     
     def auto_select_active_controller(self) -> bool:
         """
@@ -507,33 +942,77 @@ class AudioController(PlayerStateListener):
         Returns:
             True if a controller was selected, False otherwise
         """
+        # Use the states the players reported, in registration order
         with self._lock:
-            # First look for a controller that's playing
-            for player_id, controller in self._controllers.items():
-                if controller.isActive():
-                    self._active_controller_id = player_id
-                    logger.info(f"Auto-selected {player_id} as active controller (playing)")
-                    return True
-            
-            # Then look for a controller that's connected
-            for player_id, controller in self._controllers.items():
-                if controller.isConnected():
-                    self._active_controller_id = player_id
-                    logger.info(f"Auto-selected {player_id} as active controller (connected)")
-                    return True
-            
-            logger.warning("No suitable controller found for auto-selection")
-            return False
+            playing_ids = self._playing_ids
+            player_id = next((pid for pid in self._controllers if pid in playing_ids), None)
+            reason = "playing"
+            if player_id is None:
+                connected_ids = self._connected_ids
+                player_id = next((pid for pid in self._controllers if pid in connected_ids), None)
+                reason = "connected"
+            if player_id is not None:
+                self._set_active(player_id)
+                
+        if player_id is not None:
+            logger.info(f"Auto-selected {player_id} as active controller ({reason})")
+            return True
+            
+        # No player reported anything yet, query them without holding the lock
+        controllers = self._controller_items_snapshot
+        
+        # First look for a controller that's playing
+        for player_id, controller in controllers:
+            if controller.isActive():
+                with self._lock:
+                    self._set_active(player_id)
+                logger.info(f"Auto-selected {player_id} as active controller (playing)")
+                return True
+        
+        # Then look for a controller that's connected
+        for player_id, controller in controllers:
+            if controller.isConnected():
+                with self._lock:
+                    self._set_active(player_id)
+                logger.info(f"Auto-selected {player_id} as active controller (connected)")
+                return True
+        
+        logger.warning("No suitable controller found for auto-selection")
+        return False
     
     def get_active_player_info(self) -> Optional[Player]:
         """
         Get information about the active player
         
+        The information is taken from the last state change reported by the
+        player when available, so the playback position in it may be outdated;
+        use get_position() for the current position.
+        
         Returns:
             Player object with current player information, or None if no active player
         """
         controller = self.active_controller
-        return controller.get_player_info() if controller else None
+        if controller is None:
+            return None
+        return self._player_info(controller)
+    
+    def _player_info(self, controller: PlayerController) -> Optional[Player]:
+        """
+        Get the player information of a controller, from the cache if possible
+        
+        Args:
+            controller: The controller
+            
+        Returns:
+            Player object, or None if not available
+        """
+        player_id = controller.player_id
+        player = self._player_cache.get(player_id)
+        if player is None:
+            player = controller.get_player_info()
+            if player is not None:
+                self._player_cache[player_id] = player
+        return player
     
     def get_all_player_info(self) -> Dict[str, Player]:
         """
@@ -542,10 +1021,17 @@ class AudioController(PlayerStateListener):
         Returns:
             Dictionary mapping player IDs to Player objects
         """
+        # Query all players at the same time
+        futures = {player_id: self._io_pool.submit(controller.get_player_info)
+                   for player_id, controller in self._controller_items_snapshot}
+        
         result = {}
-        for player_id, controller in self._controllers.items():
+        deadline = time.monotonic() + 2.0
+        for player_id, future in futures.items():
             try:
-                result[player_id] = controller.get_player_info()
+                result[player_id] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeoutError:
+                logger.error(f"Timeout getting player info for {player_id}")
             except Exception as e:
                 logger.error(f"Error getting player info for {player_id}: {e}")
         return result
@@ -558,7 +1044,58 @@ class AudioController(PlayerStateListener):
             Song object with metadata, or None if no song is playing
         """
         controller = self.active_controller
-        return controller.get_current_song() if controller else None
+        if controller is None:
+            return None
+        return self._current_song(controller)
+    
+    def _current_song(self, controller: PlayerController) -> Optional[Song]:
+        """
+        Get the current song of a controller, from the cache if possible
+        
+        Args:
+            controller: The controller
+            
+        Returns:
+            Song object, or None if no song is playing
+        """
+        player_id = controller.player_id
+        try:
+            return self._song_cache[player_id]
+        except KeyError:
+            song = controller.get_current_song()
+            self._song_cache[player_id] = song
+            return song
+    
+    def snapshot(self) -> AudioSnapshot:
+        """
+        Get the player information, song, volume, position and capabilities
+        of the active player at once
+        
+        All values are from the same controller, even if another one becomes
+        active in the meantime. The cached player information and song are
+        used when available, like get_active_player_info() and
+        get_current_song() do, and the volume is taken from the player
+        information, which volume changes keep up to date.
+        
+        Returns:
+            AudioSnapshot with the current values, all None if there is no
+            active player
+        """
+        controller = self._active_controller
+        if controller is None:
+            return AudioSnapshot(None, None, None, None, None)
+        
+        player = self._player_info(controller)
+        volume = player.volume if player is not None else None
+        if volume is None:
+            volume = controller.get_volume()
+        return AudioSnapshot(
+            player=player,
+            song=self._current_song(controller),
+            volume=volume,
+            position=self._position(controller),
+            capabilities=player.capabilities if player is not None else None
+        )
     
     # Playback control methods - forward to active controller
     
@@ -575,11 +1112,11 @@ class AudioController(PlayerStateListener):
             
             # If successful, update auto progress
             if result:
-                with self._lock:
-                    position = controller.get_position()
-                    if position is not None:
-                        self._last_known_position = position
-                        self._last_position_update_time = time.time()
+                self._set_playing(True)
+                position = controller.get_position()
+                if position is not None:
+                    with self._lock:
+                        self._progress_state = (position, time.monotonic(), self._progress_state[2])
             
             return result
             
@@ -599,8 +1136,11 @@ class AudioController(PlayerStateListener):
             
             # If successful, update auto progress
             if result:
+                self._set_playing(False)
                 with self._lock:
-                    self._last_position_update_time = None  # Pause auto progress
+                    # Pause auto progress
+                    last_position, _, duration = self._progress_state
+                    self._progress_state = (last_position, None, duration)
             
             return result
             
@@ -610,15 +1150,45 @@ class AudioController(PlayerStateListener):
     def pause_other_controllers(self) -> None:
         """
         Pause all controllers except the active one
+        
+        Only players that last reported playing, or that have not reported
+        their state yet, are paused.
+        """
+        active_controller_id = self._active_controller_id
+        playing_ids = self._playing_ids
+        others = [(player_id, controller) for player_id, controller in self._controller_items_snapshot
+                  if player_id != active_controller_id and
+                  (player_id in playing_ids or controller.cached_state == _UNKNOWN)]
+        if others:
+            self._pause_controllers(others)
+    
+    def _pause_controllers(self, controllers: List[Tuple[str, PlayerController]]) -> None:
         """
-        with self._lock:
-            for player_id, controller in self._controllers.items():
-                if player_id != self._active_controller_id:
-                    try:
-                        controller.pause()
-                        logger.info(f"Paused controller {player_id}")
-                    except Exception as e:
-                        logger.error(f"Error pausing controller {player_id}: {e}")
+        Pause the given controllers
+        
+        Args:
+            controllers: List of player IDs and controllers
+        """
+        # Pausing may notify state listeners, including this controller,
+        # so the lock must not be held while doing so.
+        # Pause all of them at the same time, so this takes as long as the
+        # slowest player instead of the sum of all of them
+        list(self._io_pool.map(self._pause_controller, controllers))
+    
+    @staticmethod
+    def _pause_controller(item: Tuple[str, PlayerController]) -> None:
+        """
+        Pause a single controller, logging errors
+        
+        Args:
+            item: Tuple of player ID and controller
+        """
+        player_id, controller = item
+        try:
+            controller.pause()
+            logger.info(f"Paused controller {player_id}")
+        except Exception as e:
+            logger.error(f"Error pausing controller {player_id}: {e}")
     
     def stop(self) -> bool:
         """
@@ -633,43 +1203,31 @@ class AudioController(PlayerStateListener):
             
             # If successful, update auto progress
             if result:
+                self._set_playing(False)
                 with self._lock:
-                    self._last_position_update_time = None  # Stop auto progress
-                    self._last_known_position = 0.0  # Reset position
+                    # Stop auto progress and reset position
+                    self._progress_state = (0.0, None, self._progress_state[2])
             
             return result
             
         logger.warning("Cannot stop: no active controller")
         return False
     
-    def next(self) -> bool:
-        """
+    next = _forward("next", False, "skip to next", doc="""
         Skip to next track on the active player
         
         Returns:
             True if successful, False otherwise
-        """
-        controller = self.active_controller
-        if controller:
-            return controller.next()
-        logger.warning("Cannot skip to next: no active controller")
-        return False
+        """)
     
-    def previous(self) -> bool:
-        """
+    previous = _forward("previous", False, "skip to previous", doc="""
         Skip to previous track on the active player
         
         Returns:
             True if successful, False otherwise
-        """
-        controller = self.active_controller
-        if controller:
-            return controller.previous()
-        logger.warning("Cannot skip to previous: no active controller")
-        return False
+        """)
     
-    def set_volume(self, volume: int) -> bool:
-        """
+    set_volume = _forward("set_volume", False, "set volume", doc="""
         Set volume on the active player
         
         Args:
@@ -677,25 +1235,16 @@ class AudioController(PlayerStateListener):
             
         Returns:
             True if successful, False otherwise
-        """
-        controller = self.active_controller
-        if controller:
-            return controller.set_volume(volume)
-        logger.warning("Cannot set volume: no active controller")
-        return False
+        """)
     
-    def get_volume(self) -> Optional[int]:
-        """
+    get_volume = _forward("get_volume", None, doc="""
         Get current volume level of the active player
         
         Returns:
             Current volume level (0-100), or None if no active player
-        """
-        controller = self.active_controller
-        return controller.get_volume() if controller else None
+        """)
     
-    def mute(self, mute: bool = True) -> bool:
-        """
+    mute = _forward("mute", False, "mute", doc="""
         Mute or unmute the active player
         
         Args:
@@ -703,22 +1252,14 @@ class AudioController(PlayerStateListener):
             
         Returns:
             True if successful, False otherwise
-        """
-        controller = self.active_controller
-        if controller:
-            return controller.mute(mute)
-        logger.warning("Cannot mute: no active controller")
-        return False
+        """)
     
-    def is_muted(self) -> Optional[bool]:
-        """
+    is_muted = _forward("is_muted", None, doc="""
         Check if active player is muted
         
         Returns:
             True if muted, False if not muted, None if no active player
-        """
-        controller = self.active_controller
-        return controller.is_muted() if controller else None
+        """)
     
     def seek(self, position: float) -> bool:
         """
@@ -737,8 +1278,7 @@ class AudioController(PlayerStateListener):
             # If successful, update auto progress
             if result:
                 with self._lock:
-                    self._last_known_position = position
-                    self._last_position_update_time = time.time()
+                    self._progress_state = (position, time.monotonic(), self._progress_state[2])
             
             return result
             
@@ -752,58 +1292,59 @@ class AudioController(PlayerStateListener):
         Returns:
             Current position in seconds, or None if not available
         """
+        return self._position(self._active_controller)
+    
+    def _position(self, controller: Optional[PlayerController]) -> Optional[float]:
+        """
+        Get the playback position of the active controller, calculated if
+        auto progress is enabled
+        
+        Args:
+            controller: The active controller, or None
+            
+        Returns:
+            Current position in seconds, or None if not available
+        """
+        # Without auto progress, just ask the player (no need for the lock)
+        if self._auto_progress <= 0:
+            return controller.get_position() if controller is not None else None
+            
         # If auto progress is enabled and we have a last known position,
         # calculate the current position based on elapsed time
-        with self._lock:
-            if (self._auto_progress > 0 and 
-                    self._last_known_position is not None and 
-                    self._last_position_update_time is not None):
+        last_position, last_update, duration = self._progress_state
+        
+        # Whether the active controller is playing is known from its state
+        # change events, no need to ask the player
+        if (controller is not None and self._playing_event.is_set() and
+                last_position is not None and last_update is not None):
+            # Calculate elapsed time and new position
+            elapsed = time.monotonic() - last_update
+            position = last_position + elapsed
+            
+            # Check if we've reached the end of the song
+            if duration is not None and position >= duration:
+                position = duration
                 
-                # Get the active controller and check if it's playing
-                controller = self.active_controller
-                if controller:
-                    player_info = controller.get_player_info()
-                    if player_info and player_info.state == PlayerState.PLAYING:
-                        # Calculate elapsed time and new position
-                        elapsed = time.time() - self._last_position_update_time
-                        position = self._last_known_position + elapsed
-                        
-                        # Check if we've reached the end of the song
-                        if (self._current_song_duration is not None and 
-                                position >= self._current_song_duration):
-                            position = self._current_song_duration
-                            
-                        return position
+            return position
         
         # Fall back to the controller's reported position
-        controller = self.active_controller
-        return controller.get_position() if controller else None
+        return controller.get_position() if controller is not None else None
     
-    def set_shuffle(self, enabled: bool) -> bool:
-        """
+    set_shuffle = _forward("set_shuffle", False, "set shuffle mode", doc="""
         Enable or disable shuffle mode on active player
         
         Args:
             enabled: True to enable shuffle, False to disable
-        """
-        controller = self.active_controller
-        if controller:
-            return controller.set_shuffle(enabled)
-        logger.warning("Cannot set shuffle mode: no active controller")
-        return False
+        """)
     
-    def get_shuffle(self) -> Optional[bool]:
-        """
+    get_shuffle = _forward("get_shuffle", None, doc="""
         Get current shuffle mode of active player
         
         Returns:
             True if shuffle is enabled, False if disabled, None if no active player
-        """
-        controller = self.active_controller
-        return controller.get_shuffle() if controller else None
+        """)
     
-    def set_loop_mode(self, mode: LoopMode) -> bool:
-        """
+    set_loop_mode = _forward("set_loop_mode", False, "set loop mode", doc="""
         Set loop mode on active player
         
         Args:
@@ -811,36 +1352,45 @@ class AudioController(PlayerStateListener):
             
         Returns:
             True if successful, False otherwise
-        """
-        controller = self.active_controller
-        if controller:
-            return controller.set_loop_mode(mode)
-        logger.warning("Cannot set loop mode: no active controller")
-        return False
+        """)
     
-    def get_loop_mode(self) -> Optional[LoopMode]:
-        """
+    get_loop_mode = _forward("get_loop_mode", None, doc="""
         Get current loop mode of active player
         
         Returns:
             Current loop mode, or None if no active player
-        """
-        controller = self.active_controller
-        return controller.get_loop_mode() if controller else None
+        """)
     
-    def add_all_player_controllers(self):
+    def add_all_player_controllers(self, lazy: bool = False):
         """
         Add all available player controllers from the player module
         
         This method scans for available player controllers and registers them all.
-        """
-        from ac3.player.player_controller import PlayerController
         
+        Args:
+            lazy: Only create a controller when it is first requested with
+                get_controller() or set_active_controller(), using the
+                controller type as its ID. Controllers that have not been
+                created don't report state changes, so they can't become
+                active automatically.
+        """
         logger.info("Adding all available player controllers")
         
         # Get all available controller implementations
         controller_types = PlayerController.controllerImplementations()
         
+        if lazy:
+            with self._lock:
+                for controller_type in controller_types:
+                    if controller_type in self._controllers or controller_type in self._controller_factories:
+                        continue
+                    self._controller_factories[controller_type] = functools.partial(
+                        PlayerController.createController, controller_type)
+                    self._controller_load_state[controller_type] = "unloaded"
+                self._update_controller_snapshots()
+            if self._controller_factories:
+                return True
+        
         # Create and register each controller
         for controller_type in controller_types:
             try:
@@ -857,7 +1407,7 @@ class AudioController(PlayerStateListener):
         # If no controllers were registered, add a fallback null controller
         if not self._controllers:
             try:
-                from ac3.player.null import NullPlayerController
+                NullPlayerController = _get_null_player_controller()
                 logger.info("Adding fallback NullPlayerController")
                 null_controller = NullPlayerController()
                 self.register_controller(null_controller)
@@ -868,32 +1418,43 @@ class AudioController(PlayerStateListener):
     
     # Plugin system methods
     
+    @property
+    def plugin_manager(self) -> PluginManager:
+        """
+        Get the plugin manager, creating it on first access
+        
+        Returns:
+            The PluginManager instance of this audio controller
+        """
+        if self._plugin_manager is None:
+            self._plugin_manager = PluginManager(self)
+        return self._plugin_manager
+    
     def load_plugins(self, package: str = "ac3.addons") -> int:
         """
         Load plugins from the specified package
         
+        Plugins are only imported and instantiated when they are first
+        requested, e.g. by enable_plugin().
+        
         Args:
             package: The package path to search for plugins
             
         Returns:
-            Number of plugins loaded
+            Number of plugins available
         """
         if self._plugins_loaded:
             logger.warning("Plugins already loaded, skipping")
-            return len(self._plugin_manager.get_plugins())
+            return len(self.plugin_manager.get_plugins())
         
         logger.info("Loading AudioController plugins")
         
-        # Discover available plugins
-        discovered = self._plugin_manager.discover_plugins(package)
-        logger.info(f"Discovered {len(discovered)} plugins")
-        
-        # Load all discovered plugins
-        loaded = self._plugin_manager.load_all_plugins()
-        logger.info(f"Loaded {len(loaded)} plugins")
+        # Find available plugins
+        plugin_ids = self.plugin_manager.index_plugins(package)
+        logger.info(f"Found {len(plugin_ids)} plugins")
         
         self._plugins_loaded = True
-        return len(loaded)
+        return len(plugin_ids)
     
     def enable_plugin(self, plugin_id: str) -> bool:
         """
@@ -905,7 +1466,19 @@ class AudioController(PlayerStateListener):
         Returns:
             True if the plugin was enabled, False otherwise
         """
-        return self._plugin_manager.enable_plugin(plugin_id)
+        return self.plugin_manager.enable_plugin(plugin_id)
+    
+    def set_enabled_plugins(self, plugin_ids: Iterable[str]) -> Set[str]:
+        """
+        Enable exactly the given plugins, disabling all others
+        
+        Args:
+            plugin_ids: IDs of the plugins that should be enabled
+            
+        Returns:
+            IDs of the plugins that are enabled afterwards
+        """
+        return self.plugin_manager.set_enabled_plugins(plugin_ids)
     
     def disable_plugin(self, plugin_id: str) -> bool:
         """
@@ -917,7 +1490,7 @@ class AudioController(PlayerStateListener):
         Returns:
             True if the plugin was disabled, False otherwise
         """
-        return self._plugin_manager.disable_plugin(plugin_id)
+        return self.plugin_manager.disable_plugin(plugin_id)
     
     def get_plugin(self, plugin_id: str) -> Optional[Plugin]:
         """
@@ -929,16 +1502,16 @@ class AudioController(PlayerStateListener):
         Returns:
             The plugin instance, or None if not loaded
         """
-        return self._plugin_manager.get_plugin(plugin_id)
+        return self.plugin_manager.get_plugin(plugin_id)
     
-    def get_plugins(self) -> Dict[str, Plugin]:
+    def get_plugins(self) -> Mapping[str, Plugin]:
         """
         Get all loaded plugins
         
         Returns:
-            Dictionary mapping plugin IDs to plugin instances
+            Read-only live view mapping plugin IDs to plugin instances
         """
-        return self._plugin_manager.get_plugins()
+        return self.plugin_manager.get_plugins()
     
     def get_enabled_plugins(self) -> Dict[str, Plugin]:
         """
@@ -947,4 +1520,4 @@ class AudioController(PlayerStateListener):
         Returns:
             Dictionary mapping plugin IDs to plugin instances
         """
-        return self._plugin_manager.get_enabled_plugins()
+        return self.plugin_manager.get_enabled_plugins()
@@ -8,7 +8,9 @@ interface for controlling them.
 
 import logging
 import threading
-from typing import Dict, List, Optional, Any, Set, Callable
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, Optional, Any, Set, Callable, Sequence, Tuple
 
 from ac3.player.player_controller import PlayerController, LoopMode
 from ac3.metadata import Player, Song
@@ -27,10 +29,19 @@ class AudioController:
     def __init__(self):
         """Initialize the audio controller"""
         self._controllers: Dict[str, PlayerController] = {}
+        # Immutable copies of the registered controllers and their IDs,
+        # rebuilt when a controller is (un)registered
+        self._controllers_snapshot: Tuple[PlayerController, ...] = ()
+        self._controller_ids_snapshot: Tuple[str, ...] = ()
         self._active_controller_id: Optional[str] = None
-        self._lock = threading.RLock()
+        self._active_controller: Optional[PlayerController] = None
+        # Not reentrant: locked sections must not call other locked methods
+        self._lock = threading.Lock()
         self._listeners: Set[Callable] = set()
         self._auto_pause = True  # Default: pause other players when a new one becomes active
+        # Queries all players in parallel (threads are only created when
+        # work is submitted)
+        self._info_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="playerinfo")
         
     @property
     def auto_pause(self) -> bool:
@@ -59,15 +70,32 @@ class AudioController:
         if not self._active_controller_id:
             return
             
-        for player_id, controller in self._controllers.items():
-            if player_id != self._active_controller_id:
-                try:
-                    player_info = controller.get_player_info()
-                    if player_info and player_info.state == "playing":
-                        logger.info(f"Auto-pausing player: {player_id}")
-                        controller.pause()
-                except Exception as e:
-                    logger.error(f"Error pausing controller {player_id}: {e}")
+        others = [(player_id, controller) for player_id, controller in self._controllers.items()
+                  if player_id != self._active_controller_id]
+        
+        # Check and pause all of them at the same time
+        list(self._info_pool.map(self._pause_if_playing, others))
+    
+    @staticmethod
+    def _pause_if_playing(item: Tuple[str, PlayerController]) -> None:
+        """
+        Pause a controller if it is playing, logging errors
+        
+        Args:
+            item: Tuple of player ID and controller
+        """
+        player_id, controller = item
+        try:
+            state = controller.cached_state
+            if state == "unknown":
+                # The player hasn't reported its state yet
+                player_info = controller.get_player_info()
+                state = player_info.state if player_info else None
+            if state == "playing":
+                logger.info(f"Auto-pausing player: {player_id}")
+                controller.pause()
+        except Exception as e:
+            logger.error(f"Error pausing controller {player_id}: {e}")
     
     def register_controller(self, controller: PlayerController) -> bool:
         """
@@ -89,11 +117,12 @@ class AudioController:
                 
             # Register the controller
             self._controllers[player_id] = controller
+            self._update_controller_snapshots()
             logger.info(f"Registered controller {player_id} ({controller.name})")
             
             # If this is the first controller, make it active
             if self._active_controller_id is None:
-                self._active_controller_id = player_id
+                self._set_active(player_id)
                 logger.info(f"Set {player_id} as active controller")
                 
             return True
@@ -115,21 +144,31 @@ class AudioController:
                 
             # Remove the controller
             controller = self._controllers.pop(player_id)
+            self._update_controller_snapshots()
             logger.info(f"Unregistered controller {player_id} ({controller.name})")
             
             # If this was the active controller, select a new one
             if self._active_controller_id == player_id:
                 if self._controllers:
                     # Pick the first available controller
-                    self._active_controller_id = next(iter(self._controllers))
+                    self._set_active(next(iter(self._controllers)))
                     logger.info(f"Set {self._active_controller_id} as active controller")
                 else:
                     # No controllers left
-                    self._active_controller_id = None
+                    self._set_active(None)
                     logger.info("No controllers registered")
                     
             return True
     
+    def _update_controller_snapshots(self) -> None:
+        """
+        Rebuild the copies of the registered controllers
+        
+        Must be called with the lock held.
+        """
+        self._controllers_snapshot = tuple(self._controllers.values())
+        self._controller_ids_snapshot = tuple(self._controllers)
+    
     def get_controller(self, player_id: str) -> Optional[PlayerController]:
         """
         Get a specific controller by ID
@@ -142,23 +181,24 @@ class AudioController:
         """
         return self._controllers.get(player_id)
     
-    def get_controllers(self) -> List[PlayerController]:
+    def get_controllers(self) -> Sequence[PlayerController]:
         """
         Get all registered controllers
         
         Returns:
-            List of all registered PlayerController instances
+            Tuple of all registered PlayerController instances, it doesn't
+            change when controllers are (un)registered later
         """
-        return list(self._controllers.values())
+        return self._controllers_snapshot
     
-    def get_controller_ids(self) -> List[str]:
+    def get_controller_ids(self) -> Sequence[str]:
         """
         Get IDs of all registered controllers
         
         Returns:
-            List of controller IDs
+            Tuple of the controller IDs
         """
-        return list(self._controllers.keys())
+        return self._controller_ids_snapshot
     
     @property
     def active_controller(self) -> Optional[PlayerController]:
@@ -168,9 +208,19 @@ class AudioController:
         Returns:
             The active PlayerController instance, or None if none is active
         """
-        if self._active_controller_id is None:
-            return None
-        return self._controllers.get(self._active_controller_id)
+        return self._active_controller
+    
+    def _set_active(self, player_id: Optional[str]) -> None:
+        """
+        Set the active controller ID together with the cached controller
+        
+        Must be called with the lock held.
+        
+        Args:
+            player_id: ID of the controller to make active, or None
+        """
+        self._active_controller_id = player_id
+        self._active_controller = self._controllers.get(player_id) if player_id is not None else None
     
     @property
     def active_controller_id(self) -> Optional[str]:
@@ -202,7 +252,7 @@ class AudioController:
                 return True
                 
             # Set new active controller
-            self._active_controller_id = player_id
+            self._set_active(player_id)
             logger.info(f"Set {player_id} as active controller")
             
             # If auto_pause is enabled, pause other players
@@ -228,7 +278,7 @@ class AudioController:
                     # If we're changing the active controller and auto_pause is enabled,
                     # we'll need to pause other players
                     old_active_id = self._active_controller_id
-                    self._active_controller_id = player_id
+                    self._set_active(player_id)
                     logger.info(f"Auto-selected {player_id} as active controller (playing)")
                     
                     # If we switched active controllers and auto_pause is enabled, pause others
@@ -240,7 +290,7 @@ class AudioController:
             # Then look for a controller that's connected
             for player_id, controller in self._controllers.items():
                 if controller.isConnected():
-                    self._active_controller_id = player_id
+                    self._set_active(player_id)
                     logger.info(f"Auto-selected {player_id} as active controller (connected)")
                     return True
             
@@ -264,10 +314,17 @@ class AudioController:
         Returns:
             Dictionary mapping player IDs to Player objects
         """
+        # Query all players at the same time
+        futures = {player_id: self._info_pool.submit(controller.get_player_info)
+                   for player_id, controller in list(self._controllers.items())}
+        
         result = {}
-        for player_id, controller in self._controllers.items():
+        deadline = time.monotonic() + 2.0
+        for player_id, future in futures.items():
             try:
-                result[player_id] = controller.get_player_info()
+                result[player_id] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeoutError:
+                logger.error(f"Timeout getting player info for {player_id}")
             except Exception as e:
                 logger.error(f"Error getting player info for {player_id}: {e}")
         return result
@@ -1,10 +1,21 @@
 """
 Metadata handling for AudioControl3
 """
-from dataclasses import dataclass, asdict, field
-from typing import Optional, Dict, Any, List, Union
+from dataclasses import dataclass, field, fields
+from typing import Optional, Dict, Any, Sequence, Union
 import json
 import enum
+import sys
+
+try:
+    # Optional, much faster JSON encoder
+    import orjson
+except ImportError:
+    orjson = None
+
+# Use __slots__ for the records where supported (Python 3.10+): they are
+# created for every metadata update and need less memory without __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class PlayerState(enum.Enum):
@@ -17,7 +28,43 @@ class PlayerState(enum.Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+def _json_fields(record: Any) -> Dict[str, Any]:
+    """
+    Collect the fields of a Song or Player for JSON serialization
+    
+    Unlike dataclasses.asdict() this doesn't copy nested values.
+    
+    Args:
+        record: Song or Player instance
+        
+    Returns:
+        Dictionary of all fields that are not None, with enums replaced by
+        their values
+    """
+    result = {}
+    for name in record._FIELD_NAMES:
+        value = getattr(record, name)
+        if value is not None:
+            result[name] = value.value if isinstance(value, enum.Enum) else value
+    return result
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """
+    Encode a dictionary as compact UTF-8 JSON, using orjson if available
+    
+    Args:
+        data: The dictionary to encode
+        
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode()
+
+
+@dataclass(**_SLOTS)
 class Song:
     """
     Class representing metadata for a song/track
@@ -43,12 +90,19 @@ class Song:
         Returns:
             JSON string representation of the song metadata
         """
-        # Filter out None values
-        result = {k: v for k, v in asdict(self).items() if v is not None}
-        return json.dumps(result)
+        return _dumps(_json_fields(self)).decode()
+    
+    def to_json_bytes(self) -> bytes:
+        """
+        Convert song metadata to UTF-8 encoded JSON
+        
+        Returns:
+            JSON representation of the song metadata, ready to be sent
+        """
+        return _dumps(_json_fields(self))
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Player:
     """
     Class representing metadata for a media player
@@ -56,14 +110,19 @@ class Player:
     name: str  # Name of the player (required)
     player_id: Optional[str] = None  # Unique identifier for the player
     type: Optional[str] = None  # Type of player (e.g., "mpd", "spotify", "bluetooth")
-    state: Union[PlayerState, str] = PlayerState.UNKNOWN  # Current state (e.g., "playing", "paused", "stopped")
+    state: Union[PlayerState, str] = PlayerState.UNKNOWN  # Current state (e.g., "playing", "paused", "stopped"), stored as string
     volume: Optional[int] = None  # Current volume level (0-100)
     muted: Optional[bool] = None  # Whether the player is muted
-    capabilities: Optional[List[str]] = None  # Player capabilities (e.g., ["play", "pause", "next"])
+    capabilities: Optional[Sequence[str]] = None  # Player capabilities (e.g., ("play", "pause", "next")), may be shared between instances
     active: Optional[bool] = None  # Whether this player is the currently active one
     position: Optional[float] = None  # Current playback position in seconds
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self):
+        """Store the state as its string value, so it doesn't have to be converted later"""
+        if isinstance(self.state, enum.Enum):
+            self.state = self.state.value
+
     def to_json(self) -> str:
         """
         Convert player metadata to JSON string
@@ -71,6 +130,18 @@ class Player:
         Returns:
             JSON string representation of the player metadata
         """
-        # Filter out None values
-        result = {k: v for k, v in asdict(self).items() if v is not None}
-        return json.dumps(result)
\ No newline at end of file
+        return _dumps(_json_fields(self)).decode()
+    
+    def to_json_bytes(self) -> bytes:
+        """
+        Convert player metadata to UTF-8 encoded JSON
+        
+        Returns:
+            JSON representation of the player metadata, ready to be sent
+        """
+        return _dumps(_json_fields(self))
+
+
+# Field names in definition order, for code that iterates over all fields
+Song._FIELD_NAMES = tuple(f.name for f in fields(Song))
+Player._FIELD_NAMES = tuple(f.name for f in fields(Player))
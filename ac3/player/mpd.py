@@ -6,11 +6,16 @@ interface for controlling Music Player Daemon (MPD) servers.
 """
 
 import logging
+import os
+import select
+import selectors
+import socket
 import threading
 import time
-from typing import Optional, Dict, Any, List
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, List, NamedTuple, Set, Tuple
 import mpd  # from python-mpd2 package
-from ac3.player.player_controller import PlayerController, LoopMode, PlayerState
+from ac3.player.player_controller import PlayerController, LoopMode, PlayerState, PlayerSnapshot
 from ac3.metadata import Player, Song
 
 logger = logging.getLogger("ac3.player.mpd")
@@ -24,6 +29,598 @@ MPD_STATE_MAP = {
     "stop": PlayerState.STOPPED
 }
 
+# MPD state to the state string stored in Player objects
+_MPD_STATE_VALUES = {mpd_state: state.value for mpd_state, state in MPD_STATE_MAP.items()}
+
+# Bits of _StatusView.flags
+_FLAG_RANDOM = 1
+_FLAG_REPEAT = 2
+_FLAG_SINGLE = 4
+_FLAG_UPDATING = 8
+_FLAG_PLAYING = 16
+_FLAGS_LOOP = _FLAG_REPEAT | _FLAG_SINGLE
+
+# Loop mode for MPD's repeat and single flags, single only matters with repeat
+_LOOP_FROM_FLAGS = {
+    0: LoopMode.NONE,
+    _FLAG_SINGLE: LoopMode.NONE,
+    _FLAG_REPEAT | _FLAG_SINGLE: LoopMode.TRACK,
+    _FLAG_REPEAT: LoopMode.PLAYLIST,
+}
+
+# Values of MPD's repeat and single flags for each loop mode
+_LOOP_TO_FLAGS = {
+    LoopMode.NONE: (0, 0),
+    LoopMode.TRACK: (1, 1),
+    LoopMode.PLAYLIST: (1, 0),
+}
+
+# Snapshot while the status isn't available
+_UNKNOWN_SNAPSHOT = PlayerSnapshot(
+    state=PlayerState.UNKNOWN.value, shuffle=False, loop=LoopMode.NONE,
+    updating=False, active=False
+)
+
+# Errors that mean the connection to MPD is gone, python-mpd2 raises its own
+# ConnectionError for most of them but passes on resets while reading
+_CONNECTION_ERRORS = (mpd.ConnectionError, ConnectionError)
+
+# Time to wait for further changes after an idle wake-up, MPD often reports
+# related changes (e.g. player and mixer) in quick succession
+_IDLE_DEBOUNCE = 0.02
+
+# MPD subsystems that affect the player, the playlist changes the
+# capabilities as they depend on the playlist length
+_HANDLED_SUBSYSTEMS = frozenset(("player", "mixer", "options", "playlist", "update"))
+
+# Seconds after a successful command in which the connection is considered
+# healthy without a ping
+_HEALTHY_TIME = 0.5
+
+# Default maximum age in seconds of a status to use it instead of asking
+# MPD again
+_STATUS_MAX_AGE = 0.5
+
+# Seconds without traffic before TCP keepalive probes start, so dead
+# connections are noticed without waiting for the kernel default of 2 hours
+_KEEPALIVE_IDLE = 30
+
+# Commands that only read from MPD, all others may change the status
+_READ_ONLY_COMMANDS = frozenset(("ping", "status", "currentsong"))
+
+# Capabilities as bits, so capability sets can be built and compared
+# without allocating lists or sets on every event
+_CAP_BITS = {cap: 1 << bit for bit, cap in enumerate((
+    PlayerController.CAP_PLAY, PlayerController.CAP_PAUSE, PlayerController.CAP_PLAYPAUSE,
+    PlayerController.CAP_STOP, PlayerController.CAP_POSITION,
+    PlayerController.CAP_LENGTH, PlayerController.CAP_VOLUME, PlayerController.CAP_MUTE,
+    PlayerController.CAP_SHUFFLE, PlayerController.CAP_LOOP, PlayerController.CAP_PLAYLISTS,
+    PlayerController.CAP_QUEUE, PlayerController.CAP_METADATA, PlayerController.CAP_SEARCH,
+    PlayerController.CAP_BROWSE,
+    # Dynamic capabilities, added depending on the playlist and the track
+    PlayerController.CAP_PREVIOUS, PlayerController.CAP_NEXT, PlayerController.CAP_SEEK
+))}
+_PREV_BIT = _CAP_BITS[PlayerController.CAP_PREVIOUS]
+_NEXT_BIT = _CAP_BITS[PlayerController.CAP_NEXT]
+_SEEK_BIT = _CAP_BITS[PlayerController.CAP_SEEK]
+_BASE_MASK = sum(_CAP_BITS.values()) & ~(_PREV_BIT | _NEXT_BIT | _SEEK_BIT)
+
+
+def _capabilities_from_mask(mask: int) -> List[str]:
+    """
+    Convert a capability bitmask to a list of capabilities
+    
+    Args:
+        mask: Bitmask of capabilities
+        
+    Returns:
+        List of capabilities whose bits are set in the mask
+    """
+    return [cap for cap, bit in _CAP_BITS.items() if mask & bit]
+
+
+def _parse_number(convert, value, default):
+    """
+    Convert a value from MPD to a number
+    
+    Args:
+        convert: Conversion function (int or float)
+        value: Value to convert, may be None
+        default: Value to return if the value is missing or invalid
+        
+    Returns:
+        The converted value, or the default
+    """
+    if value is None:
+        return default
+    try:
+        return convert(value)
+    except (ValueError, TypeError):
+        return default
+
+
+# Marker for status fields that have not been converted yet
+_UNPARSED = object()
+
+
+class _StatusView:
+    """
+    Wrapper around an MPD status dictionary
+    
+    Numeric fields are converted once, when they are first used, so the
+    event listener and the capability update can share the results.
+    """
+    
+    __slots__ = ("_d", "_volume", "_song_pos", "_playlist_length", "_elapsed", "_duration", "_flags")
+    
+    def __init__(self, d: Optional[Dict[str, Any]]):
+        self._d = d or {}
+        self._volume = _UNPARSED
+        self._song_pos = _UNPARSED
+        self._playlist_length = _UNPARSED
+        self._elapsed = _UNPARSED
+        self._duration = _UNPARSED
+        self._flags = _UNPARSED
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a raw status field"""
+        return self._d.get(key, default)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._d
+    
+    def __bool__(self) -> bool:
+        return bool(self._d)
+    
+    @property
+    def volume(self) -> int:
+        """Volume (0-100), 0 if unknown"""
+        if self._volume is _UNPARSED:
+            self._volume = _parse_number(int, self._d.get("volume"), 0)
+        return self._volume
+    
+    @property
+    def song_pos(self) -> int:
+        """Position of the current song in the playlist, -1 if none"""
+        if self._song_pos is _UNPARSED:
+            self._song_pos = _parse_number(int, self._d.get("song"), -1)
+        return self._song_pos
+    
+    @property
+    def playlist_length(self) -> int:
+        """Number of songs in the playlist"""
+        if self._playlist_length is _UNPARSED:
+            self._playlist_length = _parse_number(int, self._d.get("playlistlength"), 0)
+        return self._playlist_length
+    
+    @property
+    def elapsed(self) -> Optional[float]:
+        """Elapsed time of the current song in seconds, None if unknown"""
+        if self._elapsed is _UNPARSED:
+            self._elapsed = _parse_number(float, self._d.get("elapsed"), None)
+        return self._elapsed
+    
+    @property
+    def duration(self) -> Optional[float]:
+        """Duration of the current song in seconds, None if unknown"""
+        if self._duration is _UNPARSED:
+            self._duration = _parse_number(float, self._d.get("duration"), None)
+        return self._duration
+    
+    @property
+    def flags(self) -> int:
+        """Bitmask of the _FLAG_* options and states that are set"""
+        if self._flags is _UNPARSED:
+            d = self._d
+            self._flags = (
+                (_FLAG_RANDOM if d.get("random") == "1" else 0)
+                | (_FLAG_REPEAT if d.get("repeat") == "1" else 0)
+                | (_FLAG_SINGLE if d.get("single") == "1" else 0)
+                # MPD indicates database update with an "updating_db" key
+                | (_FLAG_UPDATING if "updating_db" in d else 0)
+                # Compare with raw MPD state string, not enum
+                | (_FLAG_PLAYING if d.get("state") == "play" else 0)
+            )
+        return self._flags
+
+
+class _State(NamedTuple):
+    """
+    MPD status together with the time it was fetched
+    
+    The whole tuple is replaced on updates, so readers always get a status
+    together with the time it was fetched.
+    """
+    status: _StatusView
+    timestamp: float
+    # True while the event listener updates the status on every change
+    live: bool = False
+    
+    def position(self, now: float) -> Optional[float]:
+        """
+        Get the playback position at a given time
+        
+        Args:
+            now: Monotonic time to get the position for
+            
+        Returns:
+            Position in seconds, or None if not available
+        """
+        elapsed = self.status.elapsed
+        if elapsed is not None and self.status.get("state") == "play":
+            elapsed += now - self.timestamp
+        return elapsed
+
+
+# State before a status has been fetched
+_NO_STATE = _State(_StatusView(None), 0.0)
+
+
+def _set_keepalive_idle(client: mpd.MPDClient):
+    """
+    Shorten the keepalive idle time of a TCP connection to MPD
+    
+    python-mpd2 already disables Nagle's algorithm and enables keepalive on
+    TCP connections. Unix socket connections are left alone.
+    
+    Args:
+        client: Connected MPD client
+    """
+    sock = client._sock
+    if not hasattr(socket, "TCP_KEEPIDLE") or sock.family not in (socket.AF_INET, socket.AF_INET6):
+        return
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, _KEEPALIVE_IDLE)
+    except OSError as e:
+        logger.debug("Could not set TCP keepalive idle time: %s", e)
+
+
+class _MPDConnectionPool:
+    """
+    Pool of MPD connections shared by all MPD player controllers
+    
+    Connections are kept per server. A connection is used by one thread at a
+    time and returned to the pool afterwards, so controllers don't need to
+    keep their own connections open.
+    """
+    
+    def __init__(self, max_idle: int = 2, max_idle_time: float = 30.0):
+        """
+        Initialize the pool
+        
+        Args:
+            max_idle: Default maximum number of idle connections kept per
+                server
+            max_idle_time: Seconds after which an idle connection isn't reused,
+                MPD closes idle connections after its connection_timeout
+        """
+        self._lock = threading.Lock()
+        self._idle: Dict[Tuple, List[Tuple[mpd.MPDClient, float]]] = {}
+        self._max_idle = max_idle
+        self._max_idle_per_server: Dict[Tuple, int] = {}
+        self._max_idle_time = max_idle_time
+        
+    def set_max_idle(self, key: Tuple, max_idle: int):
+        """
+        Keep more idle connections to a server than the default
+        
+        Controllers that run many commands in parallel, e.g. from several
+        API requests, avoid opening a new connection for each of them. If
+        controllers of the same server ask for different sizes, the largest
+        one is used.
+        
+        Args:
+            key: Tuple of host, port, password and timeout of the server
+            max_idle: Maximum number of idle connections kept for the server
+        """
+        with self._lock:
+            current = self._max_idle_per_server.get(key, self._max_idle)
+            self._max_idle_per_server[key] = max(current, max_idle)
+        
+    def acquire(self, key: Tuple) -> mpd.MPDClient:
+        """
+        Get a connection to a server, reusing an idle one if possible
+        
+        Args:
+            key: Tuple of host, port, password and timeout of the server
+            
+        Returns:
+            Connected MPD client
+            
+        Raises:
+            Exception: If no connection to the server could be opened
+        """
+        now = time.monotonic()
+        client = None
+        stale = []
+        with self._lock:
+            idle = self._idle.get(key)
+            # The most recently released connection is at the end
+            while idle:
+                candidate, released = idle.pop()
+                if now - released < self._max_idle_time:
+                    client = candidate
+                    break
+                stale.append(candidate)
+                
+        for candidate in stale:
+            self._close(candidate)
+            
+        if client is None:
+            host, port, password, timeout = key
+            client = mpd.MPDClient()
+            client.timeout = timeout
+            client.connect(host, port)
+            _set_keepalive_idle(client)
+            if password:
+                try:
+                    client.password(password)
+                except Exception:
+                    self._close(client)
+                    raise
+                    
+        return client
+    
+    def release(self, key: Tuple, client: mpd.MPDClient, reusable: bool = True):
+        """
+        Return a connection to the pool
+        
+        Args:
+            key: Key the connection was acquired with
+            client: The MPD client
+            reusable: False if the connection is broken and should be closed
+        """
+        if reusable:
+            with self._lock:
+                idle = self._idle.setdefault(key, [])
+                if len(idle) < self._max_idle_per_server.get(key, self._max_idle):
+                    idle.append((client, time.monotonic()))
+                    return
+        self._close(client)
+        
+    @contextmanager
+    def connection(self, key: Tuple):
+        """
+        Borrow a connection for the duration of a with block
+        
+        Args:
+            key: Tuple of host, port, password and timeout of the server
+            
+        Yields:
+            Connected MPD client
+        """
+        client = self.acquire(key)
+        reusable = False
+        try:
+            yield client
+            reusable = True
+        except mpd.CommandError:
+            # MPD refused the command, the connection itself is fine
+            reusable = True
+            raise
+        finally:
+            self.release(key, client, reusable)
+            
+    def close_idle(self, key: Tuple):
+        """
+        Close all idle connections to a server
+        
+        Args:
+            key: Tuple of host, port, password and timeout of the server
+        """
+        with self._lock:
+            idle = self._idle.pop(key, [])
+        for client, _released in idle:
+            self._close(client)
+            
+    @staticmethod
+    def _close(client: mpd.MPDClient):
+        """Close a connection, ignoring errors"""
+        try:
+            client.disconnect()
+        except (mpd.MPDError, OSError):
+            pass
+
+
+# Connections shared by all MPD player controllers
+_POOL = _MPDConnectionPool()
+
+
+class _MPDMultiplexer:
+    """
+    Single thread that waits for the MPD events of all MPD player controllers
+    
+    Every controller keeps one connection in MPD idle mode. The thread waits
+    for all of them with one selector and lets a controller handle the answer
+    when its connection becomes readable.
+    """
+    
+    # Seconds to wait before connecting again after a failed connection
+    # attempt or a lost connection
+    RETRY_CONNECT = 2.0
+    RETRY_LOST = 1.0
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._selector = None
+        self._wakeup_r = None
+        self._wakeup_w = None
+        # Controllers to add (None) or remove (event set when done), taken
+        # over by the thread
+        self._pending: Dict[Any, Optional[threading.Event]] = {}
+        
+    def register(self, controller):
+        """
+        Start listening for the events of a controller
+        
+        Args:
+            controller: The MPD player controller
+        """
+        with self._lock:
+            self._pending[controller] = None
+            if self._thread is None:
+                self._start_locked()
+        self._wake()
+        
+    def unregister(self, controller, timeout: float = 2.0):
+        """
+        Stop listening for the events of a controller
+        
+        The controller's connection leaves idle mode and is returned to the
+        pool by the thread.
+        
+        Args:
+            controller: The MPD player controller
+            timeout: Maximum time in seconds to wait for the thread
+        """
+        done = threading.Event()
+        with self._lock:
+            if self._thread is None:
+                return
+            self._pending[controller] = done
+            thread = self._thread
+        self._wake()
+        
+        # Listeners may disconnect a controller from the thread itself
+        if threading.current_thread() is not thread:
+            done.wait(timeout)
+            
+    def _start_locked(self):
+        """Start the thread, the lock must be held"""
+        if self._selector is None:
+            self._selector = selectors.DefaultSelector()
+            self._wakeup_r, self._wakeup_w = os.pipe()
+            os.set_blocking(self._wakeup_r, False)
+            self._selector.register(self._wakeup_r, selectors.EVENT_READ)
+            
+        self._thread = threading.Thread(
+            target=self._run,
+            daemon=True,
+            name="MPD-EventListener"
+        )
+        self._thread.start()
+        
+    def _wake(self):
+        """Wake up the thread to take over added and removed controllers"""
+        try:
+            os.write(self._wakeup_w, b"\0")
+        except OSError:
+            pass
+            
+    def _drain_wakeup(self):
+        """Discard pending wake-ups of the thread"""
+        try:
+            while os.read(self._wakeup_r, 64):
+                pass
+        except OSError:
+            pass
+            
+    def _run(self):
+        """
+        Background thread that listens for MPD events using idle mode
+        
+        This uses MPD's idle mode to receive notifications about changes
+        without polling. When changes are received, the controller processes
+        them and notifies its registered listeners.
+        """
+        logger.info("MPD event listener thread started")
+        
+        # Controllers with a connection in idle mode and its file descriptor
+        connected: Dict[Any, int] = {}
+        # Controllers without a connection and when to connect them
+        retry_at: Dict[Any, float] = {}
+        
+        while True:
+            # Take over added and removed controllers
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                
+            for controller, done in pending.items():
+                if done is None:
+                    if controller not in connected:
+                        retry_at[controller] = 0.0
+                else:
+                    retry_at.pop(controller, None)
+                    if controller in connected:
+                        self._close(controller, connected.pop(controller))
+                    done.set()
+                    
+            # Stop when there is nothing left to listen to
+            with self._lock:
+                if not self._pending and not connected and not retry_at:
+                    self._thread = None
+                    break
+                    
+            # Connect controllers that are due
+            now = time.monotonic()
+            for controller, when in list(retry_at.items()):
+                if when > now:
+                    continue
+                fd = self._open(controller)
+                if fd is None:
+                    retry_at[controller] = now + self.RETRY_CONNECT
+                else:
+                    del retry_at[controller]
+                    connected[controller] = fd
+                    
+            timeout = None
+            if retry_at:
+                timeout = max(0.0, min(retry_at.values()) - time.monotonic())
+                
+            for key, _events in self._selector.select(timeout):
+                controller = key.data
+                if controller is None:
+                    self._drain_wakeup()
+                elif not controller._handle_idle_response():
+                    # Connection lost, open a new one later
+                    self._selector.unregister(connected.pop(controller))
+                    controller._release_event_client(reusable=False)
+                    retry_at[controller] = time.monotonic() + self.RETRY_LOST
+                    
+        logger.info("MPD event listener thread stopped")
+        
+    def _open(self, controller) -> Optional[int]:
+        """
+        Open the event connection of a controller and put it into idle mode
+        
+        Args:
+            controller: The MPD player controller
+            
+        Returns:
+            File descriptor of the connection, or None if it failed
+        """
+        if not controller._open_event_client():
+            return None
+        try:
+            fd = controller._event_client.fileno()
+            controller._send_idle()
+            self._selector.register(fd, selectors.EVENT_READ, controller)
+            return fd
+        except (mpd.MPDError, OSError) as e:
+            logger.warning(f"Failed to enter MPD idle mode: {e}")
+            controller._release_event_client(reusable=False)
+            return None
+            
+    def _close(self, controller, fd: int):
+        """
+        Leave idle mode and return the event connection of a controller
+        
+        Args:
+            controller: The MPD player controller
+            fd: File descriptor of the connection
+        """
+        self._selector.unregister(fd)
+        try:
+            controller._read_idle_response(cancel=True)
+            controller._release_event_client()
+        except (mpd.MPDError, OSError):
+            controller._release_event_client(reusable=False)
+
+
+# Event listener thread shared by all MPD player controllers
+_MULTIPLEXER = _MPDMultiplexer()
+
 
 class MPDPlayerController(PlayerController):
     """
@@ -33,6 +630,14 @@ class MPDPlayerController(PlayerController):
     Music Player Daemon (MPD) servers.
     """
     
+    __slots__ = (
+        "_host", "_port", "_password", "_timeout", "_pool_key", "_connected", "_last_ok",
+        "_is_muted", "_volume_before_mute", "_cap_mask", "_capabilities",
+        "_last_song_pos", "_last_playlist_length", "_player_cache", "_song_cache", "_snapshot_cache",
+        "_event_client", "_state", "_state_expired", "_status_generation", "_status_max_age", "_polled_state",
+        "_status_lock", "_pending_update_id",
+    )
+    
     def __init__(self, player_id: str = "mpd", configdata: Optional[Dict[str, Any]] = None):
         """
         Initialize the MPD player controller
@@ -47,6 +652,8 @@ class MPDPlayerController(PlayerController):
         port = 6600
         password = None
         timeout = 10.0
+        status_max_age = _STATUS_MAX_AGE
+        conn_pool_max_size = None
         
         # Process configdata if provided
         if configdata is not None:
@@ -56,6 +663,8 @@ class MPDPlayerController(PlayerController):
             port = configdata.get("port", port)
             password = configdata.get("password", password)
             timeout = configdata.get("timeout", timeout)
+            status_max_age = configdata.get("status_max_age", status_max_age)
+            conn_pool_max_size = configdata.get("conn_pool_max_size", conn_pool_max_size)
             
         # Initialize the base class
         super().__init__(player_id, name, configdata)
@@ -65,37 +674,56 @@ class MPDPlayerController(PlayerController):
         self._port = port
         self._password = password
         self._timeout = timeout
-        self._client = None
+        self._pool_key = (host, port, password, timeout)
+        if conn_pool_max_size is not None:
+            _POOL.set_max_idle(self._pool_key, int(conn_pool_max_size))
+        self._connected = False
+        # When a command last succeeded
+        self._last_ok = 0.0
         self._is_muted = False
         self._volume_before_mute = 100
+        # Job ID of the last database update until it has finished
+        self._pending_update_id = None
         
-        # Define base capabilities without dynamic ones (will be added conditionally)
-        self._base_capabilities = [
-            self.CAP_PLAY, self.CAP_PAUSE, self.CAP_PLAYPAUSE,
-            self.CAP_STOP, self.CAP_POSITION, 
-            self.CAP_LENGTH, self.CAP_VOLUME, self.CAP_MUTE, 
-            self.CAP_SHUFFLE, self.CAP_LOOP, self.CAP_PLAYLISTS, 
-            self.CAP_QUEUE, self.CAP_METADATA, self.CAP_SEARCH, 
-            self.CAP_BROWSE
-        ]
-        
-        # Current capabilities (will be updated as needed)
-        self._capabilities = self._base_capabilities.copy()
+        # Current capabilities, starting with the base capabilities without
+        # dynamic ones (will be added conditionally)
+        self._cap_mask = _BASE_MASK
+        self._capabilities = _capabilities_from_mask(self._cap_mask)
         
         # Last known playlist position for capability updates
         self._last_song_pos = None
         self._last_playlist_length = None
         
-        # Thread control variables
-        self._event_listener_thread = None
+        # Last results of get_player_info and get_current_song with the
+        # status fields they were created from
+        self._player_cache = None
+        self._song_cache = None
+        # Last snapshot with the status it was created from
+        self._snapshot_cache = None
+        
+        # Connection used in idle mode by the shared event listener thread
+        # and its state, only written by that thread
         self._event_client = None
-        self._thread_running = False
-        self._last_known_state = {}
+        self._state = _NO_STATE
+        # Set after our own commands until the listener has seen a new status
+        self._state_expired = False
+        # Counts the expiries, so the listener doesn't clear an expiry that
+        # happened after it fetched its status
+        self._status_generation = 0
+        
+        # Status fetched by the getters, shared by the getters called
+        # within status_max_age seconds
+        self._status_max_age = status_max_age
+        self._polled_state = _NO_STATE
+        # Held while a getter fetches the status, so concurrent getters wait
+        # for its result instead of fetching it as well, and while the
+        # status is expired
+        self._status_lock = threading.Lock()
         
         # Try to connect to MPD server during initialization
         try:
             self._connect()
-            # Start the event listener thread
+            # Start listening for events
             self._start_event_listener()
         except Exception as e:
             logger.warning(f"Could not connect to MPD server: {e}")
@@ -105,165 +733,168 @@ class MPDPlayerController(PlayerController):
         self.disconnect()
         
     def _start_event_listener(self):
-        """Start background thread to listen for MPD events"""
-        if self._event_listener_thread is None or not self._event_listener_thread.is_alive():
-            self._thread_running = True
-            self._event_listener_thread = threading.Thread(
-                target=self._event_listener_loop,
-                daemon=True,
-                name="MPD-EventListener"
-            )
-            self._event_listener_thread.start()
-            logger.info("MPD event listener thread started")
+        """Listen for MPD events in the shared event listener thread"""
+        _MULTIPLEXER.register(self)
             
     def _stop_event_listener(self):
-        """Stop the event listener thread"""
-        if self._event_listener_thread and self._event_listener_thread.is_alive():
-            self._thread_running = False
+        """Stop listening for MPD events"""
+        _MULTIPLEXER.unregister(self)
+    
+    def _open_event_client(self) -> bool:
+        """
+        Connect the event listener and get the initial state
+        
+        Returns:
+            True if connected successfully, False otherwise
+        """
+        logger.debug("Event listener connecting to MPD")
+        try:
+            # Get a connection from the pool
+            self._event_client = _POOL.acquire(self._pool_key)
+        except (mpd.MPDError, OSError) as e:
+            logger.warning(f"Failed to connect event client: {e}")
+            return False
             
-            # Unblock the idle call if there is an event client
-            if self._event_client:
-                try:
-                    self._event_client.noidle()
-                except Exception:
-                    pass
-
-                try:
-                    self._event_client.close()
-                except Exception:
-                    pass
-
-                self._event_client = None
-                
-            # Wait for the thread to terminate
-            self._event_listener_thread.join(2.0)  # Wait up to 2 seconds
-                
-            logger.info("MPD event listener thread stopped")
+        # Get initial state
+        try:
+            generation = self._status_generation
+            self._state = _State(_StatusView(self._event_client.status()), time.monotonic(), True)
+            self._status_refreshed(generation)
+        except (mpd.MPDError, OSError) as e:
+            logger.error(f"Error getting initial state: {e}")
+            self._state = _NO_STATE
+            
+        return True
     
-    def _event_listener_loop(self):
+    def _release_event_client(self, reusable: bool = True):
         """
-        Background thread that listens for MPD events using idle mode
+        Return the connection of the event listener thread to the pool
         
-        This method runs in a separate thread and uses MPD's idle mode to receive
-        notifications about changes without polling. When changes are received,
-        it processes them and notifies any registered listeners.
+        Args:
+            reusable: False if the connection is broken and should be closed
         """
-        # Create a separate MPD client for this thread
-        self._event_client = mpd.MPDClient()
-        self._event_client.timeout = self._timeout
-
-        while self._thread_running:
-            try:
-                # Ensure we have a connection
-                try:
-                    # Try to ping to check if connection is alive
-                    self._event_client.ping()
-                except Exception:
-                    # Need to (re)connect
-                    logger.debug("Event listener connecting to MPD")
-                    try:
-                        # Close any existing connection first
-                        try:
-                            self._event_client.close()
-                        except Exception:
-                            pass
-
-                        # Create a new connection
-                        self._event_client = mpd.MPDClient()
-                        self._event_client.timeout = self._timeout
-                        self._event_client.connect(self._host, self._port)
-                        if self._password:
-                            self._event_client.password(self._password)
-
-                        # Get initial state
-                        try:
-                            self._last_known_state = {
-                                "status": self._event_client.status(),
-                                "currentsong": self._event_client.currentsong(),
-                            }
-                        except Exception as e:
-                            logger.error(f"Error getting initial state: {e}")
-                            self._last_known_state = {}
-
-                    except Exception as e:
-                        logger.warning(f"Failed to connect event client: {e}")
-                        time.sleep(2)  # Wait before retrying
-                        continue  # Skip to next iteration to retry connection
-
-                # Wait for events (this blocks until something changes or noidle is called)
-                logger.debug("Entering MPD idle mode")
-                try:
-                    changes = self._event_client.idle()
-
-                    # Handle unexpected return value
-                    if isinstance(changes, str) and ":" in changes:
-                        logger.warning(f"Unexpected return value from MPD idle: {changes}")
-                        # Simulate player and mixer changes to force a status update
-                        changes = ["player", "mixer"]
-
-                    logger.debug(f"MPD reports changes: {changes}")
-
-                    # Process the reported changes
-                    if not self._thread_running:
-                        break
-
-                    self._process_mpd_changes(changes)
-                except mpd.base.ConnectionError as e:
-                    logger.warning(f"MPD connection lost during idle: {e}")
-                    time.sleep(1)  # Wait before reconnecting
-                    continue  # Skip to next iteration to reconnect
-                except Exception as e:
-                    logger.error(f"Error during idle: {e}")
-                    time.sleep(1)
-                    continue
+        if self._event_client is not None:
+            _POOL.release(self._pool_key, self._event_client, reusable)
+            self._event_client = None
+        # Changes aren't seen any more
+        self._state = self._state._replace(live=False)
+    
+    def _send_idle(self):
+        """Put the event connection into MPD idle mode"""
+        self._event_client._write_command("idle")
+    
+    def _read_idle_response(self, cancel: bool = False) -> List[str]:
+        """
+        Read the answer to the idle command
+        
+        Args:
+            cancel: Leave idle mode first, MPD ignores this if it already answered
+            
+        Returns:
+            List of subsystems that changed
+        """
+        client = self._event_client
+        if cancel:
+            client._write_command("noidle")
+            
+        # Lines look like "changed: player"
+        return [line.partition(": ")[2] for line in client._read_lines()]
+    
+    def _handle_idle_response(self) -> bool:
+        """
+        Handle the answer to the idle command and enter idle mode again
+        
+        Called by the event listener thread when the event connection is
+        readable.
+        
+        Returns:
+            False if the connection was lost and has to be opened again
+        """
+        try:
+            changes = self._read_idle_response()
+            if changes:
+                self._handle_changes(changes)
+            self._send_idle()
+            return True
+        except _CONNECTION_ERRORS as e:
+            logger.warning(f"MPD connection lost during idle: {e}")
+        except Exception as e:
+            # Catch-all for any unexpected errors
+            logger.error(f"Error in MPD event listener: {e}")
+        return False
+    
+    def _coalesce_changes(self, changes) -> Set[str]:
+        """
+        Collect changes that MPD reports shortly after an idle wake-up
+        
+        Idle mode is entered again and given a short time to report further
+        changes before it is cancelled with noidle.
+        
+        Args:
+            changes: Subsystems that changed (from MPD idle command)
+            
+        Returns:
+            Set of all subsystems that changed
+        """
+        changes = set(changes)
+        
+        self._send_idle()
+        # If nothing new arrives, leave idle mode again. MPD answers with any
+        # changes that arrived in the meantime.
+        readable, _, _ = select.select([self._event_client], [], [], _IDLE_DEBOUNCE)
+        changes.update(self._read_idle_response(cancel=not readable))
+            
+        return changes
+    
+    def _handle_changes(self, changes):
+        """
+        Handle an answer to the idle command
+        
+        Args:
+            changes: Subsystems that changed (from MPD idle command)
+        """
+        # Process changes that follow right after together
+        changes = self._coalesce_changes(changes)
 
-            except Exception as e:
-                # Catch-all for any unexpected errors
-                logger.error(f"Error in MPD event listener: {e}")
-                time.sleep(1)
+        logger.debug(f"MPD reports changes: {changes}")
 
-        # Clean up
-        logger.debug("MPD event listener loop exiting")
-        try:
-            self._event_client.close()
-        except Exception:
-            pass
-        self._event_client = None
+        # Process the reported changes
+        self._process_mpd_changes(changes)
     
     def _process_mpd_changes(self, changes):
         """
         Process MPD change notifications and trigger appropriate callbacks
 
         Args:
-            changes: List of subsystems that changed (from MPD idle command)
+            changes: Set of subsystems that changed (from MPD idle command)
         """
+        # Other subsystems (e.g. database or sticker) don't need any MPD
+        # round trips
+        if changes.isdisjoint(_HANDLED_SUBSYSTEMS):
+            return
+
         try:
-            # These are the MPD subsystems we're interested in
-            need_status = False
-            need_currentsong = False
-
-            # Determine what information we need to fetch based on the changes
-            for subsystem in changes:
-                if subsystem in ["player", "mixer", "options"]:
-                    need_status = True
-                if subsystem in ["player"]:
-                    need_currentsong = True
-
-            # Fetch the needed information
-            current_status = {}
-            current_song = {}
-
-            if need_status:
-                try:
-                    current_status = self._event_client.status()
-                except Exception as e:
-                    logger.error(f"Error getting status: {e}")
+            # All handled changes are compared against a new status
+            try:
+                generation = self._status_generation
+                current_status = self._event_client.status()
+            except mpd.CommandError as e:
+                logger.error(f"Error getting status: {e}")
+                return
 
-            if need_currentsong:
-                try:
-                    current_song = self._event_client.currentsong()
-                except Exception as e:
-                    logger.error(f"Error getting current song: {e}")
+            # Numeric fields are converted only once from here on
+            current_status = _StatusView(current_status)
+            last_status = self._state.status
+
+            # Update our last known state first, the getters called for the
+            # notifications use it
+            self._state = _State(current_status, time.monotonic(), True)
+            self._status_refreshed(generation)
+
+            # Forget the cached results, they are created from a new status
+            self._player_cache = None
+            if not changes.isdisjoint(("player", "playlist")):
+                self._song_cache = None
 
             # Process player state changes
             if "player" in changes:
@@ -272,17 +903,22 @@ class MPDPlayerController(PlayerController):
                 self._notify_player_state_change(player)
 
                 # Process song change
-                old_songid = self._last_known_state.get("status", {}).get("songid")
+                old_songid = last_status.get("songid")
                 new_songid = current_status.get("songid")
 
-                if old_songid != new_songid:
+                # Starting or stopping playback changes the current song
+                # too, as no song is reported while stopped
+                was_stopped = last_status.get("state") == "stop"
+                is_stopped = current_status.get("state") == "stop"
+
+                if old_songid != new_songid or was_stopped != is_stopped:
                     song = self.get_current_song()
                     self._notify_song_change(song)
 
             # Process volume changes
             if "mixer" in changes:
-                old_volume = int(self._last_known_state.get("status", {}).get("volume", "0"))
-                new_volume = int(current_status.get("volume", "0"))
+                old_volume = last_status.volume
+                new_volume = current_status.volume
 
                 if old_volume != new_volume:
                     self._notify_volume_change(new_volume)
@@ -290,21 +926,24 @@ class MPDPlayerController(PlayerController):
             # Process playback position changes
             if "player" in changes:
                 if current_status.get("state") == "play":  # MPD uses raw "play" string
-                    try:
-                        position = float(current_status.get("elapsed", 0))
+                    position = current_status.elapsed
+                    if position is not None:
                         self._notify_position_change(position)
-                    except (ValueError, TypeError):
-                        pass
 
-            # Update our last known state
-            if current_status:
-                self._last_known_state["status"] = current_status
-            if current_song:
-                self._last_known_state["currentsong"] = current_song
+            # Process database update start and end
+            if "update" in changes:
+                updating = bool(current_status.flags & _FLAG_UPDATING)
+                if updating != bool(last_status.flags & _FLAG_UPDATING):
+                    if not updating:
+                        self._pending_update_id = None
+                    self._notify_update_status_change(updating)
 
             # Update capabilities based on playlist position
             self._update_capabilities(current_status)
 
+        except _CONNECTION_ERRORS:
+            # The event listener reconnects
+            raise
         except Exception as e:
             logger.error(f"Error processing MPD changes: {e}")
 
@@ -313,76 +952,48 @@ class MPDPlayerController(PlayerController):
         Dynamically update capabilities based on playlist position and track properties
         
         Args:
-            status: Current MPD status dictionary
+            status: Current MPD status as a _StatusView
         """
         try:
-            song_pos = int(status.get("song", -1))
-            playlist_length = int(status.get("playlistlength", 0))
-            
-            # Track if capabilities will change
-            old_capabilities = self._capabilities.copy()
+            song_pos = status.song_pos
+            playlist_length = status.playlist_length
             
-            # Update capabilities
-            self._capabilities = self._base_capabilities.copy()
+            # Start from the base capabilities
+            new_mask = _BASE_MASK
             
             # Add PREVIOUS capability if we're not at the first song
             if song_pos > 0:
-                self._capabilities.append(self.CAP_PREVIOUS)
+                new_mask |= _PREV_BIT
             else:
                 logging.debug("No previous song available, CAP_PREVIOUS not added")
                 
             # Add NEXT capability if we're not at the last song
             if song_pos < playlist_length - 1 and playlist_length > 0:
-                self._capabilities.append(self.CAP_NEXT)
+                new_mask |= _NEXT_BIT
             else:
                 logging.debug("No next song available, CAP_NEXT not added")
             
-            # Check if seeking is possible (track has duration and is not a stream)
-            is_seekable = False
-            
             # Seeking is possible if:
             # 1. A song is playing (state is play or pause)
             # 2. The song has a valid duration
-            # 3. The song is not a streaming URL
+            # MPD doesn't report a duration for internet radio streams. Files
+            # served over HTTP(S) do have one, and MPD can seek in them.
             if status.get("state") in ["play", "pause"] and song_pos >= 0:
-                # Check if track has duration
-                if "duration" in status:
-                    try:
-                        duration = float(status["duration"])
-                        # If we have a valid duration, seeking is probably possible
-                        # (internet streams typically don't report a duration)
-                        if duration > 0:
-                            is_seekable = True
-                    except (ValueError, TypeError):
-                        pass
-                
-                # If we still think it's seekable, check if it's a stream
-                if is_seekable and self._client and self._ensure_connected():
-                    try:
-                        current = self._client.currentsong()
-                        if current and "file" in current:
-                            # Check if file appears to be a stream URL
-                            file_path = current["file"]
-                            if file_path.startswith(("http://", "https://", "mms://", "rtsp://")):
-                                # It's a stream, so seeking is likely not possible
-                                is_seekable = False
-                    except Exception as e:
-                        logger.error(f"Error determining if track is seekable: {e}")
-            
-            # Add seeking capability if appropriate
-            if is_seekable:
-                self._capabilities.append(self.CAP_SEEK)
+                duration = status.duration
+                if duration is not None and duration > 0:
+                    new_mask |= _SEEK_BIT
             
             # If capabilities changed, notify listeners
-            if set(old_capabilities) != set(self._capabilities):
+            changed = new_mask ^ self._cap_mask
+            if changed:
+                self._cap_mask = new_mask
+                self._capabilities = _capabilities_from_mask(new_mask)
                 logger.debug(f"Capabilities changed: {self._capabilities}")
-                # Display new and rmeoved capabilities
-                added_capabilities = set(self._capabilities) - set(old_capabilities)
-                removed_capabilities = set(old_capabilities) - set(self._capabilities)
-                if added_capabilities:
-                    logger.debug(f"Added capabilities: {added_capabilities}")
-                if removed_capabilities:
-                    logger.debug(f"Removed capabilities: {removed_capabilities}")
+                # Display new and removed capabilities
+                if changed & new_mask:
+                    logger.debug(f"Added capabilities: {_capabilities_from_mask(changed & new_mask)}")
+                if changed & ~new_mask:
+                    logger.debug(f"Removed capabilities: {_capabilities_from_mask(changed & ~new_mask)}")
                 self._notify_capability_change(self._capabilities)
                 
             # Remember current position for future comparisons
@@ -392,6 +1003,95 @@ class MPDPlayerController(PlayerController):
         except Exception as e:
             logger.error(f"Error updating capabilities: {e}")
     
+    def _connection(self):
+        """
+        Borrow a connection to the MPD server from the shared pool
+        
+        Returns:
+            Context manager that yields a connected MPD client
+        """
+        return _POOL.connection(self._pool_key)
+    
+    def _command(self, name: str, *args):
+        """
+        Run an MPD command on a pooled connection
+        
+        The command is sent without checking the connection first. If the
+        connection turns out to be closed, it is retried once on a new one.
+        
+        Args:
+            name: Name of the MPD command
+            *args: Arguments of the command
+            
+        Returns:
+            Result of the command
+        """
+        try:
+            with self._connection() as client:
+                result = getattr(client, name)(*args)
+        except _CONNECTION_ERRORS as e:
+            self._drop_idle_connections(e)
+            with self._connection() as client:
+                result = getattr(client, name)(*args)
+        finally:
+            if name not in _READ_ONLY_COMMANDS:
+                self._expire_status()
+        self._last_ok = time.monotonic()
+        return result
+    
+    def _command_list(self, *commands) -> List[Any]:
+        """
+        Run several MPD commands with a single round trip
+        
+        Like _command, this is retried once on a new connection if the
+        connection turns out to be closed.
+        
+        Args:
+            *commands: Tuples of command name and arguments
+            
+        Returns:
+            List with the result of each command
+        """
+        try:
+            results = self._run_command_list(commands)
+        except _CONNECTION_ERRORS as e:
+            self._drop_idle_connections(e)
+            results = self._run_command_list(commands)
+        finally:
+            if any(name not in _READ_ONLY_COMMANDS for name, *_args in commands):
+                self._expire_status()
+        self._last_ok = time.monotonic()
+        return results
+    
+    def _run_command_list(self, commands) -> List[Any]:
+        """
+        Run several MPD commands as a command list on a pooled connection
+        
+        Args:
+            commands: Tuples of command name and arguments
+            
+        Returns:
+            List with the result of each command
+        """
+        with self._connection() as client:
+            client.command_list_ok_begin()
+            for name, *args in commands:
+                getattr(client, name)(*args)
+            return client.command_list_end()
+    
+    def _drop_idle_connections(self, error: Exception):
+        """
+        Close the idle pooled connections after a connection error
+        
+        They were most likely closed by MPD as well, e.g. after a restart.
+        
+        Args:
+            error: The connection error
+        """
+        logger.debug("MPD connection lost, reconnecting: %s", error)
+        self._last_ok = 0.0
+        _POOL.close_idle(self._pool_key)
+    
     def _connect(self) -> bool:
         """
         Connect to the MPD server
@@ -400,27 +1100,17 @@ class MPDPlayerController(PlayerController):
             True if connected successfully, False otherwise
         """
         try:
-            if self._client is None:
-                self._client = mpd.MPDClient()
-                self._client.timeout = self._timeout
+            # The connection stays in the pool for the following commands
+            self._command("ping")
+            self._connected = True
             
-            # Try to ping the server to check if we're already connected
-            try:
-                self._client.ping()
-                # We're already connected
-            except:
-                # Need to connect
-                self._client.connect(self._host, self._port)
-                if self._password:
-                    self._client.password(self._password)
-                
-                # Start the event listener if we've connected successfully
-                self._start_event_listener()
+            # Start the event listener if we've connected successfully
+            self._start_event_listener()
             
             return True
         except Exception as e:
             logger.error(f"Failed to connect to MPD server: {e}")
-            self._client = None
+            self._connected = False
             return False
     
     def _ensure_connected(self) -> bool:
@@ -430,8 +1120,16 @@ class MPDPlayerController(PlayerController):
         Returns:
             True if connected, False otherwise
         """
+        if not self._connected:
+            return False
+        
+        # No need to ask MPD if the event listener is connected or a command
+        # has just succeeded
+        if self._state.live or time.monotonic() - self._last_ok < _HEALTHY_TIME:
+            return True
+        
         try:
-            self._client.ping()
+            self._command("ping")
             return True
         except Exception as e:
             logger.warning(f"MPD connection lost: {e}")
@@ -444,14 +1142,9 @@ class MPDPlayerController(PlayerController):
         # Stop the event listener thread first
         self._stop_event_listener()
         
-        # Then close the main client connection
-        if self._client and self._ensure_connected():
-            try:
-                self._client.close()
-            except Exception as e:
-                logger.error(f"Error closing MPD connection: {e}")
-            
-        self._client = None
+        # Then close the idle connections to the server
+        self._connected = False
+        _POOL.close_idle(self._pool_key)
     
     def get_player_info(self) -> Player:
         """
@@ -469,30 +1162,34 @@ class MPDPlayerController(PlayerController):
         )
         
         # Try to get current status
-        if self._ensure_connected():
+        if self._connected:
             try:
-                status = self._client.status()
+                state = self._recent_state()
+                status = state.status
+                
+                # Reuse the last result if nothing it depends on has changed,
+                # the position is compared in whole seconds
+                elapsed = state.position(time.monotonic())
+                key = (
+                    status.get("state"), status.get("volume"), status.get("songid"),
+                    status.get("song"), status.get("playlistlength"),
+                    None if elapsed is None else int(elapsed), self._is_muted
+                )
+                cached = self._player_cache
+                if cached is not None and cached[0] == key:
+                    return cached[1]
                 
                 # Set player state
                 mpd_state = status.get("state")
-                if mpd_state in MPD_STATE_MAP:
-                    player.state = MPD_STATE_MAP[mpd_state]
-                else:
-                    player.state = PlayerState.UNKNOWN.value
+                player.state = _MPD_STATE_VALUES.get(mpd_state, PlayerState.UNKNOWN.value)
                 
                 # Set volume
                 if "volume" in status:
-                    try:
-                        player.volume = int(status["volume"])
-                    except (ValueError, TypeError):
-                        pass
+                    player.volume = status.volume
                 
                 # Set position
-                if "elapsed" in status:
-                    try:
-                        player.position = float(status["elapsed"])
-                    except (ValueError, TypeError):
-                        pass
+                if elapsed is not None:
+                    player.position = elapsed
                 
                 # Set muted status
                 player.muted = self._is_muted
@@ -502,12 +1199,58 @@ class MPDPlayerController(PlayerController):
                 
                 # Update the capabilities based on playlist position
                 self._update_capabilities(status)
+                player.capabilities = self._capabilities
+                
+                self._player_cache = (key, player)
                 
             except Exception as e:
                 logger.error(f"Error getting player info: {e}")
         
         return player
     
+    def _player_with_state(self, state: PlayerState, before: Optional[_State]) -> Player:
+        """
+        Create player information after a command that set the state
+        
+        Volume and position are taken from the status before the command.
+        Without a recent status the player information is requested again.
+        
+        Args:
+            state: The state the command has set
+            before: Status from before the command, see _cached_state
+            
+        Returns:
+            Player object with the new state
+        """
+        if before is None:
+            return self.get_player_info()
+            
+        status = before.status
+        mpd_state = status.get("state")
+        if mpd_state == "stop" and (state == PlayerState.PAUSED or not status.playlist_length):
+            # MPD ignores pause while stopped, and there is nothing to play
+            # in an empty playlist
+            state = PlayerState.STOPPED
+            
+        if state == PlayerState.STOPPED:
+            position = None
+        elif mpd_state == "stop":
+            position = 0.0  # Playback starts at the beginning of the song
+        else:
+            position = before.position(time.monotonic())
+            
+        return Player(
+            name=self.name,
+            player_id=self.player_id,
+            type="mpd",
+            state=state.value,
+            volume=status.volume if "volume" in status else None,
+            position=position,
+            capabilities=self._capabilities,
+            muted=self._is_muted,
+            active=state == PlayerState.PLAYING
+        )
+    
     def get_current_song(self) -> Optional[Song]:
         """
         Get information about the currently playing song
@@ -515,16 +1258,32 @@ class MPDPlayerController(PlayerController):
         Returns:
             Song object with metadata, or None if no song is playing
         """
-        if not self._ensure_connected():
+        if not self._connected:
             return None
         
         try:
-            status = self._client.status()
+            current = None
+            state = self._cached_state()
+            if state is None:
+                # The song is most likely needed as well, get both in one
+                # round trip
+                status, current = self._command_list(("status",), ("currentsong",))
+                state = self._store_polled_status(status)
+            status = state.status
+            
             # MPD returns string "stop", not the enum
             if status.get("state") == "stop":
                 return None
             
-            current = self._client.currentsong()
+            # Reuse the last song unless the song or its tags have changed,
+            # tag changes (e.g. of streams) change the playlist version
+            key = (status.get("songid"), status.get("playlist"))
+            cached = self._song_cache
+            if cached is not None and cached[0] == key:
+                return cached[1]
+            
+            if current is None:
+                current = self._command("currentsong")
             if not current:
                 return None
             
@@ -541,13 +1300,11 @@ class MPDPlayerController(PlayerController):
             if "track" in current:
                 try:
                     # MPD sometimes returns track as "1/10"
-                    if "/" in current["track"]:
-                        parts = current["track"].split("/")
-                        song.track_number = int(parts[0])
-                        song.total_tracks = int(parts[1])
-                    else:
-                        song.track_number = int(current["track"])
-                except (ValueError, IndexError):
+                    track, sep, total = current["track"].partition("/")
+                    song.track_number = int(track)
+                    if sep:
+                        song.total_tracks = int(total)
+                except ValueError:
                     pass
             
             # Handle duration
@@ -570,6 +1327,7 @@ class MPDPlayerController(PlayerController):
             if "genre" in current:
                 song.genre = current["genre"]
                 
+            self._song_cache = (key, song)
             return song
         except Exception as e:
             logger.error(f"Error getting current song: {e}")
@@ -582,16 +1340,15 @@ class MPDPlayerController(PlayerController):
         Returns:
             True if successful, False otherwise
         """
-        if not self._ensure_connected():
+        if not self._connected:
             return False
 
         try:
-            self._client.play()
-            # Notify listeners about the state change
-            player_info = self.get_player_info()
-            self._notify_player_state_change(player_info)
-            song = self.get_current_song()
-            self._notify_song_change(song)
+            before = self._cached_state()
+            self._command("play")
+            # Notify listeners about the state change, the event listener
+            # follows up with the full player information and the song
+            self._notify_player_state_change(self._player_with_state(PlayerState.PLAYING, before))
             return True
         except mpd.CommandError as e:
             logger.error(f"MPD CommandError while playing: {e}")
@@ -607,14 +1364,14 @@ class MPDPlayerController(PlayerController):
         Returns:
             True if successful, False otherwise
         """
-        if not self._ensure_connected():
+        if not self._connected:
             return False
         
         try:
-            self._client.pause(1)
+            before = self._cached_state()
+            self._command("pause", 1)
             # Notify listeners about the state change
-            player_info = self.get_player_info()
-            self._notify_player_state_change(player_info)
+            self._notify_player_state_change(self._player_with_state(PlayerState.PAUSED, before))
             return True
         except Exception as e:
             logger.error(f"Error pausing: {e}")
@@ -627,14 +1384,14 @@ class MPDPlayerController(PlayerController):
         Returns:
             True if successful, False otherwise
         """
-        if not self._ensure_connected():
+        if not self._connected:
             return False
         
         try:
-            self._client.stop()
+            before = self._cached_state()
+            self._command("stop")
             # Notify listeners about the state change
-            player_info = self.get_player_info()
-            self._notify_player_state_change(player_info)
+            self._notify_player_state_change(self._player_with_state(PlayerState.STOPPED, before))
             self._notify_song_change(None)
             return True
         except Exception as e:
@@ -648,16 +1405,12 @@ class MPDPlayerController(PlayerController):
         Returns:
             True if successful, False otherwise
         """
-        if not self._ensure_connected():
+        if not self._connected:
             return False
         
         try:
-            self._client.next()
-            # Notify listeners about the song change
-            player_info = self.get_player_info()
-            self._notify_player_state_change(player_info)
-            song = self.get_current_song()
-            self._notify_song_change(song)
+            self._command("next")
+            # The event listener notifies listeners about the song change
             return True
         except Exception as e:
             logger.error(f"Error skipping to next track: {e}")
@@ -670,16 +1423,12 @@ class MPDPlayerController(PlayerController):
         Returns:
             True if successful, False otherwise
         """
-        if not self._ensure_connected():
+        if not self._connected:
             return False
         
         try:
-            self._client.previous()
-            # Notify listeners about the song change
-            player_info = self.get_player_info()
-            self._notify_player_state_change(player_info)
-            song = self.get_current_song()
-            self._notify_song_change(song)
+            self._command("previous")
+            # The event listener notifies listeners about the song change
             return True
         except Exception as e:
             logger.error(f"Error skipping to previous track: {e}")
@@ -695,13 +1444,13 @@ class MPDPlayerController(PlayerController):
         Returns:
             True if successful, False otherwise
         """
-        if not self._ensure_connected():
+        if not self._connected:
             return False
         
         try:
             # Ensure volume is within range
             volume = max(0, min(100, volume))
-            self._client.setvol(volume)
+            self._command("setvol", volume)
             
             # If we're setting volume > 0, we're implicitly unmuting
             if volume > 0:
@@ -715,6 +1464,89 @@ class MPDPlayerController(PlayerController):
             logger.error(f"Error setting volume: {e}")
             return False
     
+    def _cached_state(self) -> Optional[_State]:
+        """
+        Get the MPD status with the time it was fetched if it is known
+        
+        The status of the event listener is used as long as the listener
+        sees all changes. Otherwise a status from an earlier call is used if
+        it is recent enough.
+        
+        Returns:
+            Current MPD state, or None if it has to be fetched
+        """
+        now = time.monotonic()
+        max_age = self._status_max_age
+        state = self._state
+        if state.status and not self._state_expired and (state.live or now - state.timestamp < max_age):
+            return state
+        state = self._polled_state
+        if state.status and now - state.timestamp < max_age:
+            return state
+        return None
+    
+    def _store_polled_status(self, status: Dict[str, Any]) -> _State:
+        """
+        Remember a status fetched by a getter
+        
+        It is kept apart from the listener state, which must stay the status
+        the next changes are compared against.
+        
+        Args:
+            status: Result of the MPD status command
+            
+        Returns:
+            The new state
+        """
+        state = _State(_StatusView(status), time.monotonic())
+        self._polled_state = state
+        return state
+    
+    def _recent_state(self) -> _State:
+        """
+        Get the MPD status with the time it was fetched, see _cached_state
+        
+        Returns:
+            Current MPD state
+        """
+        state = self._cached_state()
+        if state is None:
+            with self._status_lock:
+                # Another thread may have fetched it in the meantime
+                state = self._cached_state()
+                if state is None:
+                    state = self._store_polled_status(self._command("status"))
+        return state
+    
+    def _recent_status(self) -> _StatusView:
+        """
+        Get the MPD status, see _recent_state
+        
+        Returns:
+            Current MPD status
+        """
+        return self._recent_state().status
+    
+    def _expire_status(self):
+        """Stop using the recent status until it has been updated"""
+        with self._status_lock:
+            self._status_generation += 1
+            self._state_expired = True
+            self._polled_state = _NO_STATE
+    
+    def _status_refreshed(self, generation: int):
+        """
+        Use the listener status again after the listener has fetched it
+        
+        Args:
+            generation: Value of _status_generation before the status was
+                        fetched; if the status expired since then, it stays
+                        expired
+        """
+        with self._status_lock:
+            if self._status_generation == generation:
+                self._state_expired = False
+    
     def get_volume(self) -> int:
         """
         Get current volume level
@@ -722,16 +1554,13 @@ class MPDPlayerController(PlayerController):
         Returns:
             Current volume level (0-100)
         """
-        if not self._ensure_connected():
+        if not self._connected:
             return 0
         
         try:
-            status = self._client.status()
+            status = self._recent_status()
             if "volume" in status:
-                try:
-                    return int(status["volume"])
-                except (ValueError, TypeError):
-                    pass
+                return status.volume
             return 0
         except Exception as e:
             logger.error(f"Error getting volume: {e}")
@@ -747,14 +1576,14 @@ class MPDPlayerController(PlayerController):
         Returns:
             True if successful, False otherwise
         """
-        if not self._ensure_connected():
+        if not self._connected:
             return False
         
         try:
             if mute and not self._is_muted:
                 # Store current volume and set to 0
                 self._volume_before_mute = self.get_volume()
-                self._client.setvol(0)
+                self._command("setvol", 0)
                 self._is_muted = True
                 
                 # Notify listeners about volume change
@@ -763,7 +1592,7 @@ class MPDPlayerController(PlayerController):
                 return True
             elif not mute and self._is_muted:
                 # Restore previous volume
-                self._client.setvol(self._volume_before_mute)
+                self._command("setvol", self._volume_before_mute)
                 self._is_muted = False
                 
                 # Notify listeners about volume change
@@ -794,11 +1623,11 @@ class MPDPlayerController(PlayerController):
         Returns:
             True if successful, False otherwise
         """
-        if not self._ensure_connected():
+        if not self._connected:
             return False
         
         try:
-            self._client.seekcur(position)
+            self._command("seekcur", position)
             # Notify listeners about position change
             self._notify_position_change(position)
             return True
@@ -813,17 +1642,12 @@ class MPDPlayerController(PlayerController):
         Returns:
             Current position in seconds, or None if not available
         """
-        if not self._ensure_connected():
+        if not self._connected:
             return None
         
         try:
-            status = self._client.status()
-            if "elapsed" in status:
-                try:
-                    return float(status["elapsed"])
-                except (ValueError, TypeError):
-                    pass
-            return None
+            # The listener isn't told about the progress of playback
+            return self._recent_state().position(time.monotonic())
         except Exception as e:
             logger.error(f"Error getting position: {e}")
             return None
@@ -838,11 +1662,11 @@ class MPDPlayerController(PlayerController):
         Returns:
             True if successful, False otherwise
         """
-        if not self._ensure_connected():
+        if not self._connected:
             return False
         
         try:
-            self._client.random(1 if enabled else 0)
+            self._command("random", 1 if enabled else 0)
             return True
         except Exception as e:
             logger.error(f"Error setting shuffle: {e}")
@@ -855,15 +1679,7 @@ class MPDPlayerController(PlayerController):
         Returns:
             True if shuffle is enabled, False otherwise
         """
-        if not self._ensure_connected():
-            return False
-        
-        try:
-            status = self._client.status()
-            return status.get("random", "0") == "1"
-        except Exception as e:
-            logger.error(f"Error getting shuffle status: {e}")
-            return False
+        return self.snapshot().shuffle
     
     def set_loop_mode(self, mode: LoopMode) -> bool:
         """
@@ -875,25 +1691,20 @@ class MPDPlayerController(PlayerController):
         Returns:
             True if successful, False otherwise
         """
-        if not self._ensure_connected():
+        if not self._connected:
             return False
         
+        flags = _LOOP_TO_FLAGS.get(mode)
+        if flags is None:
+            # Nothing to set for unknown modes
+            return True
+        
         try:
-            if mode == LoopMode.NONE:
-                # No repeat, no single
-                self._client.repeat(0)
-                self._client.single(0)
-            elif mode == LoopMode.TRACK:
-                # Enable single mode
-                self._client.repeat(1)
-                self._client.single(1)
-            elif mode == LoopMode.PLAYLIST:
-                # Enable repeat, disable single
-                self._client.repeat(1)
-                self._client.single(0)
+            repeat, single = flags
+            self._command_list(("repeat", repeat), ("single", single))
             return True
-        except Exception as e:
-            logger.error(f"Error setting loop mode: {e}")
+        except (mpd.MPDError, OSError) as e:
+            logger.error("Error setting loop mode: %s", e)
             return False
     
     def get_loop_mode(self) -> LoopMode:
@@ -903,23 +1714,7 @@ class MPDPlayerController(PlayerController):
         Returns:
             Current loop mode (NONE, TRACK, or PLAYLIST)
         """
-        if not self._ensure_connected():
-            return LoopMode.NONE
-        
-        try:
-            status = self._client.status()
-            repeat = status.get("repeat", "0") == "1"
-            single = status.get("single", "0") == "1"
-            
-            if not repeat:
-                return LoopMode.NONE
-            elif single:
-                return LoopMode.TRACK
-            else:
-                return LoopMode.PLAYLIST
-        except Exception as e:
-            logger.error(f"Error getting loop mode: {e}")
-            return LoopMode.NONE
+        return self.snapshot().loop
     
     def isConnected(self) -> bool:
         """
@@ -937,16 +1732,10 @@ class MPDPlayerController(PlayerController):
         Returns:
             True if updating, False otherwise
         """
-        if not self._ensure_connected():
-            return False
-        
-        try:
-            status = self._client.status()
-            # MPD indicates database update with an "updating_db" key in the status
-            return "updating_db" in status
-        except Exception as e:
-            logger.error(f"Error checking database update status: {e}")
-            return False
+        updating = self.snapshot().updating
+        if not updating:
+            self._pending_update_id = None
+        return updating
             
     def update(self) -> bool:
         """
@@ -958,18 +1747,32 @@ class MPDPlayerController(PlayerController):
         Returns:
             True if the update was successfully triggered, False otherwise
         """
-        if not self._ensure_connected():
+        if not self._connected:
             return False
             
         try:
             # The update command returns the update job ID if successful
-            update_id = self._client.update()
+            update_id = self._command("update")
             logger.info(f"MPD database update triggered, job ID: {update_id}")
+            self._pending_update_id = _parse_number(int, update_id, None)
             return True
-        except Exception as e:
-            logger.error(f"Error triggering MPD database update: {e}")
+        except (mpd.MPDError, OSError) as e:
+            logger.error("Error triggering MPD database update: %s", e)
             return False
     
+    def update_job_id(self) -> Optional[int]:
+        """
+        Get the job ID of the database update triggered by update()
+        
+        Instead of polling isUpdating, callers can register for
+        EVENT_UPDATE_STATUS_CHANGE, which is triggered when MPD starts and
+        finishes an update.
+        
+        Returns:
+            The job ID, or None if no update triggered by us is running
+        """
+        return self._pending_update_id
+    
     def isActive(self) -> bool:
         """
         Check if the player is currently active (playing)
@@ -977,13 +1780,39 @@ class MPDPlayerController(PlayerController):
         Returns:
             True if the player is currently playing, False otherwise
         """
-        if not self._ensure_connected():
-            return False
+        return self.snapshot().active
+    
+    def snapshot(self) -> PlayerSnapshot:
+        """
+        Get the state, shuffle, loop mode, update and active status at once
+        
+        All of them come from the same MPD status.
+        
+        Returns:
+            PlayerSnapshot with the current values
+        """
+        if not self._connected:
+            return _UNKNOWN_SNAPSHOT
         
         try:
-            status = self._client.status()
-            # Compare with raw MPD state string, not enum
-            return status.get("state") == "play"
-        except Exception as e:
-            logger.error(f"Error checking if player is active: {e}")
-            return False
\ No newline at end of file
+            status = self._recent_status()
+        except (mpd.MPDError, OSError) as e:
+            logger.error("Error getting MPD status: %s", e)
+            return _UNKNOWN_SNAPSHOT
+        
+        # Every fetched status is a new object, so the last snapshot is valid
+        # as long as the status is the same
+        cached = self._snapshot_cache
+        if cached is not None and cached[0] is status:
+            return cached[1]
+        
+        flags = status.flags
+        snapshot = PlayerSnapshot(
+            state=_MPD_STATE_VALUES.get(status.get("state"), PlayerState.UNKNOWN.value),
+            shuffle=bool(flags & _FLAG_RANDOM),
+            loop=_LOOP_FROM_FLAGS[flags & _FLAGS_LOOP],
+            updating=bool(flags & _FLAG_UPDATING),
+            active=bool(flags & _FLAG_PLAYING)
+        )
+        self._snapshot_cache = (status, snapshot)
+        return snapshot
\ No newline at end of file
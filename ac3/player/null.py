@@ -20,6 +20,8 @@ class NullPlayerController(PlayerController):
     All operations will return False, and all queries will return None or appropriate defaults.
     """
     
+    __slots__ = ("_player_info",)
+    
     def __init__(self, player_id: str = "null", name: str = "Null Player", **kwargs):
         """
         Initialize the null player controller
@@ -31,24 +33,26 @@ class NullPlayerController(PlayerController):
         """
         super().__init__(player_id, name, None)
         
-    def get_player_info(self) -> Player:
-        """
-        Get information about the player
-        
-        Returns:
-            A default Player object with minimal information
-        """
-        return Player(
+        # The player information never changes, so it is created only once
+        self._player_info = Player(
             name=self.name,
             player_id=self.player_id,
             type="null",
             state="stopped",
             volume=0,
             muted=False,
-            capabilities=[],
-            active=False,
-            supports_seek=False
+            capabilities=(),
+            active=False
         )
+        
+    def get_player_info(self) -> Player:
+        """
+        Get information about the player
+        
+        Returns:
+            A default Player object with minimal information
+        """
+        return self._player_info
     
     def get_current_song(self) -> Optional[Song]:
         """
@@ -67,8 +71,7 @@ class NullPlayerController(PlayerController):
             False as operation is not supported
         """
         # Even though we don't do anything, still notify listeners for consistency
-        player_info = self.get_player_info()
-        self._notify_player_state_change(player_info)
+        self._notify_player_state_change(self._player_info)
         return False
     
     def pause(self) -> bool:
@@ -79,8 +82,7 @@ class NullPlayerController(PlayerController):
             False as operation is not supported
         """
         # Even though we don't do anything, still notify listeners for consistency
-        player_info = self.get_player_info()
-        self._notify_player_state_change(player_info)
+        self._notify_player_state_change(self._player_info)
         return False
     
     def stop(self) -> bool:
@@ -91,8 +93,7 @@ class NullPlayerController(PlayerController):
             False as operation is not supported
         """
         # Even though we don't do anything, still notify listeners for consistency
-        player_info = self.get_player_info()
-        self._notify_player_state_change(player_info)
+        self._notify_player_state_change(self._player_info)
         self._notify_song_change(None)
         return False
     
@@ -4,26 +4,221 @@ Player Controller Abstract Base Class
 This module defines the abstract interface that all player controllers must implement.
 """
 
-import importlib
+import functools
 import logging
 import os
-import pkgutil
-import sys
-import inspect
+import threading
+import time
+import types
+import weakref
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List, Type, Callable, Set
+from typing import Optional, Dict, Any, List, Type, Callable, Tuple, NamedTuple
 from enum import Enum, auto
 from ac3.metadata import Player, Song
 
 logger = logging.getLogger("ac3.player")
 
 
+def _listener_ref(listener: Any) -> Callable[[], Any]:
+    """
+    Create a weak reference to a listener
+    
+    Args:
+        listener: The listener
+        
+    Returns:
+        Callable returning the listener, or None once it has been garbage
+        collected
+    """
+    try:
+        return weakref.ref(listener)
+    except TypeError:
+        # Objects without weak reference support are kept alive
+        return lambda: listener
+
+# Controller class names end with this, the part before it is the player
+# type (e.g., MPDPlayerController -> mpd)
+_CTRL_SUFFIX = "PlayerController"
+_CTRL_SUFFIX_LEN = len(_CTRL_SUFFIX)
+
+# Entry point group in which installed packages register player controllers
+ENTRY_POINT_GROUP = "ac3.player_controllers"
+
+# Event types, also available as PlayerController.EVENT_*
+_EV_PLAYER_STATE_CHANGE = "player_state_change"
+_EV_SONG_CHANGE = "song_change"
+_EV_VOLUME_CHANGE = "volume_change"
+_EV_POSITION_CHANGE = "position_change"
+_EV_CAPABILITY_CHANGE = "capability_change"
+_EV_CONNECTION_CHANGE = "connection_change"
+_EV_UPDATE_STATUS_CHANGE = "update_status_change"
+_EV_PLAYLIST_CHANGE = "playlist_change"
+_EV_QUEUE_CHANGE = "queue_change"
+
+# Listener method called for each event type, events without one only
+# trigger callbacks
+_LISTENER_METHODS = {
+    _EV_PLAYER_STATE_CHANGE: "on_player_state_change",
+    _EV_SONG_CHANGE: "on_song_change",
+    _EV_VOLUME_CHANGE: "on_volume_change",
+    _EV_POSITION_CHANGE: "on_position_change",
+    _EV_CAPABILITY_CHANGE: "on_capability_change",
+}
+
+
+def _instance_method_caller(method_name: str) -> Callable[[Any, Any], None]:
+    """
+    Create a function calling a listener method looked up on the instance
+    
+    Used for listener methods that aren't plain functions of the class,
+    e.g. callables assigned to the instance.
+    
+    Args:
+        method_name: Name of the listener method
+        
+    Returns:
+        Function taking the listener and the event payload
+    """
+    def call(listener: Any, payload: Any) -> None:
+        getattr(listener, method_name)(payload)
+    return call
+
+
+@functools.lru_cache(maxsize=None)
+def _controller_entry_points() -> Dict[str, Any]:
+    """
+    Get the player controllers registered as entry points
+    
+    The controller modules are not imported.
+    
+    Returns:
+        Dictionary mapping lowercase player types to their entry points,
+        empty if the package isn't installed
+    """
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        return {}
+    
+    try:
+        eps = entry_points()
+        if hasattr(eps, "select"):
+            eps = eps.select(group=ENTRY_POINT_GROUP)
+        else:
+            # Python < 3.10 returns a dictionary of groups
+            eps = eps.get(ENTRY_POINT_GROUP, [])
+        return {ep.name.lower(): ep for ep in eps}
+    except Exception as e:
+        logger.warning(f"Error reading player controller entry points: {e}")
+        return {}
+
+
+def _implementations_file() -> str:
+    """
+    Get the path of the file that caches the controller implementations
+    between runs
+    
+    Returns:
+        Path below $XDG_CACHE_HOME (default ~/.cache)
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "ac3", "player_controllers.json")
+
+
+def _modules_fingerprint(pkg_dir: str) -> Optional[str]:
+    """
+    Describe the modules of a directory by their names and modification times
+    
+    Args:
+        pkg_dir: Directory of the package
+        
+    Returns:
+        String that changes when a module is added, removed or modified, or
+        None if the directory can't be read
+    """
+    try:
+        return ";".join(sorted(f"{entry.name}:{entry.stat().st_mtime_ns}"
+                               for entry in os.scandir(pkg_dir) if entry.name.endswith(".py")))
+    except OSError:
+        return None
+
+
+def _load_implementations(pkg_dir: str, fingerprint: str) -> Optional[Tuple[str, ...]]:
+    """
+    Read the controller implementations found in an earlier run
+    
+    Args:
+        pkg_dir: Directory of the package
+        fingerprint: Current fingerprint of the package's modules
+        
+    Returns:
+        Sorted tuple of player types, or None if there is no result for the
+        current modules
+    """
+    import json
+
+    try:
+        with open(_implementations_file(), encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("pkg_dir") != pkg_dir or cached.get("fingerprint") != fingerprint:
+        return None
+    implementations = cached.get("implementations")
+    if not isinstance(implementations, list):
+        return None
+    return tuple(sorted(implementations))
+
+
+def _save_implementations(pkg_dir: str, fingerprint: str, implementations: Tuple[str, ...]) -> None:
+    """
+    Store the controller implementations for the next run
+    
+    Args:
+        pkg_dir: Directory of the package
+        fingerprint: Fingerprint of the package's modules
+        implementations: Sorted tuple of player types
+    """
+    import json
+
+    path = _implementations_file()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Replace the file at once so concurrent readers never see a partial file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"pkg_dir": pkg_dir, "fingerprint": fingerprint,
+                       "implementations": implementations}, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug(f"Could not write controller implementations {path}: {e}")
+
+
 class LoopMode(Enum):
     """Loop mode for playback"""
     NONE = "no"       # No loop
     TRACK = "song"    # Loop current track/song
     PLAYLIST = "playlist"  # Loop entire playlist
 
+    @classmethod
+    def from_value(cls, value: str) -> 'LoopMode':
+        """
+        Get the loop mode for a value reported by a player
+        
+        Unlike LoopMode(value) this is a plain dictionary lookup and doesn't
+        raise for unknown values.
+        
+        Args:
+            value: Loop mode value, e.g. "song"
+            
+        Returns:
+            The matching loop mode, LoopMode.NONE for unknown values
+        """
+        return _LOOP_MODES_BY_VALUE.get(value, cls.NONE)
+
+
+_LOOP_MODES_BY_VALUE: Dict[str, LoopMode] = {mode.value: mode for mode in LoopMode}
+
 
 class PlayerState(Enum):
     """Player state enum defining possible states a player can be in"""
@@ -38,14 +233,40 @@ class PlayerState(Enum):
         return self.value
 
 
+# State values used on hot paths, resolved once
+_PLAYING = PlayerState.PLAYING.value
+_STOPPED = PlayerState.STOPPED.value
+_UNKNOWN = PlayerState.UNKNOWN.value
+
+# Seconds a reported state is trusted by isActive() before the player is
+# asked again, in case it changed without a notification
+_CACHED_STATE_MAX_AGE = 5.0
+_NO_CAPABILITIES = ()
+
+
+class PlayerSnapshot(NamedTuple):
+    """
+    Player state that is often needed together, see PlayerController.snapshot
+    """
+    state: str  # Player state value, e.g. "playing"
+    shuffle: bool  # Whether shuffle is enabled
+    loop: LoopMode  # Current loop mode
+    updating: bool  # Whether the player is updating its database
+    active: bool  # Whether the player is playing
+
+
 class PlayerStateListener(ABC):
     """
     Interface for receiving player state updates
     
     Classes that want to receive updates from a PlayerController should
     implement this interface and register themselves with the controller.
+    Implementations that declare their own __slots__ should include
+    "__weakref__", otherwise the controller has to keep them alive.
     """
     
+    __slots__ = ()
+    
     def on_player_state_change(self, player: Player) -> None:
         """
         Called when the player state changes
@@ -125,35 +346,82 @@ class PlayerController(ABC):
     CAP_FAVORITES = "favorites"       # Can manage favorites
     CAP_DATABASE_UPDATE = "db_update" # Can update internal database
     
+    # Controllers that don't declare their own __slots__ still get a __dict__
+    __slots__ = ("_player_id", "_name", "_state_listeners", "_listener_methods", "cached_state", "_cached_state_time",
+                 "_callbacks", "_listeners_lock")
+    
     # Event types for callbacks
-    EVENT_PLAYER_STATE_CHANGE = "player_state_change"
-    EVENT_SONG_CHANGE = "song_change"
-    EVENT_VOLUME_CHANGE = "volume_change"
-    EVENT_POSITION_CHANGE = "position_change"
-    EVENT_CAPABILITY_CHANGE = "capability_change"
-    EVENT_CONNECTION_CHANGE = "connection_change"
-    EVENT_UPDATE_STATUS_CHANGE = "update_status_change"
-    EVENT_PLAYLIST_CHANGE = "playlist_change"
-    EVENT_QUEUE_CHANGE = "queue_change"
+    EVENT_PLAYER_STATE_CHANGE = _EV_PLAYER_STATE_CHANGE
+    EVENT_SONG_CHANGE = _EV_SONG_CHANGE
+    EVENT_VOLUME_CHANGE = _EV_VOLUME_CHANGE
+    EVENT_POSITION_CHANGE = _EV_POSITION_CHANGE
+    EVENT_CAPABILITY_CHANGE = _EV_CAPABILITY_CHANGE
+    EVENT_CONNECTION_CHANGE = _EV_CONNECTION_CHANGE
+    EVENT_UPDATE_STATUS_CHANGE = _EV_UPDATE_STATUS_CHANGE
+    EVENT_PLAYLIST_CHANGE = _EV_PLAYLIST_CHANGE
+    EVENT_QUEUE_CHANGE = _EV_QUEUE_CHANGE
+    
+    # Result of controllerImplementations, filled on first use
+    _impl_cache: Optional[Tuple[str, ...]] = None
+    
+    # Controller classes resolved by createController by lowercase player type
+    _controller_classes: Dict[str, Type['PlayerController']] = {}
     
     @classmethod
-    def controllerImplementations(cls) -> List[str]:
+    def controllerImplementations(cls, force_refresh: bool = False) -> Tuple[str, ...]:
         """
         List all available player controller implementations
         
-        This method scans the ac3.player package to find all modules that
-        contain controller implementations that can be used with createController().
+        Controllers registered in the ac3.player_controllers entry point group
+        are listed without importing them. Without registered controllers,
+        e.g. when running from a source tree, this method scans the ac3.player
+        package to find all modules that contain controller implementations
+        that can be used with createController(). The result is kept for later
+        calls and, as long as the modules don't change, for later runs.
+        
+        Args:
+            force_refresh: Scan the package again instead of using the
+                result of an earlier scan
         
         Returns:
-            List of player type names that can be used with createController()
+            Sorted tuple of player type names that can be used with
+            createController()
         """
+        if not force_refresh and PlayerController._impl_cache is not None:
+            return PlayerController._impl_cache
+        
+        # Only needed for scanning the package, which most runs don't do
+        import importlib
+        import inspect
+        import pkgutil
+
+        if force_refresh:
+            _controller_entry_points.cache_clear()
+        registered = _controller_entry_points()
+        if registered:
+            implementations = tuple(sorted(registered))
+            logger.info(f"Registered player controller implementations: {implementations}")
+            PlayerController._impl_cache = implementations
+            return implementations
+        
         implementations = []
+        # Only a scan where every module could be imported is stored for later
+        # runs, a missing dependency may be installed in the meantime
+        complete = True
+        fingerprint = None
         
         try:
             # Get the directory of the current module
             import ac3.player
             pkg_dir = os.path.dirname(ac3.player.__file__)
             
+            fingerprint = _modules_fingerprint(pkg_dir)
+            if not force_refresh and fingerprint is not None:
+                cached = _load_implementations(pkg_dir, fingerprint)
+                if cached is not None:
+                    PlayerController._impl_cache = cached
+                    return cached
+            
             # Find all Python modules in this directory
             for _, module_name, is_pkg in pkgutil.iter_modules([pkg_dir]):
                 # Skip __init__, this controller module, and packages
@@ -164,29 +432,42 @@ class PlayerController(ABC):
                     # Try to import the module
                     module = importlib.import_module(f"ac3.player.{module_name}")
                     
-                    # Look for controller classes in the module
-                    for name, obj in inspect.getmembers(module):
-                        if (inspect.isclass(obj) and 
-                            issubclass(obj, PlayerController) and 
-                            obj != PlayerController and
-                            name.endswith("PlayerController")):
-                            
+                    # The module lists its controller classes, like
+                    # createController expects
+                    names = getattr(module, "PROVIDES_CONTROLLERS", None)
+                    if names is None:
+                        logger.warning(f"Module ac3.player.{module_name} does not define PROVIDES_CONTROLLERS, "
+                                       "scanning all of its classes is deprecated")
+                        names = [name for name, obj in inspect.getmembers(module)
+                                 if (inspect.isclass(obj) and 
+                                     issubclass(obj, PlayerController) and 
+                                     obj != PlayerController)]
+                    
+                    for name in names:
+                        if name.endswith(_CTRL_SUFFIX):
                             # Extract player type from class name (e.g., MPDPlayerController -> mpd)
-                            player_type = name[:-16].lower()
+                            player_type = name[:-_CTRL_SUFFIX_LEN].lower()
                             implementations.append(player_type)
                 
                 except ImportError as e:
                     logger.warning(f"Could not import module ac3.player.{module_name}: {e}")
+                    complete = False
                 except Exception as e:
                     logger.warning(f"Error processing module ac3.player.{module_name}: {e}")
+                    complete = False
         
         except Exception as e:
             logger.error(f"Error listing controller implementations: {e}")
+            complete = False
         
         # Log the discovered implementations for debugging
         logger.info(f"Discovered player controller implementations: {implementations}")
         
-        return sorted(implementations)
+        result = tuple(sorted(implementations))
+        PlayerController._impl_cache = result
+        if complete and fingerprint is not None:
+            _save_implementations(pkg_dir, fingerprint, result)
+        return result
     
     def __init__(self, player_id: str, name: str, configdata: Optional[Dict[str, Any]] = None):
         """
@@ -199,9 +480,24 @@ class PlayerController(ABC):
         """
         self._player_id = player_id
         self._name = name
-        self._state_listeners: Set[PlayerStateListener] = set()
-        # Dictionary to store callbacks by event type
-        self._callbacks: Dict[str, List[Callable[..., None]]] = {}
+        # Weak references to the listeners, kept as a tuple that is replaced
+        # when they change, so notifications can iterate over it without
+        # copying. Listeners that are garbage collected without being removed
+        # are skipped.
+        self._state_listeners: Tuple[Callable[[], Optional[PlayerStateListener]], ...] = ()
+        # Listener references with the listener method's function by event
+        # type, rebuilt with the listeners
+        self._listener_methods: Dict[str, Tuple[Tuple[Callable[[], Any], Callable[..., None]], ...]] = {}
+        # Last state reported by this player, so callers don't have to
+        # query the player for it, and the monotonic time it was reported
+        self.cached_state: str = _UNKNOWN
+        self._cached_state_time: float = 0.0
+        # Dictionary to store callbacks by event type, replaced like the
+        # listeners when callbacks are added or removed
+        self._callbacks: Dict[str, Tuple[Callable[..., None], ...]] = {}
+        # Serializes replacing the listener and callback tuples, notifications
+        # read them without locking
+        self._listeners_lock = threading.Lock()
     
     def register_callback(self, event_type: str, callback: Callable[..., None]) -> None:
         """
@@ -212,11 +508,12 @@ class PlayerController(ABC):
             callback: The callback function to call when the event occurs
                       The callback function will receive event-specific arguments
         """
-        if event_type not in self._callbacks:
-            self._callbacks[event_type] = []
-        if callback not in self._callbacks[event_type]:
-            self._callbacks[event_type].append(callback)
-            logger.debug(f"Registered callback for event {event_type}: {callback}")
+        with self._listeners_lock:
+            callbacks = self._callbacks.get(event_type, ())
+            if callback in callbacks:
+                return
+            self._callbacks[event_type] = callbacks + (callback,)
+        logger.debug(f"Registered callback for event {event_type}: {callback}")
     
     def unregister_callback(self, event_type: str, callback: Callable[..., None]) -> None:
         """
@@ -226,11 +523,16 @@ class PlayerController(ABC):
             event_type: The event type to unregister from
             callback: The callback function to unregister
         """
-        if event_type in self._callbacks and callback in self._callbacks[event_type]:
-            self._callbacks[event_type].remove(callback)
-            logger.debug(f"Unregistered callback for event {event_type}: {callback}")
-            if not self._callbacks[event_type]:
+        with self._listeners_lock:
+            callbacks = self._callbacks.get(event_type, ())
+            if callback not in callbacks:
+                return
+            remaining = tuple(cb for cb in callbacks if cb != callback)
+            if remaining:
+                self._callbacks[event_type] = remaining
+            else:
                 del self._callbacks[event_type]
+        logger.debug(f"Unregistered callback for event {event_type}: {callback}")
     
     def trigger_callback(self, event_type: str, *args: Any, **kwargs: Any) -> None:
         """
@@ -241,21 +543,30 @@ class PlayerController(ABC):
             *args: Positional arguments to pass to the callbacks
             **kwargs: Keyword arguments to pass to the callbacks
         """
-        if event_type in self._callbacks:
-            for callback in list(self._callbacks[event_type]):
-                try:
-                    callback(*args, **kwargs)
-                except Exception as e:
-                    logger.error(f"Error in callback for event {event_type}: {e}")
+        callbacks = self._callbacks.get(event_type)
+        if not callbacks:
+            return
+        for callback in callbacks:
+            try:
+                callback(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"Error in callback for event {event_type}: {e}")
     
     def add_state_listener(self, listener: PlayerStateListener) -> None:
         """
         Add a listener to receive player state updates
         
+        The listener is only referenced weakly, so it doesn't stay alive
+        because of the controller.
+        
         Args:
             listener: The listener to add
         """
-        self._state_listeners.add(listener)
+        with self._listeners_lock:
+            listeners = self._live_listeners()
+            if listener not in listeners:
+                self._state_listeners = tuple(_listener_ref(l) for l in listeners) + (_listener_ref(listener),)
+                self._bind_listener_methods()
         
     def remove_state_listener(self, listener: PlayerStateListener) -> None:
         """
@@ -264,7 +575,74 @@ class PlayerController(ABC):
         Args:
             listener: The listener to remove
         """
-        self._state_listeners.discard(listener)
+        with self._listeners_lock:
+            listeners = self._live_listeners()
+            if listener in listeners:
+                self._state_listeners = tuple(_listener_ref(l) for l in listeners if l != listener)
+                self._bind_listener_methods()
+    
+    def _live_listeners(self) -> List[PlayerStateListener]:
+        """
+        Get the listeners that haven't been garbage collected
+        
+        Returns:
+            List of listeners in the order they were added
+        """
+        return [listener for listener in (ref() for ref in self._state_listeners) if listener is not None]
+    
+    def _bind_listener_methods(self) -> None:
+        """
+        Look up the listener methods for each event type once, instead of on
+        every notification
+        
+        Methods defined on the listener's class are stored as functions, so
+        the table doesn't keep the listeners alive. Other callables, e.g.
+        ones assigned to the instance, are looked up on the instance for
+        every notification. Listeners without a method for an event are not
+        notified about it. Must be called with the listeners lock held.
+        """
+        listener_methods = {}
+        for event_type, method_name in _LISTENER_METHODS.items():
+            bound = []
+            for ref in self._state_listeners:
+                listener = ref()
+                if listener is None:
+                    continue
+                instance_attributes = getattr(listener, "__dict__", None)
+                if not instance_attributes or method_name not in instance_attributes:
+                    # Static and class methods are called through the instance
+                    function = next((klass.__dict__[method_name] for klass in type(listener).__mro__
+                                     if method_name in klass.__dict__), None)
+                    if isinstance(function, types.FunctionType):
+                        bound.append((ref, function))
+                        continue
+                if callable(getattr(listener, method_name, None)):
+                    bound.append((ref, _instance_method_caller(method_name)))
+            listener_methods[event_type] = tuple(bound)
+        self._listener_methods = listener_methods
+        
+    def _dispatch(self, event_type: str, payload: Any) -> None:
+        """
+        Notify all listeners and callbacks about an event
+        
+        Args:
+            event_type: One of the EVENT_* constants
+            payload: Argument passed to the listener method and the callbacks
+        """
+        # Players report changes whether or not anybody is interested
+        if not self._state_listeners and not self._callbacks:
+            return
+        for ref, function in self._listener_methods.get(event_type, ()):
+            listener = ref()
+            if listener is None:
+                continue
+            try:
+                function(listener, payload)
+            except Exception as e:
+                logger.error(f"Error notifying listener {listener} about {event_type}: {e}")
+        
+        # Also trigger callbacks
+        self.trigger_callback(event_type, payload)
         
     def _notify_player_state_change(self, player: Player) -> None:
         """
@@ -273,14 +651,19 @@ class PlayerController(ABC):
         Args:
             player: Updated player information
         """
-        for listener in list(self._state_listeners):
-            try:
-                listener.on_player_state_change(player)
-            except Exception as e:
-                logger.error(f"Error notifying listener {listener}: {e}")
+        if player.state is not None:
+            self._set_cached_state(str(player.state))
+        self._dispatch(_EV_PLAYER_STATE_CHANGE, player)
+                
+    def _set_cached_state(self, state: str) -> None:
+        """
+        Remember the current state of the player
         
-        # Also trigger callbacks
-        self.trigger_callback(self.EVENT_PLAYER_STATE_CHANGE, player)
+        Args:
+            state: The player state
+        """
+        self._cached_state_time = time.monotonic()
+        self.cached_state = state
                 
     def _notify_song_change(self, song: Optional[Song]) -> None:
         """
@@ -289,14 +672,7 @@ class PlayerController(ABC):
         Args:
             song: New song information
         """
-        for listener in list(self._state_listeners):
-            try:
-                listener.on_song_change(song)
-            except Exception as e:
-                logger.error(f"Error notifying listener {listener}: {e}")
-        
-        # Also trigger callbacks
-        self.trigger_callback(self.EVENT_SONG_CHANGE, song)
+        self._dispatch(_EV_SONG_CHANGE, song)
                 
     def _notify_volume_change(self, volume: int) -> None:
         """
@@ -305,14 +681,7 @@ class PlayerController(ABC):
         Args:
             volume: New volume level
         """
-        for listener in list(self._state_listeners):
-            try:
-                listener.on_volume_change(volume)
-            except Exception as e:
-                logger.error(f"Error notifying listener {listener}: {e}")
-        
-        # Also trigger callbacks
-        self.trigger_callback(self.EVENT_VOLUME_CHANGE, volume)
+        self._dispatch(_EV_VOLUME_CHANGE, volume)
                 
     def _notify_position_change(self, position: Optional[float]) -> None:
         """
@@ -321,14 +690,7 @@ class PlayerController(ABC):
         Args:
             position: New playback position
         """
-        for listener in list(self._state_listeners):
-            try:
-                listener.on_position_change(position)
-            except Exception as e:
-                logger.error(f"Error notifying listener {listener}: {e}")
-        
-        # Also trigger callbacks
-        self.trigger_callback(self.EVENT_POSITION_CHANGE, position)
+        self._dispatch(_EV_POSITION_CHANGE, position)
                 
     def _notify_capability_change(self, capabilities: List[str]) -> None:
         """
@@ -337,14 +699,7 @@ class PlayerController(ABC):
         Args:
             capabilities: List of currently available capabilities
         """
-        for listener in list(self._state_listeners):
-            try:
-                listener.on_capability_change(capabilities)
-            except Exception as e:
-                logger.error(f"Error notifying listener {listener} about capability change: {e}")
-        
-        # Also trigger callbacks
-        self.trigger_callback(self.EVENT_CAPABILITY_CHANGE, capabilities)
+        self._dispatch(_EV_CAPABILITY_CHANGE, capabilities)
 
     def _notify_connection_change(self, connected: bool) -> None:
         """
@@ -353,8 +708,11 @@ class PlayerController(ABC):
         Args:
             connected: Whether the player is connected
         """
-        # Trigger callbacks only (no corresponding listener method)
-        self.trigger_callback(self.EVENT_CONNECTION_CHANGE, connected)
+        # The state reported before doesn't tell anything about the new
+        # connection
+        self.cached_state = _UNKNOWN
+        # Callbacks only (no corresponding listener method)
+        self._dispatch(_EV_CONNECTION_CHANGE, connected)
     
     def _notify_update_status_change(self, updating: bool) -> None:
         """
@@ -363,22 +721,22 @@ class PlayerController(ABC):
         Args:
             updating: Whether the database is being updated
         """
-        # Trigger callbacks only (no corresponding listener method)
-        self.trigger_callback(self.EVENT_UPDATE_STATUS_CHANGE, updating)
+        # Callbacks only (no corresponding listener method)
+        self._dispatch(_EV_UPDATE_STATUS_CHANGE, updating)
     
     def _notify_playlist_change(self) -> None:
         """
         Notify that playlists have changed
         """
         # Trigger callbacks only (no corresponding listener method)
-        self.trigger_callback(self.EVENT_PLAYLIST_CHANGE)
+        self.trigger_callback(_EV_PLAYLIST_CHANGE)
     
     def _notify_queue_change(self) -> None:
         """
         Notify that the playback queue has changed
         """
         # Trigger callbacks only (no corresponding listener method)
-        self.trigger_callback(self.EVENT_QUEUE_CHANGE)
+        self.trigger_callback(_EV_QUEUE_CHANGE)
     
     @classmethod
     def createController(cls, name: str, configdata: Optional[Dict[str, Any]] = None) -> Optional['PlayerController']:
@@ -393,20 +751,19 @@ class PlayerController(ABC):
             PlayerController instance if successful, None otherwise
         """
         try:
-            # Try to import the module for this player type
-            module_name = f"ac3.player.{name.lower()}"
-            # Log the module and class names being resolved for debugging
-            logger.debug(f"Attempting to import module: {module_name}")
-            module = importlib.import_module(module_name)
-            if hasattr(module, "PROVIDES_CONTROLLERS"):
-                for controller_class_name in module.PROVIDES_CONTROLLERS:
-                    if controller_class_name.lower() == f"{name.lower()}playercontroller":
-                        controller_class = getattr(module, controller_class_name)
-                        break
+            key = name.lower()
+            controller_class = PlayerController._controller_classes.get(key)
+            if controller_class is None:
+                entry_point = _controller_entry_points().get(key)
+                if entry_point is not None:
+                    # Registered controllers are only imported when they are used
+                    logger.debug(f"Loading controller {name} from entry point {entry_point.value}")
+                    controller_class = entry_point.load()
+                    if not (isinstance(controller_class, type) and issubclass(controller_class, PlayerController)):
+                        raise AttributeError(f"Entry point {entry_point.value} is not a player controller class")
                 else:
-                    raise AttributeError(f"Controller class for {name} not found in PROVIDES_CONTROLLERS")
-            else:
-                raise AttributeError(f"Module {module_name} does not define PROVIDES_CONTROLLERS")
+                    controller_class = cls._import_controller_class(name)
+                PlayerController._controller_classes[key] = controller_class
             
             # Create an instance of the controller
             logger.info(f"Creating player controller for {name}")
@@ -426,6 +783,39 @@ class PlayerController(ABC):
             
         return None
     
+    @staticmethod
+    def _import_controller_class(name: str) -> Type['PlayerController']:
+        """
+        Import the controller class of a player type from the ac3.player package
+        
+        Args:
+            name: Name of the player type (e.g., 'mpd', 'spotify')
+            
+        Returns:
+            The controller class
+            
+        Raises:
+            ImportError: If there is no module for the player type
+            AttributeError: If the module doesn't provide the controller class
+        """
+        import importlib
+
+        # Try to import the module for this player type
+        module_name = f"ac3.player.{name.lower()}"
+        # Log the module and class names being resolved for debugging
+        logger.debug(f"Attempting to import module: {module_name}")
+        module = importlib.import_module(module_name)
+        if hasattr(module, "PROVIDES_CONTROLLERS"):
+            for controller_class_name in module.PROVIDES_CONTROLLERS:
+                if controller_class_name.lower() == f"{name}{_CTRL_SUFFIX}".lower():
+                    controller_class = getattr(module, controller_class_name)
+                    break
+            else:
+                raise AttributeError(f"Controller class for {name} not found in PROVIDES_CONTROLLERS")
+        else:
+            raise AttributeError(f"Module {module_name} does not define PROVIDES_CONTROLLERS")
+        return controller_class
+    
     @property
     def player_id(self) -> str:
         """Return the player identifier"""
@@ -447,9 +837,9 @@ class PlayerController(ABC):
             name=self.name,
             player_id=self.player_id,
             type="generic",
-            capabilities=[],
+            capabilities=_NO_CAPABILITIES,
             active=False,
-            state=PlayerState.STOPPED.value,
+            state=_STOPPED,
             volume=0,
             muted=False
         )
@@ -644,11 +1034,41 @@ class PlayerController(ABC):
         """
         Check if the player is currently active (playing)
         
+        Uses the state from the last state change notification if it is
+        recent. Otherwise the player is asked for its player info, as it
+        might have changed its state without a notification.
+        
         Returns:
             True if the player state is 'playing', False otherwise
         """
+        state = self.cached_state
+        if state != _UNKNOWN and time.monotonic() - self._cached_state_time < _CACHED_STATE_MAX_AGE:
+            return state == _PLAYING
         player_info = self.get_player_info()
-        return player_info.state == PlayerState.PLAYING.value if player_info and player_info.state else False
+        if not player_info or not player_info.state:
+            return False
+        self._set_cached_state(str(player_info.state))
+        return player_info.state == _PLAYING
+    
+    def snapshot(self) -> PlayerSnapshot:
+        """
+        Get the state, shuffle, loop mode, update and active status at once
+        
+        Players that get all of them with one request override this, so
+        callers needing several of them only pay for one request.
+        
+        Returns:
+            PlayerSnapshot with the current values
+        """
+        player_info = self.get_player_info()
+        state = player_info.state if player_info and player_info.state else _UNKNOWN
+        return PlayerSnapshot(
+            state=state,
+            shuffle=self.get_shuffle(),
+            loop=self.get_loop_mode(),
+            updating=self.isUpdating(),
+            active=state == _PLAYING
+        )
     
     def supports(self, feature: str) -> bool:
         """
@@ -661,4 +1081,5 @@ class PlayerController(ABC):
             True if feature is supported, False otherwise
         """
         capabilities = self.get_player_info().capabilities
-        return capabilities is not None and feature in capabilities
\ No newline at end of file
+        return capabilities is not None and feature in capabilities
+
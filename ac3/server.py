@@ -3,7 +3,6 @@ AudioControl3 REST API Server
 Provides a simple REST API to access information about AudioControl3
 """
 
-from flask import Flask, jsonify, request
 import logging
 import json
 from dataclasses import asdict
@@ -15,8 +14,9 @@ logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("ac3.server")
 
-# Create Flask application
-app = Flask(__name__)
+# Flask application, created on first use so importing this module doesn't
+# load Flask and its dependencies
+_app = None
 
 # Get version from package
 VERSION = __version__
@@ -29,28 +29,128 @@ current_song = Song(
 )
 
 
-@app.route('/system-info', methods=['GET'])
-def system_info():
-    """Endpoint to return AudioControl3 system information"""
-    logger.info("System info requested")
-    return jsonify({
-        "name": "AudioControl3",
-        "version": VERSION,
-        "status": "running"
-    })
+def _register_routes(app):
+    """
+    Add the API endpoints to a Flask application
+    
+    Args:
+        app: The Flask application
+    """
+    from flask import jsonify
+    
+    @app.route('/system-info', methods=['GET'])
+    def system_info():
+        """Endpoint to return AudioControl3 system information"""
+        logger.info("System info requested")
+        return jsonify({
+            "name": "AudioControl3",
+            "version": VERSION,
+            "status": "running"
+        })
+
+
+def _use_orjson(app):
+    """
+    Let Flask encode and decode JSON with orjson if it is installed
+    
+    Args:
+        app: The Flask application
+    """
+    try:
+        import orjson
+        # JSON providers exist since Flask 2.2
+        from flask.json.provider import DefaultJSONProvider
+    except ImportError:
+        return
+    
+    # Let Flask's default() serialize dates and dataclasses, so the output
+    # doesn't change with orjson
+    options = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME |
+               orjson.OPT_PASSTHROUGH_DATACLASS)
+    
+    class OrjsonProvider(DefaultJSONProvider):
+        """
+        JSON provider that uses orjson and falls back to json for options only it supports
+        
+        orjson always writes UTF-8, so non-ASCII characters are not escaped
+        unless ensure_ascii is set to True again, which uses json.
+        """
+        
+        ensure_ascii = False
+        
+        def dumps(self, obj, **kwargs):
+            # response() asks for either compact or indented output
+            if self.ensure_ascii:
+                return super().dumps(obj, **kwargs)
+            if not kwargs or kwargs == {"separators": (",", ":")}:
+                option = options
+            elif kwargs == {"indent": 2}:
+                option = options | orjson.OPT_INDENT_2
+            else:
+                return super().dumps(obj, **kwargs)
+            if self.sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        
+        def loads(self, s, **kwargs):
+            if kwargs:
+                return super().loads(s, **kwargs)
+            return orjson.loads(s)
+    
+    app.json = OrjsonProvider(app)
+
+
+def get_app():
+    """
+    Get the Flask application, creating it on the first call
+    
+    Returns:
+        The Flask application with all endpoints
+    """
+    global _app
+    if _app is None:
+        from flask import Flask
+        app = Flask(__name__)
+        _use_orjson(app)
+        _register_routes(app)
+        _app = app
+    return _app
+
+
+def __getattr__(name):
+    """Create the application when the module attribute app is accessed"""
+    if name == "app":
+        return get_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 
-def start_server(host='0.0.0.0', port=5000, debug=False):
+def start_server(host='0.0.0.0', port=5000, debug=False, threads=4):
     """
     Start the REST API server
     
+    The server runs in waitress if it is installed, which handles requests
+    in a pool of threads. In debug mode, or without waitress, the Flask
+    development server is used.
+    
     Args:
         host: Host address to bind to
         port: Port to listen on
         debug: Whether to run in debug mode
+        threads: Number of threads handling requests in waitress
     """
     logger.info(f"Starting AudioControl3 server on {host}:{port}")
+    app = get_app()
+    
+    if not debug:
+        try:
+            from waitress import serve
+        except ImportError:
+            logger.warning("waitress is not installed, using the Flask development server")
+        else:
+            serve(app, host=host, port=port, threads=threads)
+            return
+    
     app.run(host=host, port=port, debug=debug)
 
 
@@ -7,6 +7,10 @@ keyboard shortcuts for common actions.
 """
 
 import curses
+import functools
+import os
+import select
+import sys
 import threading
 import time
 import logging
@@ -18,38 +22,20 @@ from ac3.player.player_controller import PlayerController, PlayerState
 
 logger = logging.getLogger("ac3.ui.textui")
 
-class UIUpdater(threading.Thread):
+
+@functools.lru_cache(maxsize=4096)
+def _format_seconds(seconds: int) -> str:
     """
-    Background thread to update the play position in the TextUI when no messages
-    are received from the AudioController. This ensures the position progresses
-    automatically as long as the state is playing and the position is before
-    the end of the song.
+    Format whole seconds as MM:SS, cached as positions repeat every draw
+    
+    Args:
+        seconds: Time in seconds
+        
+    Returns:
+        Formatted time string
     """
-    def __init__(self, text_ui: 'TextUI'):
-        super().__init__(daemon=True)
-        self.text_ui = text_ui
-        self.running = False
+    return f"{seconds // 60:02d}:{seconds % 60:02d}"
 
-    def run(self):
-        self.running = True
-        while self.running:
-            try:
-                if (self.text_ui.current_player and 
-                    self.text_ui.current_player.state == PlayerState.PLAYING and
-                    self.text_ui.current_song and
-                    self.text_ui.current_position is not None and
-                    self.text_ui.current_position < self.text_ui.current_song.duration):
-                    
-                    # Increment the position by 1 second
-                    self.text_ui.current_position += 1
-                    self.text_ui._request_screen_update()
-
-                time.sleep(1)  # Update once per second
-            except Exception as e:
-                logger.error(f"Error in UIUpdater: {e}")
-
-    def stop(self):
-        self.running = False
 
 class TextUI:
     """
@@ -76,6 +62,11 @@ class TextUI:
     KEY_REFRESH = ord('R')
     KEY_SWITCH_CONTROLLER = ord('c')
     
+    # Texts that never change
+    HEADER = "AudioControl3 Text UI"
+    HELP_VOLUME = "+/-: Volume  m: Mute  r: Shuffle  l: Loop"
+    HELP_OTHER = "Left/Right: Seek  c: Switch Controller  q: Quit"
+    
     def __init__(self, audio_controller: AudioController):
         """
         Initialize the Text UI
@@ -86,25 +77,43 @@ class TextUI:
         self.audio_controller = audio_controller
         self.stdscr = None
         self.running = False
-        self.update_thread = None
+        self.input_thread = None
+        # Pipe that wakes up the input thread when the UI stops
+        self._stop_pipe: Optional[tuple] = None
         self.current_player: Optional[Player] = None
         self.current_song: Optional[Song] = None
         self.current_volume: int = 0
         self.current_position: Optional[float] = None
         self.message: str = ""
         self.message_timeout: float = 0
-        self.registered_callbacks: List[tuple] = []
+        # Token of the AudioController listeners while they are registered
+        self._subscription: Optional[tuple] = None
         
-        # Add a timestamp to track when updates are requested
+        # Add a timestamp to track when updates are requested, it is only
+        # ever replaced as a whole, so it needs no lock
         self.last_update_request = 0
-        # Add a lock to protect access to the timestamp
-        self.update_lock = threading.Lock()
-        # Set an update interval to avoid too frequent updates
-        self.min_update_interval = 0.1  # seconds
+        # Wakes up the main loop, set by update requests and when keys are
+        # available
+        self._wake = threading.Event()
+        # Set by the input thread when keys are available, and by the main
+        # loop once it read them
+        self._keys_pending = False
+        self._keys_read = threading.Event()
+        # Minimum time between two draws, requests in between are combined
+        # into one draw (about 30 frames per second)
+        self.min_update_interval = 0.033  # seconds
 
-        self.ui_updater = UIUpdater(self)
         self.can_next = False
         self.can_previous = False
+        # Help line for the playback keys, depends on the capabilities
+        self._help_playback = self._playback_help()
+        
+        # What is currently on the screen, so only changed parts are drawn:
+        # (line, column, text, attributes) by field name and the number of
+        # filled cells of the progress bar
+        self._screen_size: Optional[tuple] = None
+        self._drawn: Dict[str, tuple] = {}
+        self._drawn_filled: Optional[int] = None
     
     def start(self):
         """
@@ -119,18 +128,19 @@ class TextUI:
         curses.cbreak()
         curses.curs_set(0)  # Hide cursor
         self.stdscr.keypad(True)
-        self.stdscr.timeout(100)  # Non-blocking input with 100ms timeout
+        self.stdscr.nodelay(True)  # Keys are only read when the input thread reports some
         
         # Start in a try-finally block to ensure proper cleanup
         try:
-            # Start update thread (less frequent updates as a backup)
             self.running = True
-            self.update_thread = threading.Thread(target=self._update_info_thread)
-            self.update_thread.daemon = True
-            self.update_thread.start()
-
-            # Start UIUpdater thread
-            self.ui_updater.start()
+            
+            # Later changes are reported by the callbacks
+            self._refresh_state()
+            
+            # Start the thread that waits for keys
+            self._stop_pipe = os.pipe()
+            self.input_thread = threading.Thread(target=self._input_thread, daemon=True)
+            self.input_thread.start()
             
             # Run main loop
             self._main_loop()
@@ -143,9 +153,16 @@ class TextUI:
         Stop the TextUI and its background threads.
         """
         self.running = False
-        self.ui_updater.stop()
-        if self.update_thread is not None:
-            self.update_thread.join(timeout=1.0)
+        self._wake.set()
+        self._keys_read.set()
+        if self._stop_pipe is not None:
+            os.write(self._stop_pipe[1], b"x")
+        if self.input_thread is not None:
+            self.input_thread.join(timeout=1.0)
+        if self._stop_pipe is not None:
+            for pipe_fd in self._stop_pipe:
+                os.close(pipe_fd)
+            self._stop_pipe = None
         self._unregister_player_callbacks()
         if self.stdscr is not None:
             self.stdscr.keypad(False)
@@ -158,22 +175,22 @@ class TextUI:
         Register callbacks for player events
         """
         # Register callbacks with the AudioController
-        self.audio_controller.add_listener(EventType.PLAYER_STATE_CHANGE, self._on_player_state_change)
-        self.audio_controller.add_listener(EventType.SONG_CHANGE, self._on_song_change)
-        self.audio_controller.add_listener(EventType.VOLUME_CHANGE, self._on_volume_change)
-        self.audio_controller.add_listener(EventType.POSITION_CHANGE, self._on_position_change)
-        self.audio_controller.add_listener(EventType.CAPABILITY_CHANGE, self._on_capability_change)
+        self._subscription = self.audio_controller.add_listeners({
+            EventType.PLAYER_STATE_CHANGE: self._on_player_state_change,
+            EventType.SONG_CHANGE: self._on_song_change,
+            EventType.VOLUME_CHANGE: self._on_volume_change,
+            EventType.POSITION_CHANGE: self._on_position_change,
+            EventType.CAPABILITY_CHANGE: self._on_capability_change,
+        })
     
     def _unregister_player_callbacks(self):
         """
         Unregister all callbacks
         """
         # Unregister callbacks from the AudioController
-        self.audio_controller.remove_listener(EventType.PLAYER_STATE_CHANGE, self._on_player_state_change)
-        self.audio_controller.remove_listener(EventType.SONG_CHANGE, self._on_song_change)
-        self.audio_controller.remove_listener(EventType.VOLUME_CHANGE, self._on_volume_change)
-        self.audio_controller.remove_listener(EventType.POSITION_CHANGE, self._on_position_change)
-        self.audio_controller.remove_listener(EventType.CAPABILITY_CHANGE, self._on_capability_change)
+        if self._subscription is not None:
+            self.audio_controller.remove_listeners(self._subscription)
+            self._subscription = None
     
     def _on_player_state_change(self, player: Player) -> None:
         """
@@ -184,7 +201,13 @@ class TextUI:
         """
         # Only update if this is the active player
         if self.audio_controller.active_controller_id == player.player_id:
-            logger.debug(f"Player state changed: {player.state}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Player state changed: %s", player.state)
+            if not self.current_player or self.current_player.player_id != player.player_id:
+                # Another player became active, the song, volume and
+                # position shown are still those of the previous one
+                self._refresh_state()
+                return
             self.current_player = player
             self._update_capabilities()  # Update capabilities when player state changes
             # Force a screen update
@@ -197,7 +220,8 @@ class TextUI:
         Args:
             song: New song information
         """
-        logger.debug(f"Song changed: {song.title if song else 'None'}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Song changed: %s", song.title if song else "None")
         self.current_song = song
         self._update_capabilities()  # Update capabilities when song changes
         # Force a screen update
@@ -210,7 +234,8 @@ class TextUI:
         Args:
             volume: New volume level
         """
-        logger.debug(f"Volume changed: {volume}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Volume changed: %s", volume)
         self.current_volume = volume
         # Force a screen update
         self._request_screen_update()
@@ -222,7 +247,15 @@ class TextUI:
         Args:
             position: New playback position
         """
+        previous = self.current_position
         self.current_position = position
+        
+        # Only full seconds and filled cells of the progress bar are shown,
+        # players may report the position much more often
+        if previous is not None and position is not None and int(previous) == int(position):
+            progress_width = self._screen_size[1] - 4 if self._screen_size else 0
+            if self._filled_cells(previous, progress_width) == self._filled_cells(position, progress_width):
+                return
         # Force a screen update
         self._request_screen_update()
     
@@ -233,10 +266,14 @@ class TextUI:
         Args:
             capabilities: List of updated capabilities.
         """
-        logger.debug(f"Capabilities changed: {capabilities}")
-        # Update the UI to reflect the new capabilities
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Capabilities changed: %s", capabilities)
+        # Update the UI to reflect the new capabilities, if they change
+        # what is shown
+        shown = (self.can_next, self.can_previous)
         self._update_capabilities(capabilities)
-        self._request_screen_update()
+        if (self.can_next, self.can_previous) != shown:
+            self._request_screen_update()
     
     def _update_capabilities(self, capabilities: Optional[List[str]] = None):
         """
@@ -244,19 +281,31 @@ class TextUI:
         
         Args:
             capabilities: Optional list of updated capabilities. If not provided,
-                          capabilities will be checked from the audio_controller.
+                          the capabilities of the current player are used.
         """
         if capabilities is not None:
             # Use the provided capabilities directly
             self.can_next = PlayerController.CAP_NEXT in capabilities
             self.can_previous = PlayerController.CAP_PREVIOUS in capabilities
-        elif self.current_player:
-            # Get capabilities from the audio controller
-            self.can_next = self.audio_controller.can_next()
-            self.can_previous = self.audio_controller.can_previous()
+        elif self.current_player and self.current_player.capabilities is not None:
+            # Use the capabilities the player reported
+            self.can_next = PlayerController.CAP_NEXT in self.current_player.capabilities
+            self.can_previous = PlayerController.CAP_PREVIOUS in self.current_player.capabilities
         else:
             self.can_next = False
             self.can_previous = False
+        self._help_playback = self._playback_help()
+    
+    def _playback_help(self) -> str:
+        """
+        Build the help line for the playback keys
+        
+        Returns:
+            Help text showing which of the keys are disabled
+        """
+        next_text = "n: Next" if self.can_next else "n: Next (disabled)"
+        prev_text = "p: Previous" if self.can_previous else "p: Previous (disabled)"
+        return f"Space: Play/Pause  s: Stop  {next_text}  {prev_text}"
     
     def _request_screen_update(self):
         """
@@ -265,180 +314,287 @@ class TextUI:
         This method is called from callbacks that run in different threads.
         It marks that an update is needed, which the main loop will detect.
         """
-        # Thread-safely update the last update request timestamp
-        with self.update_lock:
-            self.last_update_request = time.time()
+        # Storing the timestamp is atomic, setting the event afterwards makes
+        # it visible to the main loop
+        self.last_update_request = time.monotonic()
+        self._wake.set()
     
     def _main_loop(self):
         """
         Main UI loop - handle keypresses and refresh display
+        
+        The loop sleeps until it is woken up by an update request or by
+        keys, or until the next draw is due.
+        
+        While playing, it also advances the position once per second, so it
+        progresses even if the player doesn't report it.
         """
         last_draw_time = 0
+        last_tick_time = 0
+        wake = self._wake
+        # Not affected by changes of the system time
+        monotonic = time.monotonic
         
         while self.running:
             try:
-                current_time = time.time()
+                # Cleared before checking for work, so requests made after
+                # this point end the wait below
+                wake.clear()
+                current_time = monotonic()
+                
+                advancing = self._position_advancing()
+                if not advancing:
+                    last_tick_time = current_time
+                elif current_time - last_tick_time >= 1.0:
+                    self.current_position += 1
+                    last_tick_time = current_time
+                    self._request_screen_update()
                 
                 # Check if an update has been requested since the last draw
-                update_needed = False
-                with self.update_lock:
-                    if self.last_update_request > last_draw_time:
-                        update_needed = True
+                update_needed = self.last_update_request > last_draw_time
                 
                 # Draw the screen if:
-                # 1. An update has been requested, or
+                # 1. An update has been requested and the last draw is at
+                #    least min_update_interval ago, otherwise the request
+                #    stays pending and is drawn in a later iteration, or
                 # 2. It's been at least 0.5 seconds since the last draw (periodic refresh)
-                if update_needed or (current_time - last_draw_time) >= 0.5:
+                since_draw = current_time - last_draw_time
+                if (update_needed and since_draw >= self.min_update_interval) or since_draw >= 0.5:
                     self._draw_screen()
+                    curses.doupdate()
                     last_draw_time = current_time
+                    since_draw = 0
+                    update_needed = False
                 
-                # Handle keypress (this has a built-in timeout)
-                self._handle_keypress()
+                if self._keys_pending:
+                    self._keys_pending = False
+                    self._handle_keypress()
+                    self._keys_read.set()
+                    continue
                 
-                # Small sleep to prevent 100% CPU usage
-                time.sleep(0.01)
+                # Sleep until a pending update may be drawn, the next
+                # periodic refresh or the next position step
+                if update_needed:
+                    timeout = self.min_update_interval - since_draw
+                else:
+                    timeout = 0.5 - since_draw
+                if advancing:
+                    timeout = min(timeout, last_tick_time + 1.0 - current_time)
+                wake.wait(max(0, timeout))
                 
             except Exception as e:
                 logger.error(f"Error in UI main loop: {e}")
                 self.show_message(f"Error: {e}")
     
-    def _update_info_thread(self):
+    def _position_advancing(self) -> bool:
+        """
+        Check if the shown position should advance by itself
+        
+        Returns:
+            True if the player is playing and the position is before the end
+            of the song
+        """
+        return bool(self.current_player and
+                    self.current_player.state == PlayerState.PLAYING.value and
+                    self.current_song and self.current_song.duration and
+                    self.current_position is not None and
+                    self.current_position < self.current_song.duration)
+    
+    def _input_thread(self):
         """
-        Background thread to periodically update player information
+        Background thread that wakes up the main loop when keys are available
         
-        This is now less important as we get most updates via callbacks,
-        but we keep it as a backup for controllers that don't send updates
-        or for information not provided by callbacks.
+        Curses isn't thread-safe, getch() also refreshes the window, so this
+        thread only waits for input and the main loop reads the keys. It
+        blocks until there is input or the UI stops.
         """
+        fd = sys.stdin.fileno()
+        stop_fd = self._stop_pipe[0]
         while self.running:
             try:
-                # Update player info - now less frequently as we get most updates via callbacks
-                active_player = self.audio_controller.get_active_player_info()
-                
-                # Only update if we have a new active player or controller doesn't support callbacks
-                if not self.current_player or active_player.player_id != self.current_player.player_id:
-                    self.current_player = active_player
-                    self.current_song = self.audio_controller.get_current_song()
-                    self.current_volume = self.audio_controller.get_volume() or 0
-                    self.current_position = self.audio_controller.get_position()
-                
-            except Exception as e:
-                logger.error(f"Error updating player info: {e}")
-                
-            # Sleep for 2 seconds (slower updates now that we have callbacks)
-            time.sleep(2.0)
+                readable, _, _ = select.select([fd, stop_fd], [], [])
+            except (OSError, ValueError) as e:
+                logger.error(f"Error waiting for keys: {e}")
+                break
+            if stop_fd in readable:
+                break
+            self._keys_read.clear()
+            if not self.running:
+                # stop() may have set the event before it was cleared
+                break
+            self._keys_pending = True
+            self._wake.set()
+            # The input stays readable until the main loop read it
+            self._keys_read.wait()
     
-    def _handle_keypress(self):
+    def _refresh_state(self):
         """
-        Handle keyboard input
+        Get the complete state of the active player
+        
+        Used at startup and when another player becomes active, the
+        callbacks only report what changes afterwards.
         """
         try:
-            key = self.stdscr.getch()
-            if key == -1:  # No key pressed
-                return
-
-            if key == self.KEY_QUIT:
-                self.running = False
-            elif key == self.KEY_PLAY or key == self.KEY_PAUSE:
-                # Toggle between play and pause
-                if self.current_player and self.current_player.state == PlayerState.PLAYING:
-                    self.audio_controller.pause()
-                    self.show_message("Pause")
-                else:
-                    self.audio_controller.play()
-                    self.show_message("Play")
-            elif key == self.KEY_STOP:
-                self.audio_controller.stop()
-                self.show_message("Stop")
-            elif key == self.KEY_NEXT and self.can_next:
-                self.audio_controller.next()
-                self.show_message("Next track")
-            elif key == self.KEY_PREV and self.can_previous:
-                self.audio_controller.previous()
-                self.show_message("Previous track")
-            elif key == self.KEY_VOLUME_UP:
-                new_vol = min(100, (self.current_volume or 0) + 5)
-                self.audio_controller.set_volume(new_vol)
-                self.show_message(f"Volume: {new_vol}%")
-            elif key == self.KEY_VOLUME_DOWN:
-                new_vol = max(0, (self.current_volume or 0) - 5)
-                self.audio_controller.set_volume(new_vol)
-                self.show_message(f"Volume: {new_vol}%")
-            elif key == self.KEY_MUTE:
-                is_muted = self.audio_controller.is_muted()
-                if is_muted is not None:
-                    self.audio_controller.mute(not is_muted)
-                    self.show_message(f"{'Muted' if not is_muted else 'Unmuted'}")
-            elif key == self.KEY_SHUFFLE:
-                shuffle = self.audio_controller.get_shuffle()
-                if shuffle is not None:
-                    self.audio_controller.set_shuffle(not shuffle)
-                    self.show_message(f"Shuffle {'on' if not shuffle else 'off'}")
-            elif key == self.KEY_LOOP:
-                # Cycle through loop modes
-                from ac3.player.player_controller import LoopMode
-                current_mode = self.audio_controller.get_loop_mode()
-                if current_mode == LoopMode.NONE:
-                    new_mode = LoopMode.TRACK
-                    mode_name = "Track"
-                elif current_mode == LoopMode.TRACK:
-                    new_mode = LoopMode.PLAYLIST
-                    mode_name = "Playlist"
-                else:
-                    new_mode = LoopMode.NONE
-                    mode_name = "Off"
-                self.audio_controller.set_loop_mode(new_mode)
-                self.show_message(f"Loop mode: {mode_name}")
-            elif key == self.KEY_SEEK_FWD:
-                # Seek forward 10 seconds
-                pos = self.current_position
-                if pos is not None:
-                    self.audio_controller.seek(pos + 10)
-                    self.show_message("Seek +10s")
-            elif key == self.KEY_SEEK_BACK:
-                # Seek backward 10 seconds
-                pos = self.current_position
-                if pos is not None:
-                    self.audio_controller.seek(max(0, pos - 10))
-                    self.show_message("Seek -10s")
-            elif key == self.KEY_SWITCH_CONTROLLER:
-                # Show available controllers and let user switch
-                self._show_controller_selection()
+            player, song, volume, position, capabilities = self.audio_controller.snapshot()
+            self.current_player = player
+            self.current_song = song
+            self.current_volume = volume or 0
+            self.current_position = position
+            self._update_capabilities(capabilities)
         except Exception as e:
-            logger.error(f"Error handling keypress: {e}")
-            self.show_message(f"Error: {e}")
+            logger.error(f"Error updating player info: {e}")
+        self._request_screen_update()
+    
+    def _handle_keypress(self):
+        """
+        Handle all available keyboard input
+        
+        Curses may have buffered more keys than the input thread can see,
+        e.g. after an escape sequence, so keys are read until none is left.
+        Repeated volume keys are combined into one volume change.
+        """
+        volume_step = 0
+        while self.running:
+            try:
+                key = self.stdscr.getch()
+                if key == -1:  # No more keys
+                    break
+                if key == self.KEY_VOLUME_UP:
+                    volume_step += 5
+                    continue
+                if key == self.KEY_VOLUME_DOWN:
+                    volume_step -= 5
+                    continue
+                if volume_step:
+                    # Keep the order of the volume change and this key
+                    self._change_volume(volume_step)
+                    volume_step = 0
+                self._handle_key(key)
+            except Exception as e:
+                logger.error(f"Error handling keypress: {e}")
+                self.show_message(f"Error: {e}")
+        
+        if volume_step:
+            try:
+                self._change_volume(volume_step)
+            except Exception as e:
+                logger.error(f"Error handling keypress: {e}")
+                self.show_message(f"Error: {e}")
+    
+    def _change_volume(self, step: int):
+        """
+        Change the volume of the active player
+        
+        Args:
+            step: Volume change in percent, may be negative
+        """
+        new_vol = min(100, max(0, (self.current_volume or 0) + step))
+        self.audio_controller.set_volume(new_vol)
+        self.show_message(f"Volume: {new_vol}%")
+    
+    def _handle_key(self, key: int):
+        """
+        Handle a key other than the volume keys, errors are handled by the
+        caller
+        
+        Args:
+            key: Key code returned by getch()
+        """
+        if key == self.KEY_QUIT:
+            self.running = False
+        elif key == self.KEY_PLAY or key == self.KEY_PAUSE:
+            # Toggle between play and pause
+            if self.current_player and self.current_player.state == PlayerState.PLAYING.value:
+                self.audio_controller.pause()
+                self.show_message("Pause")
+            else:
+                self.audio_controller.play()
+                self.show_message("Play")
+        elif key == self.KEY_STOP:
+            self.audio_controller.stop()
+            self.show_message("Stop")
+        elif key == self.KEY_NEXT and self.can_next:
+            self.audio_controller.next()
+            self.show_message("Next track")
+        elif key == self.KEY_PREV and self.can_previous:
+            self.audio_controller.previous()
+            self.show_message("Previous track")
+        elif key == self.KEY_MUTE:
+            is_muted = self.audio_controller.is_muted()
+            if is_muted is not None:
+                self.audio_controller.mute(not is_muted)
+                self.show_message(f"{'Muted' if not is_muted else 'Unmuted'}")
+        elif key == self.KEY_SHUFFLE:
+            shuffle = self.audio_controller.get_shuffle()
+            if shuffle is not None:
+                self.audio_controller.set_shuffle(not shuffle)
+                self.show_message(f"Shuffle {'on' if not shuffle else 'off'}")
+        elif key == self.KEY_LOOP:
+            # Cycle through loop modes
+            from ac3.player.player_controller import LoopMode
+            current_mode = self.audio_controller.get_loop_mode()
+            if current_mode == LoopMode.NONE:
+                new_mode = LoopMode.TRACK
+                mode_name = "Track"
+            elif current_mode == LoopMode.TRACK:
+                new_mode = LoopMode.PLAYLIST
+                mode_name = "Playlist"
+            else:
+                new_mode = LoopMode.NONE
+                mode_name = "Off"
+            self.audio_controller.set_loop_mode(new_mode)
+            self.show_message(f"Loop mode: {mode_name}")
+        elif key == self.KEY_SEEK_FWD:
+            # Seek forward 10 seconds
+            pos = self.current_position
+            if pos is not None:
+                self.audio_controller.seek(pos + 10)
+                self.show_message("Seek +10s")
+        elif key == self.KEY_SEEK_BACK:
+            # Seek backward 10 seconds
+            pos = self.current_position
+            if pos is not None:
+                self.audio_controller.seek(max(0, pos - 10))
+                self.show_message("Seek -10s")
+        elif key == self.KEY_SWITCH_CONTROLLER:
+            # Show available controllers and let user switch
+            self._show_controller_selection()
     
     def _show_controller_selection(self):
         """
         Show a menu to select an active controller
-        """
-        # When switching controllers, we need to update our callbacks
-        old_controllers = set(controller for controller, _, _ in self.registered_callbacks)
         
+        The menu is drawn on a pad covering the screen, so the main screen
+        keeps its contents and only needs to be copied to the terminal again
+        afterwards.
+        """
         controllers = self.audio_controller.get_controllers()
         if not controllers:
             self.show_message("No controllers available")
             return
-            
-        # Clear screen
-        self.stdscr.clear()
+        
+        height, width = self.stdscr.getmaxyx()
+        menu = curses.newpad(max(height, len(controllers) + 3), width)
+        menu.keypad(True)
         
         # Draw header
-        self.stdscr.addstr(0, 0, "Available Controllers", curses.A_BOLD)
-        self.stdscr.addstr(1, 0, "Press number to select, ESC to cancel")
+        menu.addnstr(0, 0, "Available Controllers", width - 1, curses.A_BOLD)
+        menu.addnstr(1, 0, "Press number to select, ESC to cancel", width - 1)
         
         # Draw controllers
         for i, controller in enumerate(controllers):
             line = 3 + i
             active = controller.player_id == self.audio_controller.active_controller_id
             prefix = "* " if active else "  "
-            self.stdscr.addstr(line, 0, f"{i+1}. {prefix}{controller.name} ({controller.player_id})")
+            menu.addnstr(line, 0, f"{i+1}. {prefix}{controller.name} ({controller.player_id})", width - 1)
         
-        self.stdscr.refresh()
+        menu.noutrefresh(0, 0, 0, 0, height - 1, width - 1)
+        curses.doupdate()
         
-        # Wait for selection
+        # Wait for selection, getch() on a pad blocks and doesn't refresh
+        # the main screen
         while True:
-            key = self.stdscr.getch()
+            key = menu.getch()
             if key == 27:  # ESC
                 break
                 
@@ -448,15 +604,13 @@ class TextUI:
                 if idx < len(controllers):
                     controller = controllers[idx]
                     self.audio_controller.set_active_controller(controller.player_id)
-                    
-                    # Update our callbacks if we have new controllers
-                    new_controllers = set(controllers)
-                    if new_controllers != old_controllers:
-                        self._unregister_player_callbacks()
-                        self._register_player_callbacks()
-                    
+                    self._refresh_state()
                     self.show_message(f"Switched to {controller.name}")
                     break
+        
+        # Copy the whole main screen to the terminal again with the next draw
+        self.stdscr.touchwin()
+        self._request_screen_update()
     
     def _format_time(self, seconds: Optional[float]) -> str:
         """
@@ -470,10 +624,7 @@ class TextUI:
         """
         if seconds is None:
             return "--:--"
-        
-        minutes = int(seconds) // 60
-        secs = int(seconds) % 60
-        return f"{minutes:02d}:{secs:02d}"
+        return _format_seconds(int(seconds))
     
     def show_message(self, message: str, timeout: float = 3.0):
         """
@@ -484,11 +635,95 @@ class TextUI:
             timeout: Time in seconds to show the message
         """
         self.message = message
-        self.message_timeout = time.time() + timeout
+        self.message_timeout = time.monotonic() + timeout
+    
+    def _put(self, field: str, line: int, col: int, text: Optional[str], attr: int = 0):
+        """
+        Draw a field of the screen if it changed since it was last drawn
+        
+        Text that doesn't fit is cut off at the end of the line.
+        
+        Args:
+            field: Name of the field
+            line: Screen line
+            col: Screen column
+            text: Text to show, or None to remove the field
+            attr: Curses attributes for the text
+        """
+        new = (line, col, text, attr) if text else None
+        old = self._drawn.get(field)
+        if new == old:
+            return
+        width = self._screen_size[1]
+        if old is not None:
+            old_line, old_col, old_text, _ = old
+            if new is None or old_line != line or old_col != col or len(old_text) > len(text):
+                # Blank the old text, it would otherwise remain visible
+                self.stdscr.hline(old_line, old_col, " ", min(len(old_text), width - old_col - 1))
+        if new is None:
+            self._drawn.pop(field, None)
+            return
+        self.stdscr.addnstr(line, col, text, width - col - 1, attr)
+        self._drawn[field] = new
+    
+    def _put_progress(self, line: int, progress_width: int, filled: Optional[int]):
+        """
+        Draw the progress bar, only changing the cells between the previously
+        and the newly filled part
+        
+        Args:
+            line: Screen line of the progress bar
+            progress_width: Number of cells inside the brackets
+            filled: Number of filled cells, or None to remove the bar
+        """
+        if filled == self._drawn_filled:
+            # The brackets only move when the size changes, which resets
+            # everything drawn
+            return
+        if filled is None:
+            self._put("bar_open", line, 0, None)
+            self._put("bar_close", line, 1 + progress_width, None)
+            if self._drawn_filled:
+                self.stdscr.hline(line, 1, " ", self._drawn_filled)
+            self._drawn_filled = None
+            return
+        
+        self._put("bar_open", line, 0, "[")
+        self._put("bar_close", line, 1 + progress_width, "]")
+        previous = self._drawn_filled or 0
+        # hline() repeats a character without building a string
+        if filled > previous:
+            self.stdscr.hline(line, 1 + previous, "=", filled - previous)
+        elif filled < previous:
+            self.stdscr.hline(line, 1 + filled, " ", previous - filled)
+        self._drawn_filled = filled
+    
+    def _filled_cells(self, position: Optional[float], progress_width: int) -> Optional[int]:
+        """
+        Calculate how many cells of the progress bar are filled
+        
+        Works on full seconds like the time display, so the result is exact
+        and only changes when the shown position does.
+        
+        Args:
+            position: Playback position in seconds, or None
+            progress_width: Number of cells of the progress bar
+            
+        Returns:
+            Number of filled cells, or None if there is no progress to show
+        """
+        if not self.current_song or not self.current_song.duration or position is None:
+            return None
+        filled = int(position) * progress_width // max(1, int(self.current_song.duration))
+        return min(progress_width, max(0, filled))
     
     def _draw_screen(self):
         """
         Draw the UI screen
+        
+        Only the parts that changed since the last call are drawn. The screen
+        is copied to the terminal by the curses.doupdate() call of the main
+        loop.
         """
         if not self.stdscr:
             return
@@ -496,80 +731,78 @@ class TextUI:
         # Get terminal dimensions
         height, width = self.stdscr.getmaxyx()
         
-        # Clear screen
-        self.stdscr.clear()
+        if (height, width) != self._screen_size:
+            # Repaint everything after the terminal size or the screen
+            # contents changed
+            self.stdscr.clear()
+            self._screen_size = (height, width)
+            self._drawn = {}
+            self._drawn_filled = None
+        
+        # Read everything used more than once only once, callbacks may
+        # change it while drawing
+        put = self._put
+        bold = curses.A_BOLD
+        player = self.current_player
+        song = self.current_song
+        position = self.current_position
         
         # Header
-        header = "AudioControl3 Text UI"
-        self.stdscr.addstr(0, (width - len(header)) // 2, header, curses.A_BOLD)
+        put("header", 0, (width - len(self.HEADER)) // 2, self.HEADER, bold)
         
         # Player info
         player_line = 2
-        if self.current_player:
-            player_name = f"Player: {self.current_player.name} ({self.current_player.state})"
-            self.stdscr.addstr(player_line, 0, player_name)
+        if player:
+            player_name = f"Player: {player.name} ({player.state})"
+            put("player", player_line, 0, player_name)
         else:
-            self.stdscr.addstr(player_line, 0, "No active player")
+            put("player", player_line, 0, "No active player")
         
         # Volume
         volume_text = f"Volume: {self.current_volume}%"
-        self.stdscr.addstr(player_line, width - len(volume_text) - 1, volume_text)
+        put("volume", player_line, width - len(volume_text) - 1, volume_text)
         
         # Song info
         song_line = 4
-        if self.current_song:
-            # Title
-            if self.current_song.title:
-                title = f"Title: {self.current_song.title}"
-                self.stdscr.addstr(song_line, 0, title[:width-1])
-                
-            # Artist
-            if self.current_song.artist:
-                artist = f"Artist: {self.current_song.artist}"
-                self.stdscr.addstr(song_line + 1, 0, artist[:width-1])
-                
-            # Album
-            if self.current_song.album:
-                album = f"Album: {self.current_song.album}"
-                self.stdscr.addstr(song_line + 2, 0, album[:width-1])
+        if song:
+            title = f"Title: {song.title}" if song.title else None
+            artist = f"Artist: {song.artist}" if song.artist else None
+            album = f"Album: {song.album}" if song.album else None
+            put("title", song_line, 0, title)
+            put("artist", song_line + 1, 0, artist)
+            put("album", song_line + 2, 0, album)
         else:
-            self.stdscr.addstr(song_line, 0, "No song playing")
+            put("title", song_line, 0, "No song playing")
+            put("artist", song_line + 1, 0, None)
+            put("album", song_line + 2, 0, None)
         
         # Position/progress
         position_line = 8
-        if self.current_song and self.current_position is not None:
-            pos_str = self._format_time(self.current_position)
-            length_str = self._format_time(self.current_song.duration)
-            position_text = f"Position: {pos_str} / {length_str}"
-            self.stdscr.addstr(position_line, 0, position_text)
-            
-            # Progress bar
-            if self.current_song.duration:
-                progress_width = width - 4
-                pos_percent = min(1.0, max(0.0, self.current_position / self.current_song.duration))
-                filled = int(progress_width * pos_percent)
-                
-                self.stdscr.addstr(position_line + 1, 0, "[")
-                self.stdscr.addstr(position_line + 1, 1, "=" * filled)
-                self.stdscr.addstr(position_line + 1, 1 + filled, " " * (progress_width - filled))
-                self.stdscr.addstr(position_line + 1, 1 + progress_width, "]")
+        progress_width = width - 4
+        if song and position is not None:
+            pos_str = self._format_time(position)
+            length_str = self._format_time(song.duration)
+            put("position", position_line, 0, f"Position: {pos_str} / {length_str}")
+        else:
+            put("position", position_line, 0, None)
+        self._put_progress(position_line + 1, progress_width,
+                           self._filled_cells(position, progress_width))
         
         # Controls help
         help_line = height - 6
-        self.stdscr.addstr(help_line, 0, "Controls:", curses.A_BOLD)
-        next_text = "n: Next" if self.can_next else "n: Next (disabled)"
-        prev_text = "p: Previous" if self.can_previous else "p: Previous (disabled)"
-        self.stdscr.addstr(help_line + 1, 0, f"Space: Play/Pause  s: Stop  {next_text}  {prev_text}")
-        self.stdscr.addstr(help_line + 2, 0, "+/-: Volume  m: Mute  r: Shuffle  l: Loop")
-        self.stdscr.addstr(help_line + 3, 0, "Left/Right: Seek  c: Switch Controller  q: Quit")
+        put("help", help_line, 0, "Controls:", bold)
+        put("help1", help_line + 1, 0, self._help_playback)
+        put("help2", help_line + 2, 0, self.HELP_VOLUME)
+        put("help3", help_line + 3, 0, self.HELP_OTHER)
         
         # Message (if any)
-        if self.message and time.time() < self.message_timeout:
-            msg_line = height - 1
-            self.stdscr.addstr(msg_line, 0, self.message, curses.A_BOLD)
+        if self.message and time.monotonic() < self.message_timeout:
+            put("message", height - 1, 0, self.message, bold)
+        else:
+            put("message", height - 1, 0, None)
         
-        # Refresh the screen
-        self.stdscr.refresh()
+        # Mark the screen for the next curses.doupdate()
+        self.stdscr.noutrefresh()
 
 def run_textui(audio_controller: AudioController):
     """
@@ -584,7 +817,6 @@ def run_textui(audio_controller: AudioController):
 
 if __name__ == "__main__":
     # Example of how to use the TextUI
-    import sys
     from ac3.audio_controller import AudioController
     
     # Create an audio controller
@@ -1,7 +1,6 @@
 import argparse
 import os
 import sys
-import platform
 import logging
 
 # Add the parent directory to the Python path
@@ -13,8 +12,17 @@ sys.path.append(os.path.dirname(__file__))
 # Set the home directory to the ac3 module directory
 os.chdir(os.path.dirname(__file__))
 
-# Set logging level to DEBUG to capture detailed logs
-logging.basicConfig(level=logging.DEBUG)
+# Modules loaded by common debuggers
+_DEBUGGER_MODULES = frozenset({
+    'pydevd', 'pdb', '_pydev_bundle', 'debugpy', 'ipdb',
+    'PyQt5.QtCore', 'pyqtgraph'  # For IDE debuggers
+})
+
+# Environment variables commonly set by debuggers
+_DEBUGGER_ENV_VARS = (
+    'PYTHONBREAKPOINT', 'PYDEVD_LOAD_VALUES_ASYNC', 'DEBUGPY_PROCESS_GROUP',
+    'VSCODE_PID', 'JPY_PARENT_PID', 'PYCHARM_HOSTED'
+)
 
 def is_running_in_debugger():
     """
@@ -28,24 +36,11 @@ def is_running_in_debugger():
         return True
     
     # Check for common debugger modules in loaded modules
-    debugger_modules = [
-        'pydevd', 'pdb', '_pydev_bundle', 'debugpy', 'ipdb',
-        'PyQt5.QtCore', 'pyqtgraph'  # For IDE debuggers
-    ]
-    for module in debugger_modules:
-        if module in sys.modules:
-            return True
+    if sys.modules.keys() & _DEBUGGER_MODULES:
+        return True
     
     # Check for environment variables commonly set by debuggers
-    debugger_env_vars = [
-        'PYTHONBREAKPOINT', 'PYDEVD_LOAD_VALUES_ASYNC', 'DEBUGPY_PROCESS_GROUP',
-        'VSCODE_PID', 'JPY_PARENT_PID', 'PYCHARM_HOSTED'
-    ]
-    for var in debugger_env_vars:
-        if os.environ.get(var):
-            return True
-    
-    return False
+    return any(os.environ.get(var) for var in _DEBUGGER_ENV_VARS)
 
 def main():
     parser = argparse.ArgumentParser(description="AudioControl3 Main Program")
@@ -59,6 +54,10 @@ def main():
     
     # If running in a debugger, use default debug settings unless overridden by command line
     running_in_debug = is_running_in_debugger()
+    
+    # Detailed logs are only wanted while debugging
+    logging.basicConfig(level=logging.DEBUG if running_in_debug else logging.INFO)
+    
     if running_in_debug and len(sys.argv) == 1:  # No command-line args provided
         print("Debugger detected. Using default debug settings:")
         debug_args = ["--text-ui", "--auto-progress", "0.5"]
@@ -94,8 +93,9 @@ def main():
         
         # Enable specific plugins if requested
         if args.enable_plugin:
+            enabled = audio_controller.set_enabled_plugins(args.enable_plugin)
             for plugin_name in args.enable_plugin:
-                if audio_controller.enable_plugin(plugin_name):
+                if plugin_name in enabled:
                     print(f"Enabled plugin: {plugin_name}")
                 else:
                     print(f"Failed to enable plugin: {plugin_name}")
@@ -117,6 +117,7 @@ def main():
         if not curses_available:
             print("The text UI is not supported due to missing curses module.")
             print("You can install the curses module with:")
+            import platform
             if platform.system() == "Windows":
                 print("pip install windows-curses")
             else:
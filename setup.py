@@ -10,10 +10,21 @@ setup(
     install_requires=[
         "flask>=2.0.0",
     ],
+    extras_require={
+        # Faster JSON serialization of metadata
+        "orjson": ["orjson>=3.0"],
+        # Production WSGI server for the REST API
+        "server": ["waitress>=2.0"],
+    },
     entry_points={
         'console_scripts': [
             'audiocontrol3-server=ac3.server:start_server',
         ],
+        # Player controllers, listed and loaded without scanning ac3.player
+        'ac3.player_controllers': [
+            'mpd=ac3.player.mpd:MPDPlayerController',
+            'null=ac3.player.null:NullPlayerController',
+        ],
     },
     classifiers=[
         "Programming Language :: Python :: 3",